@@ -11,16 +11,100 @@ import time
 import logging
 from typing import Dict, List, Optional, Any, Set, Callable
 from datetime import datetime, timedelta
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from fastapi import WebSocket, WebSocketDisconnect
 from fastapi.websockets import WebSocketState
 import uuid
 import weakref
-from collections import defaultdict
-import threading
+from collections import defaultdict, deque
 
 logger = logging.getLogger(__name__)
 
+class ConnectionSendQueue:
+    """Bounded per-connection send buffer drained by a single writer task.
+
+    Regular messages are queued in order up to ``max_size``. Messages for
+    coalesced channels only keep the latest payload per channel, so a lagging
+    client receives the freshest value instead of a backlog.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.messages: deque = deque()
+        self.coalesced: Dict[str, str] = {}
+        self.ready = asyncio.Event()
+        self.dropped_messages = 0
+        self.coalesced_messages = 0
+
+    def put(self, payload: str, coalesce_key: Optional[str] = None) -> bool:
+        """Queue a serialised payload; returns False if the buffer is full."""
+        if coalesce_key is not None:
+            if coalesce_key in self.coalesced:
+                self.coalesced_messages += 1
+            self.coalesced[coalesce_key] = payload
+            self.ready.set()
+            return True
+
+        if len(self.messages) >= self.max_size:
+            self.dropped_messages += 1
+            return False
+
+        self.messages.append(payload)
+        self.ready.set()
+        return True
+
+    async def get(self) -> str:
+        """Wait for the next payload to send."""
+        while not self.messages and not self.coalesced:
+            self.ready.clear()
+            await self.ready.wait()
+
+        if self.messages:
+            return self.messages.popleft()
+
+        channel = next(iter(self.coalesced))
+        return self.coalesced.pop(channel)
+
+    def __len__(self) -> int:
+        return len(self.messages) + len(self.coalesced)
+
+class HeartbeatTimerWheel:
+    """Hashed timer wheel tracking when each connection is next due a heartbeat.
+
+    The wheel has one slot per tick across a full heartbeat interval. A
+    connection lives in exactly one slot and is revisited once per rotation,
+    so a single scheduler task serves every connection with O(1) add/remove.
+    """
+
+    def __init__(self, interval_seconds: float, tick_seconds: float = 1.0):
+        self.tick_seconds = tick_seconds
+        self.slot_count = max(1, int(round(interval_seconds / tick_seconds)))
+        self.slots: List[Set[str]] = [set() for _ in range(self.slot_count)]
+        self.slot_index: Dict[str, int] = {}
+        self.cursor = 0
+
+    def add(self, connection_id: str):
+        """Schedule a connection one full interval from the current tick."""
+        self.remove(connection_id)
+        slot = (self.cursor - 1) % self.slot_count
+        self.slots[slot].add(connection_id)
+        self.slot_index[connection_id] = slot
+
+    def remove(self, connection_id: str):
+        """Unschedule a connection."""
+        slot = self.slot_index.pop(connection_id, None)
+        if slot is not None:
+            self.slots[slot].discard(connection_id)
+
+    def advance(self) -> List[str]:
+        """Move to the next tick and return the connections due in it."""
+        due = list(self.slots[self.cursor])
+        self.cursor = (self.cursor + 1) % self.slot_count
+        return due
+
+    def __len__(self) -> int:
+        return len(self.slot_index)
+
 @dataclass
 class WebSocketConnection:
     """WebSocket connection metadata."""
@@ -30,6 +114,7 @@ class WebSocketConnection:
     subscriptions: Set[str]
     connected_at: datetime
     last_activity: datetime
+    send_queue: Optional[ConnectionSendQueue] = field(default=None, repr=False)
 
 class WebSocketMessage:
     """WebSocket message types for DKG v3 communication."""
@@ -77,14 +162,26 @@ class IntelligenceStreamChunk:
 class DKGWebSocketManager:
     """Manages WebSocket connections for real-time DKG v3 communication."""
 
-    def __init__(self):
+    def __init__(self, send_queue_size: int = 256, broadcast_shard_size: int = 500,
+                 coalesced_channels: Optional[Set[str]] = None):
         self.connections: Dict[str, WebSocketConnection] = {}
         self.subscriptions: Dict[str, Set[str]] = defaultdict(set)  # channel -> connection_ids
-        self.connection_lock = threading.RLock()
         self.background_tasks: Dict[str, asyncio.Task] = {}
+        self.connection_tasks: Dict[str, Set[asyncio.Task]] = {}  # connection_id -> tasks owned by it
         self.knowledge_update_queue = asyncio.Queue()
         self.performance_metrics_queue = asyncio.Queue()
         self.heartbeat_interval = 30  # seconds
+        self.heartbeat_wheel = HeartbeatTimerWheel(self.heartbeat_interval)
+
+        # Fan-out settings: per-connection queue bound, subscribers enqueued per
+        # event-loop slice, and channels where slow consumers only get the latest message
+        self.send_queue_size = send_queue_size
+        self.broadcast_shard_size = broadcast_shard_size
+        self.coalesced_channels = (
+            coalesced_channels if coalesced_channels is not None
+            else {WebSocketMessage.CHANNEL_PERFORMANCE}
+        )
+        self.slow_consumer_disconnects = 0
 
     async def connect(self, websocket: WebSocket, client_info: Dict[str, Any] = None) -> str:
         """Accept WebSocket connection and register client."""
@@ -99,16 +196,20 @@ class DKGWebSocketManager:
             client_info=client_info,
             subscriptions=set(),
             connected_at=datetime.utcnow(),
-            last_activity=datetime.utcnow()
+            last_activity=datetime.utcnow(),
+            send_queue=ConnectionSendQueue(self.send_queue_size)
         )
 
-        with self.connection_lock:
-            self.connections[connection_id] = connection
+        self.connections[connection_id] = connection
 
-        # Start heartbeat task
-        self.background_tasks[f"heartbeat_{connection_id}"] = asyncio.create_task(
-            self._heartbeat_task(connection_id)
-        )
+        # Start writer task draining the connection's send queue
+        self._track_connection_task(connection_id, asyncio.create_task(
+            self._connection_writer(connection_id)
+        ))
+
+        # Schedule heartbeats on the shared timer wheel
+        self.heartbeat_wheel.add(connection_id)
+        self._ensure_heartbeat_scheduler()
 
         logger.info(f"✅ WebSocket client connected: {connection_id}")
 
@@ -130,27 +231,30 @@ class DKGWebSocketManager:
 
     async def disconnect(self, connection_id: str):
         """Disconnect and cleanup WebSocket connection."""
-        with self.connection_lock:
-            if connection_id not in self.connections:
-                return
-
-            connection = self.connections[connection_id]
-
-            # Remove from all subscriptions
-            for channel in connection.subscriptions.copy():
-                await self._unsubscribe_from_channel(connection_id, channel)
+        connection = self.connections.pop(connection_id, None)
+        if connection is None:
+            return
 
-            # Cancel background tasks
-            for task_key in list(self.background_tasks.keys()):
-                if connection_id in task_key:
-                    task = self.background_tasks.pop(task_key)
-                    task.cancel()
+        # Remove from all subscriptions
+        for channel in connection.subscriptions:
+            self.subscriptions[channel].discard(connection_id)
+        connection.subscriptions.clear()
 
-            # Remove connection
-            del self.connections[connection_id]
+        # Unschedule heartbeats and cancel tasks owned by this connection
+        self.heartbeat_wheel.remove(connection_id)
+        current_task = asyncio.current_task()
+        for task in self.connection_tasks.pop(connection_id, ()):
+            if task is not current_task:
+                task.cancel()
 
         logger.info(f"🔌 WebSocket client disconnected: {connection_id}")
 
+    def _track_connection_task(self, connection_id: str, task: asyncio.Task):
+        """Register a task owned by a connection so disconnect can cancel it directly."""
+        tasks = self.connection_tasks.setdefault(connection_id, set())
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
     async def handle_message(self, connection_id: str, message: Dict[str, Any]):
         """Handle incoming WebSocket message."""
         if connection_id not in self.connections:
@@ -224,7 +328,7 @@ class DKGWebSocketManager:
         task = asyncio.create_task(
             self._execute_streaming_query(connection_id, request_id, query_data)
         )
-        self.background_tasks[f"streaming_query_{request_id}"] = task
+        self._track_connection_task(connection_id, task)
 
         await self._send_message(connection_id, {
             "type": "query_started",
@@ -297,34 +401,58 @@ class DKGWebSocketManager:
 
     async def _subscribe_to_channel(self, connection_id: str, channel: str):
         """Subscribe connection to a channel."""
-        with self.connection_lock:
-            if connection_id in self.connections:
-                self.connections[connection_id].subscriptions.add(channel)
-                self.subscriptions[channel].add(connection_id)
+        if connection_id in self.connections:
+            self.connections[connection_id].subscriptions.add(channel)
+            self.subscriptions[channel].add(connection_id)
 
     async def _unsubscribe_from_channel(self, connection_id: str, channel: str):
         """Unsubscribe connection from a channel."""
-        with self.connection_lock:
-            if connection_id in self.connections:
-                self.connections[connection_id].subscriptions.discard(channel)
-                self.subscriptions[channel].discard(connection_id)
+        if connection_id in self.connections:
+            self.connections[connection_id].subscriptions.discard(channel)
+            self.subscriptions[channel].discard(connection_id)
 
     async def _send_message(self, connection_id: str, message: Dict[str, Any]):
         """Send message to specific WebSocket connection."""
         if connection_id not in self.connections:
             return
 
-        connection = self.connections[connection_id]
-        if connection.websocket.client_state != WebSocketState.CONNECTED:
-            await self.disconnect(connection_id)
+        await self._enqueue_payload(connection_id, json.dumps(message, default=str))
+
+    async def _enqueue_payload(self, connection_id: str, payload: str, coalesce_key: Optional[str] = None):
+        """Queue a serialised payload for a connection's writer task."""
+        connection = self.connections.get(connection_id)
+        if connection is None:
             return
 
-        try:
-            await connection.websocket.send_text(json.dumps(message, default=str))
-        except Exception as e:
-            logger.error(f"Error sending WebSocket message to {connection_id}: {e}")
+        if not connection.send_queue.put(payload, coalesce_key):
+            # Slow consumer: its bounded queue is full, so drop the client rather than buffer without limit
+            logger.warning(f"Send queue full for {connection_id}, disconnecting slow consumer")
+            self.slow_consumer_disconnects += 1
             await self.disconnect(connection_id)
 
+    async def _connection_writer(self, connection_id: str):
+        """Background writer sending queued payloads to one WebSocket connection."""
+        connection = self.connections.get(connection_id)
+        if connection is None:
+            return
+
+        while connection_id in self.connections:
+            try:
+                payload = await connection.send_queue.get()
+
+                if connection.websocket.client_state != WebSocketState.CONNECTED:
+                    await self.disconnect(connection_id)
+                    break
+
+                await connection.websocket.send_text(payload)
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error sending WebSocket message to {connection_id}: {e}")
+                await self.disconnect(connection_id)
+                break
+
     async def _send_streaming_chunk(self, connection_id: str, chunk: IntelligenceStreamChunk):
         """Send streaming query chunk."""
         await self._send_message(connection_id, {
@@ -341,11 +469,22 @@ class DKGWebSocketManager:
         })
 
     async def broadcast_to_channel(self, channel: str, message: Dict[str, Any]):
-        """Broadcast message to all subscribers of a channel."""
-        connection_ids = self.subscriptions.get(channel, set()).copy()
+        """Broadcast message to all subscribers of a channel.
 
-        for connection_id in connection_ids:
-            await self._send_message(connection_id, message)
+        The message is serialised once and handed to each subscriber's send
+        queue, yielding to the event loop between shards of subscribers.
+        """
+        connection_ids = list(self.subscriptions.get(channel, ()))
+        if not connection_ids:
+            return
+
+        payload = json.dumps(message, default=str)
+        coalesce_key = channel if channel in self.coalesced_channels else None
+
+        for shard_start in range(0, len(connection_ids), self.broadcast_shard_size):
+            for connection_id in connection_ids[shard_start:shard_start + self.broadcast_shard_size]:
+                await self._enqueue_payload(connection_id, payload, coalesce_key)
+            await asyncio.sleep(0)
 
     async def broadcast_knowledge_update(self, update: KnowledgeUpdate):
         """Broadcast knowledge graph update to subscribers."""
@@ -377,56 +516,73 @@ class DKGWebSocketManager:
 
         await self.broadcast_to_channel(WebSocketMessage.CHANNEL_SYSTEM_STATUS, message)
 
-    async def _heartbeat_task(self, connection_id: str):
-        """Background heartbeat task for connection health."""
-        while connection_id in self.connections:
-            try:
-                await asyncio.sleep(self.heartbeat_interval)
+    def _ensure_heartbeat_scheduler(self):
+        """Start the shared heartbeat scheduler if it is not running."""
+        task = self.background_tasks.get("heartbeat_scheduler")
+        if task is None or task.done():
+            self.background_tasks["heartbeat_scheduler"] = asyncio.create_task(self._heartbeat_scheduler())
 
-                if connection_id not in self.connections:
-                    break
+    async def _heartbeat_scheduler(self):
+        """Single background task sending heartbeats and dropping stale connections."""
+        stale_after = timedelta(seconds=self.heartbeat_interval * 3)
 
-                connection = self.connections[connection_id]
+        while self.connections:
+            try:
+                await asyncio.sleep(self.heartbeat_wheel.tick_seconds)
 
-                # Check if connection is stale
-                time_since_activity = datetime.utcnow() - connection.last_activity
-                if time_since_activity > timedelta(seconds=self.heartbeat_interval * 3):
-                    logger.warning(f"Connection {connection_id} appears stale, disconnecting")
-                    await self.disconnect(connection_id)
-                    break
+                due_connections = self.heartbeat_wheel.advance()
+                if not due_connections:
+                    continue
 
-                # Send heartbeat
-                await self._send_message(connection_id, {
+                now = datetime.utcnow()
+                payload = json.dumps({
                     "type": WebSocketMessage.HEARTBEAT,
-                    "timestamp": datetime.utcnow().isoformat()
+                    "timestamp": now.isoformat()
                 })
 
+                for index, connection_id in enumerate(due_connections, 1):
+                    connection = self.connections.get(connection_id)
+                    if connection is None:
+                        self.heartbeat_wheel.remove(connection_id)
+                        continue
+
+                    # Check if connection is stale
+                    if now - connection.last_activity > stale_after:
+                        logger.warning(f"Connection {connection_id} appears stale, disconnecting")
+                        await self.disconnect(connection_id)
+                    else:
+                        await self._enqueue_payload(connection_id, payload)
+
+                    if index % self.broadcast_shard_size == 0:
+                        await asyncio.sleep(0)
+
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.error(f"Heartbeat task error for {connection_id}: {e}")
-                break
+                logger.error(f"Heartbeat scheduler error: {e}")
 
     def get_connection_stats(self) -> Dict[str, Any]:
         """Get WebSocket connection statistics."""
-        with self.connection_lock:
-            return {
-                "total_connections": len(self.connections),
-                "active_subscriptions": {
-                    channel: len(connections)
-                    for channel, connections in self.subscriptions.items()
-                },
-                "connection_details": [
-                    {
-                        "connection_id": conn.connection_id,
-                        "connected_at": conn.connected_at.isoformat(),
-                        "last_activity": conn.last_activity.isoformat(),
-                        "subscriptions": list(conn.subscriptions),
-                        "client_info": conn.client_info
-                    }
-                    for conn in self.connections.values()
-                ]
-            }
+        return {
+            "total_connections": len(self.connections),
+            "slow_consumer_disconnects": self.slow_consumer_disconnects,
+            "active_subscriptions": {
+                channel: len(connections)
+                for channel, connections in self.subscriptions.items()
+            },
+            "connection_details": [
+                {
+                    "connection_id": conn.connection_id,
+                    "connected_at": conn.connected_at.isoformat(),
+                    "last_activity": conn.last_activity.isoformat(),
+                    "subscriptions": list(conn.subscriptions),
+                    "client_info": conn.client_info,
+                    "send_queue_depth": len(conn.send_queue),
+                    "coalesced_messages": conn.send_queue.coalesced_messages
+                }
+                for conn in self.connections.values()
+            ]
+        }
 
 # Global WebSocket manager instance
 dkg_websocket_manager = DKGWebSocketManager()
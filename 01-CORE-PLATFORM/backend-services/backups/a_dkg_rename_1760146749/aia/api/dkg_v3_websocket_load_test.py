@@ -0,0 +1,117 @@
+"""
+DKG v3 WebSocket Broadcast Load Test
+====================================
+Simulates thousands of subscribers on one process against DKGWebSocketManager
+and reports fan-out latency, delivery counts and slow-consumer handling.
+
+Usage:
+    python -m aia.api.dkg_v3_websocket_load_test --subscribers 5000 --messages 50
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from typing import Any, Dict, List
+
+from fastapi.websockets import WebSocketState
+
+from aia.api.dkg_v3_websocket_handler import DKGWebSocketManager, WebSocketMessage
+
+
+class SimulatedWebSocket:
+    """In-memory WebSocket client with a configurable per-send delay."""
+
+    def __init__(self, send_delay: float = 0.0):
+        self.client_state = WebSocketState.CONNECTED
+        self.send_delay = send_delay
+        self.messages_received = 0
+        self.last_received_at = 0.0
+
+    async def accept(self):
+        return None
+
+    async def send_text(self, data: str):
+        if self.send_delay:
+            await asyncio.sleep(self.send_delay)
+        self.messages_received += 1
+        self.last_received_at = time.perf_counter()
+
+
+async def run_broadcast_load_test(subscribers: int = 5000, messages: int = 50,
+                                  slow_fraction: float = 0.02, slow_delay: float = 0.05,
+                                  send_queue_size: int = 256) -> Dict[str, Any]:
+    """Connect simulated subscribers, broadcast to them and collect fan-out statistics."""
+    manager = DKGWebSocketManager(send_queue_size=send_queue_size)
+    clients: List[SimulatedWebSocket] = []
+
+    for _ in range(subscribers):
+        send_delay = slow_delay if random.random() < slow_fraction else 0.0
+        websocket = SimulatedWebSocket(send_delay)
+        connection_id = await manager.connect(websocket, {"client_type": "load_test"})
+        await manager._subscribe_to_channel(connection_id, WebSocketMessage.CHANNEL_KNOWLEDGE_UPDATES)
+        await manager._subscribe_to_channel(connection_id, WebSocketMessage.CHANNEL_PERFORMANCE)
+        clients.append(websocket)
+
+    broadcast_times_ms = []
+    start_time = time.perf_counter()
+
+    for sequence in range(messages):
+        broadcast_start = time.perf_counter()
+        await manager.broadcast_to_channel(WebSocketMessage.CHANNEL_KNOWLEDGE_UPDATES, {
+            "type": WebSocketMessage.KNOWLEDGE_UPDATE,
+            "sequence": sequence,
+            "update": {"affected_atoms": [f"atom_{i}" for i in range(10)]}
+        })
+        await manager.broadcast_performance_metrics({"sequence": sequence, "avg_latency_ms": 12.5})
+        broadcast_times_ms.append((time.perf_counter() - broadcast_start) * 1000)
+
+    # Let fast writers drain; slow consumers are expected to lag or be coalesced
+    await asyncio.sleep(0.5)
+    elapsed = time.perf_counter() - start_time
+
+    fast_clients = [client for client in clients if not client.send_delay]
+    fast_delivery_times = [client.last_received_at - start_time for client in fast_clients]
+    stats = manager.get_connection_stats()
+
+    for connection_id in list(manager.connections):
+        await manager.disconnect(connection_id)
+
+    return {
+        "subscribers": subscribers,
+        "messages_per_channel": messages,
+        "slow_subscribers": subscribers - len(fast_clients),
+        "broadcast_p50_ms": statistics.median(broadcast_times_ms),
+        "broadcast_max_ms": max(broadcast_times_ms),
+        "fast_client_drain_p99_s": sorted(fast_delivery_times)[int(len(fast_delivery_times) * 0.99) - 1]
+        if fast_delivery_times else 0.0,
+        "total_messages_delivered": sum(client.messages_received for client in clients),
+        "slow_consumer_disconnects": stats["slow_consumer_disconnects"],
+        "coalesced_messages": sum(detail["coalesced_messages"] for detail in stats["connection_details"]),
+        "elapsed_seconds": elapsed
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DKG v3 WebSocket broadcast load test")
+    parser.add_argument("--subscribers", type=int, default=5000)
+    parser.add_argument("--messages", type=int, default=50)
+    parser.add_argument("--slow-fraction", type=float, default=0.02)
+    parser.add_argument("--slow-delay", type=float, default=0.05)
+    parser.add_argument("--send-queue-size", type=int, default=256)
+    args = parser.parse_args()
+
+    results = asyncio.run(run_broadcast_load_test(
+        subscribers=args.subscribers,
+        messages=args.messages,
+        slow_fraction=args.slow_fraction,
+        slow_delay=args.slow_delay,
+        send_queue_size=args.send_queue_size
+    ))
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -22,6 +22,9 @@ Enterprise-grade reliability with institutional investor presentation quality.
 
 import asyncio
 import concurrent.futures
+import hashlib
+import heapq
+import itertools
 import json
 import logging
 import multiprocessing
@@ -29,13 +32,16 @@ import os
 import sys
 import time
 import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Callable
 from dataclasses import dataclass, field
 import signal
 
 # Import our analytics systems
-from institutional_analytics_system import InstitutionalAnalyticsSystem
+from institutional_analytics_system import InstitutionalAnalyticsSystem, validate_analysis_parameters
 from real_time_business_intelligence import RealTimeBusinessIntelligence
 from executive_presentation_system import PresentationGenerator, PresentationViewer
 
@@ -77,6 +83,50 @@ class AnalyticsJob:
     completed_at: Optional[datetime] = None
     results: Optional[Dict[str, Any]] = None
     error_message: Optional[str] = None
+    priority: int = 5  # lower runs first
+    cache_key: Optional[str] = None
+    cache_hit: bool = False
+
+class JobQueueFullError(Exception):
+    """Raised when the pending job queue is at capacity"""
+    pass
+
+JOB_PRIORITY_RANGE = (0, 10)
+
+def parse_job_priority(value: Any) -> int:
+    """Validate a requested job priority (lower runs first), raising ValueError"""
+    low, high = JOB_PRIORITY_RANGE
+    if isinstance(value, bool) or not isinstance(value, (int, str)) or not str(value).strip().lstrip('-').isdigit():
+        raise ValueError(f"priority must be an integer between {low} and {high}")
+    priority = int(value)
+    if not low <= priority <= high:
+        raise ValueError(f"priority must be an integer between {low} and {high}")
+    return priority
+
+def execute_analytics_job(job_type: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """Run one analytics job; module-level so it can execute in a worker process"""
+    if job_type == 'full_analysis':
+        system = InstitutionalAnalyticsSystem()
+        return system.run_comprehensive_analysis(parameters)
+
+    if job_type == 'presentation_generation':
+        analysis_results = parameters.get('analysis_results', {})
+        generator = PresentationGenerator()
+        slides = generator.create_executive_presentation(analysis_results)
+
+        return {
+            'slides_generated': len(slides),
+            'slides': [
+                {
+                    'title': slide.title,
+                    'content_type': slide.content_type,
+                    'slide_number': slide.slide_number
+                }
+                for slide in slides
+            ]
+        }
+
+    raise ValueError(f"Unknown job type: {job_type}")
 
 class SystemMonitor:
     """Advanced system monitoring and health checks"""
@@ -179,75 +229,185 @@ class SystemMonitor:
         }
 
 class JobManager:
-    """Advanced job management for analytics tasks"""
-
-    def __init__(self, max_concurrent_jobs: int = 4):
+    """
+    Advanced job management for analytics tasks.
+
+    Jobs run on a process pool by default so CPU-bound analyses don't contend
+    for the GIL. Pending jobs wait in a priority heap bounded by
+    max_queue_size. Results are cached by a content hash of job type,
+    parameters and data version: a repeated request completes immediately
+    from the cache, and one identical to a job already queued or running is
+    attached to that job instead of being computed again.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_jobs: int = 4,
+        backend: str = 'process',
+        max_queue_size: int = 100,
+        max_cached_results: int = 32
+    ):
         self.logger = logger.getChild('JobManager')
         self.jobs = {}
-        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrent_jobs)
-        self.job_queue = []
         self.max_concurrent_jobs = max_concurrent_jobs
+        self.backend = backend
+        self.max_queue_size = max_queue_size
+        self.max_cached_results = max_cached_results
+        self.executor = self._create_executor()
+
+        self.lock = threading.RLock()
+        self.pending_heap = []
+        self.sequence = itertools.count()
+        self.running: Dict[str, concurrent.futures.Future] = {}
+        self.inflight: Dict[str, List[AnalyticsJob]] = {}
+        self.result_cache: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self.data_version = '1'
+        self.stats = {'cache_hits': 0, 'cache_misses': 0, 'coalesced': 0, 'rejected': 0}
+
+    def _create_executor(self) -> concurrent.futures.Executor:
+        if self.backend == 'process':
+            # spawn: the orchestrator runs Flask and monitoring threads, which fork would copy mid-flight
+            return concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.max_concurrent_jobs,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return concurrent.futures.ThreadPoolExecutor(max_workers=self.max_concurrent_jobs)
+
+    def cache_key(self, job: AnalyticsJob) -> str:
+        """Content address of a job's result"""
+        payload = json.dumps({
+            'job_type': job.job_type,
+            'parameters': job.parameters,
+            'data_version': self.data_version
+        }, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def set_data_version(self, data_version: str):
+        """Change the data version; results computed for earlier versions are no longer served"""
+        with self.lock:
+            self.data_version = str(data_version)
+            self.result_cache.clear()
+        self.logger.info(f"Data version set to {self.data_version}, result cache cleared")
 
     def submit_job(self, job: AnalyticsJob) -> str:
         """Submit an analytics job for execution"""
-        self.jobs[job.job_id] = job
-        job.status = 'pending'
-
-        future = self.executor.submit(self._execute_job, job)
-        self.job_queue.append({'job': job, 'future': future})
-
-        self.logger.info(f"Submitted job: {job.job_id} ({job.job_type})")
+        job.cache_key = self.cache_key(job)
+
+        with self.lock:
+            cached = self.result_cache.get(job.cache_key)
+            if cached is not None:
+                self.result_cache.move_to_end(job.cache_key)
+                self.stats['cache_hits'] += 1
+                now = datetime.now()
+                job.status = 'completed'
+                job.started_at = job.completed_at = now
+                job.results = cached
+                job.cache_hit = True
+                self.jobs[job.job_id] = job
+                self.logger.info(f"Served job from cache: {job.job_id} ({job.job_type})")
+                return job.job_id
+
+            if job.cache_key in self.inflight:
+                leader = self.inflight[job.cache_key][0]
+                self.inflight[job.cache_key].append(job)
+                job.status = leader.status
+                job.started_at = leader.started_at
+                self.jobs[job.job_id] = job
+                self.stats['coalesced'] += 1
+                self.logger.info(f"Attached job {job.job_id} to identical job {leader.job_id}")
+                return job.job_id
+
+            if len(self.pending_heap) >= self.max_queue_size:
+                self.stats['rejected'] += 1
+                raise JobQueueFullError(f"Job queue full ({self.max_queue_size} pending)")
+
+            self.stats['cache_misses'] += 1
+            job.status = 'pending'
+            self.jobs[job.job_id] = job
+            self.inflight[job.cache_key] = [job]
+            heapq.heappush(self.pending_heap, (job.priority, next(self.sequence), job))
+            self._dispatch()
+
+        self.logger.info(f"Submitted job: {job.job_id} ({job.job_type}, priority {job.priority})")
         return job.job_id
 
-    def _execute_job(self, job: AnalyticsJob):
-        """Execute an analytics job"""
-        try:
-            job.status = 'running'
-            job.started_at = datetime.now()
-
-            self.logger.info(f"Executing job: {job.job_id}")
-
-            if job.job_type == 'full_analysis':
-                results = self._run_full_analysis(job.parameters)
-            elif job.job_type == 'presentation_generation':
-                results = self._run_presentation_generation(job.parameters)
-            else:
-                raise ValueError(f"Unknown job type: {job.job_type}")
+    def _dispatch(self):
+        """Start queued jobs while worker slots are free (lock held)"""
+        while self.pending_heap and len(self.running) < self.max_concurrent_jobs:
+            _, _, job = heapq.heappop(self.pending_heap)
 
-            job.results = results
-            job.status = 'completed'
-            job.completed_at = datetime.now()
+            started_at = datetime.now()
+            for waiting_job in self.inflight[job.cache_key]:
+                waiting_job.status = 'running'
+                waiting_job.started_at = started_at
 
-            self.logger.info(f"Completed job: {job.job_id}")
-
-        except Exception as e:
-            job.status = 'failed'
-            job.error_message = str(e)
-            job.completed_at = datetime.now()
-            self.logger.error(f"Job failed: {job.job_id} - {e}")
+            self.logger.info(f"Executing job: {job.job_id}")
+            try:
+                future = self.executor.submit(execute_analytics_job, job.job_type, job.parameters)
+            except (BrokenProcessPool, RuntimeError) as e:
+                self._complete_jobs(job.cache_key, error=str(e))
+                continue
+
+            self.running[job.job_id] = future
+            future.add_done_callback(
+                lambda done, job=job, executor=self.executor: self._on_job_done(job, done, executor)
+            )
 
-    def _run_full_analysis(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute full institutional analysis"""
-        system = InstitutionalAnalyticsSystem()
-        return system.run_comprehensive_analysis()
+    def _on_job_done(self, job: AnalyticsJob, future: concurrent.futures.Future,
+                     executor: concurrent.futures.Executor):
+        """Record the outcome for a job and everything attached to it, then start the next job"""
+        with self.lock:
+            self.running.pop(job.job_id, None)
 
-    def _run_presentation_generation(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute presentation generation"""
-        analysis_results = parameters.get('analysis_results', {})
-        generator = PresentationGenerator()
-        slides = generator.create_executive_presentation(analysis_results)
+            try:
+                results = future.result()
+            except Exception as e:
+                # Every job on a broken pool fails; only the first replaces it
+                if isinstance(e, BrokenProcessPool) and executor is self.executor:
+                    self.logger.error("Worker process died, recreating the process pool")
+                    self.executor = self._create_executor()
+                self._complete_jobs(job.cache_key, error=str(e) or type(e).__name__)
+            else:
+                self.result_cache[job.cache_key] = results
+                while len(self.result_cache) > self.max_cached_results:
+                    self.result_cache.popitem(last=False)
+                self._complete_jobs(job.cache_key, results=results)
+
+            self._dispatch()
+
+    def _complete_jobs(self, cache_key: str, results: Optional[Dict[str, Any]] = None, error: Optional[str] = None):
+        completed_at = datetime.now()
+        for waiting_job in self.inflight.pop(cache_key, []):
+            waiting_job.completed_at = completed_at
+            if error is None:
+                waiting_job.results = results
+                waiting_job.status = 'completed'
+                self.logger.info(f"Completed job: {waiting_job.job_id}")
+            else:
+                waiting_job.status = 'failed'
+                waiting_job.error_message = error
+                self.logger.error(f"Job failed: {waiting_job.job_id} - {error}")
+
+    def get_queue_stats(self) -> Dict[str, Any]:
+        """Queue depth, running jobs and cache effectiveness"""
+        with self.lock:
+            return {
+                'backend': self.backend,
+                'pending': len(self.pending_heap),
+                'running': len(self.running),
+                'max_queue_size': self.max_queue_size,
+                'cached_results': len(self.result_cache),
+                'data_version': self.data_version,
+                **self.stats
+            }
 
-        return {
-            'slides_generated': len(slides),
-            'slides': [
-                {
-                    'title': slide.title,
-                    'content_type': slide.content_type,
-                    'slide_number': slide.slide_number
-                }
-                for slide in slides
-            ]
-        }
+    def shutdown(self, wait: bool = True):
+        """Fail queued jobs and stop the worker pool"""
+        with self.lock:
+            while self.pending_heap:
+                _, _, job = heapq.heappop(self.pending_heap)
+                self._complete_jobs(job.cache_key, error='Cancelled at shutdown')
+        self.executor.shutdown(wait=wait, cancel_futures=True)
 
     def get_job_status(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get status of a specific job"""
@@ -263,7 +423,9 @@ class JobManager:
             'started_at': job.started_at.isoformat() if job.started_at else None,
             'completed_at': job.completed_at.isoformat() if job.completed_at else None,
             'error_message': job.error_message,
-            'has_results': job.results is not None
+            'has_results': job.results is not None,
+            'priority': job.priority,
+            'cache_hit': job.cache_hit
         }
 
     def get_all_jobs(self) -> List[Dict[str, Any]]:
@@ -280,7 +442,7 @@ class JobManager:
                 jobs_to_remove.append(job_id)
 
         for job_id in jobs_to_remove:
-            del self.jobs[job_id]
+            self.jobs.pop(job_id, None)
 
         if jobs_to_remove:
             self.logger.info(f"Cleaned up {len(jobs_to_remove)} old jobs")
@@ -294,7 +456,12 @@ class AnalyticsOrchestrator:
 
         # Initialize components
         self.system_monitor = SystemMonitor()
-        self.job_manager = JobManager(max_concurrent_jobs=self.config.get('max_concurrent_jobs', 4))
+        self.job_manager = JobManager(
+            max_concurrent_jobs=self.config.get('max_concurrent_jobs', 4),
+            backend=self.config.get('job_backend', 'process'),
+            max_queue_size=self.config.get('max_queued_jobs', 100),
+            max_cached_results=self.config.get('max_cached_results', 32)
+        )
 
         # Analytics systems
         self.institutional_system = None
@@ -358,25 +525,35 @@ class AnalyticsOrchestrator:
         def run_full_analysis():
             """Trigger full institutional analysis"""
             try:
-                job_id = f"full_analysis_{int(time.time())}"
+                job_id = f"full_analysis_{int(time.time())}_{uuid.uuid4().hex[:8]}"
                 parameters = request.get_json() or {}
+                if not isinstance(parameters, dict):
+                    return jsonify({'error': 'Request body must be a JSON object'}), 400
+                priority = parse_job_priority(parameters.pop('priority', 5))
+                parameters = validate_analysis_parameters(parameters)
 
                 job = AnalyticsJob(
                     job_id=job_id,
                     job_type='full_analysis',
                     parameters=parameters,
                     status='pending',
-                    created_at=datetime.now()
+                    created_at=datetime.now(),
+                    priority=priority
                 )
 
                 self.job_manager.submit_job(job)
 
                 return jsonify({
                     'job_id': job_id,
-                    'status': 'submitted',
+                    'status': job.status if job.cache_hit else 'submitted',
+                    'cached': job.cache_hit,
                     'message': 'Full analysis job submitted successfully'
                 })
 
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+            except JobQueueFullError as e:
+                return jsonify({'error': str(e)}), 429
             except Exception as e:
                 self.logger.error(f"Failed to submit full analysis job: {e}")
                 return jsonify({'error': str(e)}), 500
@@ -386,24 +563,39 @@ class AnalyticsOrchestrator:
             """Generate executive presentation"""
             try:
                 data = request.get_json() or {}
-                job_id = f"presentation_{int(time.time())}"
+                if not isinstance(data, dict):
+                    return jsonify({'error': 'Request body must be a JSON object'}), 400
+                job_id = f"presentation_{int(time.time())}_{uuid.uuid4().hex[:8]}"
+                priority = parse_job_priority(data.pop('priority', 5))
+
+                unknown = sorted(set(data) - {'analysis_results'})
+                if unknown:
+                    return jsonify({'error': f"Unknown presentation parameters: {', '.join(unknown)}"}), 400
+                if not isinstance(data.get('analysis_results', {}), dict):
+                    return jsonify({'error': 'analysis_results must be a JSON object'}), 400
 
                 job = AnalyticsJob(
                     job_id=job_id,
                     job_type='presentation_generation',
                     parameters=data,
                     status='pending',
-                    created_at=datetime.now()
+                    created_at=datetime.now(),
+                    priority=priority
                 )
 
                 self.job_manager.submit_job(job)
 
                 return jsonify({
                     'job_id': job_id,
-                    'status': 'submitted',
+                    'status': job.status if job.cache_hit else 'submitted',
+                    'cached': job.cache_hit,
                     'message': 'Presentation generation job submitted successfully'
                 })
 
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+            except JobQueueFullError as e:
+                return jsonify({'error': str(e)}), 429
             except Exception as e:
                 self.logger.error(f"Failed to submit presentation job: {e}")
                 return jsonify({'error': str(e)}), 500
@@ -434,6 +626,20 @@ class AnalyticsOrchestrator:
             jobs = self.job_manager.get_all_jobs()
             return jsonify(jobs)
 
+        @self.app.route('/api/v1/jobs/stats', methods=['GET'])
+        def job_queue_stats():
+            """Job queue depth and result cache statistics"""
+            return jsonify(self.job_manager.get_queue_stats())
+
+        @self.app.route('/api/v1/data/version', methods=['POST'])
+        def set_data_version():
+            """Set the analytics data version; invalidates cached job results"""
+            data = request.get_json() or {}
+            if 'data_version' not in data:
+                return jsonify({'error': 'data_version is required'}), 400
+            self.job_manager.set_data_version(data['data_version'])
+            return jsonify({'data_version': self.job_manager.data_version})
+
         @self.app.route('/api/v1/system/info', methods=['GET'])
         def system_info():
             """Get system information"""
@@ -489,7 +695,7 @@ class AnalyticsOrchestrator:
             self.realtime_system.stop_system()
 
         # Shutdown job manager
-        self.job_manager.executor.shutdown(wait=True)
+        self.job_manager.shutdown(wait=True)
 
         self.logger.info("👋 Analytics Orchestrator stopped")
 
@@ -539,6 +745,9 @@ def main():
     # Configuration
     config = {
         'max_concurrent_jobs': 4,
+        'job_backend': 'process',
+        'max_queued_jobs': 100,
+        'max_cached_results': 32,
         'monitoring_interval': 30,
         'api_port': 8053,
         'debug': False
@@ -22,10 +22,15 @@ import sys
 import logging
 import json
 import asyncio
+import concurrent.futures
+import hashlib
+import pickle
+import time
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple, Callable
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 import warnings
@@ -140,6 +145,67 @@ class AnalyticsEngine:
         self.data_cache['business_data'] = df
         return df
 
+def simulate_growth_paths(current_revenue: float,
+                          target_revenue: float,
+                          time_horizon: int,
+                          simulations: int,
+                          seed: Any = None,
+                          keep_paths: bool = False) -> Dict[str, Optional[np.ndarray]]:
+    """
+    Advance a batch of Monte Carlo revenue paths month by month as arrays
+
+    Module-level so batches can run in worker processes. Returns final revenues,
+    months to target (time_horizon when never reached) and optionally the full
+    (simulations, time_horizon + 1) path matrix.
+    """
+    rng = np.random.default_rng(seed)
+
+    # Growth parameters (based on market analysis)
+    mean_monthly_growth = (target_revenue / current_revenue) ** (1/time_horizon) - 1
+    std_growth = 0.15  # 15% volatility
+
+    # Market risk factors
+    recession_prob = 0.12  # 12% chance of recession impact
+    recession_impact = -0.4  # 40% revenue decline during recession
+
+    # Competition risk
+    competition_risk = 0.08  # 8% chance of major competitive threat
+    competition_impact = -0.25  # 25% market share loss
+
+    current = np.full(simulations, float(current_revenue))
+    reached = current >= target_revenue
+    months_to_target = np.where(reached, 0, time_horizon)
+
+    paths = None
+    if keep_paths:
+        paths = np.empty((simulations, time_horizon + 1))
+        paths[:, 0] = current
+
+    for month in range(time_horizon):
+        # Base growth with volatility
+        growth_rate = rng.normal(mean_monthly_growth, std_growth, simulations)
+
+        # Apply risk factors (monthly probability)
+        growth_rate += np.where(rng.random(simulations) < recession_prob / 12, recession_impact, 0.0)
+        growth_rate += np.where(rng.random(simulations) < competition_risk / 12, competition_impact, 0.0)
+
+        # Market saturation effect (diminishing returns)
+        growth_rate *= np.maximum(0.1, 1 - (current / (target_revenue * 2)))
+
+        current *= (1 + growth_rate)
+        if paths is not None:
+            paths[:, month + 1] = current
+
+        newly_reached = ~reached & (current >= target_revenue)
+        months_to_target[newly_reached] = month + 1
+        reached |= newly_reached
+
+    return {
+        'final_revenues': current,
+        'months_to_target': months_to_target,
+        'paths': paths
+    }
+
 class MonteCarloSimulator:
     """Advanced Monte Carlo simulation for financial projections"""
 
@@ -151,7 +217,10 @@ class MonteCarloSimulator:
                             current_revenue: float = 42.8e6,
                             target_revenue: float = 1.8e9,
                             time_horizon: int = 60,
-                            simulations: int = 10000) -> Dict[str, Any]:
+                            simulations: int = 10000,
+                            seed: Optional[int] = None,
+                            keep_paths: bool = False,
+                            workers: int = 1) -> Dict[str, Any]:
         """
         Run Monte Carlo simulation for revenue growth trajectory
 
@@ -160,66 +229,50 @@ class MonteCarloSimulator:
             target_revenue: Target revenue in dollars
             time_horizon: Months to reach target
             simulations: Number of simulation runs
+            seed: Seed for the NumPy Generator, for reproducible runs
+            keep_paths: Include the full revenue path matrix in the results
+            workers: Split simulations across this many processes (1 runs in-process)
         """
 
         self.logger.info(f"Running {simulations:,} Monte Carlo simulations")
 
-        # Growth parameters (based on market analysis)
-        mean_monthly_growth = (target_revenue / current_revenue) ** (1/time_horizon) - 1
-        std_growth = 0.15  # 15% volatility
-
-        # Market risk factors
-        recession_prob = 0.12  # 12% chance of recession impact
-        recession_impact = -0.4  # 40% revenue decline during recession
-
-        # Competition risk
-        competition_risk = 0.08  # 8% chance of major competitive threat
-        competition_impact = -0.25  # 25% market share loss
-
-        results = []
-
-        for sim in range(simulations):
-            revenue_path = [current_revenue]
-            current = current_revenue
-
-            for month in range(time_horizon):
-                # Base growth with volatility
-                growth_rate = np.random.normal(mean_monthly_growth, std_growth)
-
-                # Apply risk factors
-                if np.random.random() < recession_prob / 12:  # Monthly probability
-                    growth_rate += recession_impact
-
-                if np.random.random() < competition_risk / 12:
-                    growth_rate += competition_impact
-
-                # Market saturation effect (diminishing returns)
-                saturation_factor = 1 - (current / (target_revenue * 2))
-                growth_rate *= max(0.1, saturation_factor)
-
-                current *= (1 + growth_rate)
-                revenue_path.append(current)
-
-            results.append({
-                'final_revenue': current,
-                'path': revenue_path,
-                'achieved_target': current >= target_revenue,
-                'months_to_target': next((i for i, v in enumerate(revenue_path) if v >= target_revenue), time_horizon)
-            })
+        if workers > 1 and simulations >= workers:
+            # Independent child seeds keep each batch reproducible for a given seed
+            child_seeds = np.random.SeedSequence(seed).spawn(workers)
+            batch_sizes = [len(batch) for batch in np.array_split(np.arange(simulations), workers)]
+
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(simulate_growth_paths, current_revenue, target_revenue,
+                                    time_horizon, batch_size, child_seed, keep_paths)
+                    for batch_size, child_seed in zip(batch_sizes, child_seeds)
+                ]
+                batches = [future.result() for future in futures]
+
+            final_revenues = np.concatenate([batch['final_revenues'] for batch in batches])
+            months_to_target = np.concatenate([batch['months_to_target'] for batch in batches])
+            paths = np.concatenate([batch['paths'] for batch in batches]) if keep_paths else None
+        else:
+            batch = simulate_growth_paths(current_revenue, target_revenue, time_horizon,
+                                          simulations, seed, keep_paths)
+            final_revenues = batch['final_revenues']
+            months_to_target = batch['months_to_target']
+            paths = batch['paths']
 
         # Analyze results
-        final_revenues = [r['final_revenue'] for r in results]
-        success_rate = sum(r['achieved_target'] for r in results) / simulations
+        achieved_target = final_revenues >= target_revenue
+        success_rate = achieved_target.mean()
 
         percentiles = np.percentile(final_revenues, [5, 25, 50, 75, 95])
-        mean_time_to_target = np.mean([r['months_to_target'] for r in results if r['achieved_target']])
+        mean_time_to_target = months_to_target[achieved_target].mean() if achieved_target.any() else np.nan
+        tail_revenues = final_revenues[final_revenues < percentiles[0]]
 
         simulation_results = {
             'simulations': simulations,
             'success_rate': success_rate,
             'final_revenue_stats': {
-                'mean': np.mean(final_revenues),
-                'std': np.std(final_revenues),
+                'mean': final_revenues.mean(),
+                'std': final_revenues.std(),
                 'percentile_5': percentiles[0],
                 'percentile_25': percentiles[1],
                 'median': percentiles[2],
@@ -229,10 +282,13 @@ class MonteCarloSimulator:
             'mean_time_to_target_months': mean_time_to_target,
             'risk_metrics': {
                 'var_95': target_revenue - percentiles[0],  # Value at Risk
-                'expected_shortfall': target_revenue - np.mean([r for r in final_revenues if r < percentiles[0]])
+                'expected_shortfall': target_revenue - (tail_revenues.mean() if tail_revenues.size else np.nan)
             }
         }
 
+        if keep_paths:
+            simulation_results['revenue_paths'] = paths
+
         self.logger.info(f"Simulation complete: {success_rate:.1%} success rate")
         return simulation_results
 
@@ -444,19 +500,20 @@ class CustomerAnalyticsEngine:
         """Build predictive churn model using ensemble methods"""
 
         # Generate synthetic customer features
-        np.random.seed(42)
+        # Local legacy RandomState: same draws as np.random.seed(42), safe when stages run concurrently
+        rng = np.random.RandomState(42)
         n_customers = 1000
 
         # Customer features
         customer_data = pd.DataFrame({
-            'tenure_months': np.random.exponential(24, n_customers),
-            'monthly_spend': np.random.lognormal(6, 1, n_customers),
-            'support_tickets': np.random.poisson(2, n_customers),
-            'feature_adoption_score': np.random.beta(2, 5, n_customers),
-            'engagement_score': np.random.gamma(2, 2, n_customers),
-            'contract_length': np.random.choice([1, 12, 24, 36], n_customers, p=[0.3, 0.4, 0.2, 0.1]),
-            'payment_delays': np.random.poisson(0.5, n_customers),
-            'industry_segment': np.random.choice(['tech', 'finance', 'healthcare', 'retail'], n_customers)
+            'tenure_months': rng.exponential(24, n_customers),
+            'monthly_spend': rng.lognormal(6, 1, n_customers),
+            'support_tickets': rng.poisson(2, n_customers),
+            'feature_adoption_score': rng.beta(2, 5, n_customers),
+            'engagement_score': rng.gamma(2, 2, n_customers),
+            'contract_length': rng.choice([1, 12, 24, 36], n_customers, p=[0.3, 0.4, 0.2, 0.1]),
+            'payment_delays': rng.poisson(0.5, n_customers),
+            'industry_segment': rng.choice(['tech', 'finance', 'healthcare', 'retail'], n_customers)
         })
 
         # Generate churn labels (higher churn for certain profiles)
@@ -468,7 +525,7 @@ class CustomerAnalyticsEngine:
             -0.1 * (customer_data['contract_length'] > 12).astype(int)  # Long contracts reduce churn
         )
 
-        customer_data['churned'] = np.random.binomial(1, np.clip(churn_probability, 0, 1))
+        customer_data['churned'] = rng.binomial(1, np.clip(churn_probability, 0, 1))
 
         # Prepare features
         categorical_features = ['industry_segment']
@@ -814,10 +871,248 @@ class InteractiveDashboard:
 
         ], fluid=True, style={'backgroundColor': '#1a1a1a', 'minHeight': '100vh'})
 
+# Bump when a stage's computation changes so stale cached outputs are not reused
+STAGE_CACHE_VERSION = 1
+
+DEFAULT_ANALYSIS_PARAMETERS = {
+    'periods': 60,
+    'target_revenue': 1.8e9,
+    'time_horizon': 36,  # 3 years
+    'simulations': 10000,
+    'monte_carlo_seed': None,
+    'monte_carlo_workers': 1,
+    'forecast_target': 'market_share',
+    'forecast_periods': 12
+}
+
+# Inclusive (min, max) for numeric analysis parameters; bounds keep one request from monopolising workers
+ANALYSIS_PARAMETER_LIMITS = {
+    'periods': (24, 600),  # LSTM needs 12 months of history plus a test split
+    'target_revenue': (1.0, 1e13),
+    'time_horizon': (1, 120),
+    'simulations': (100, 100000),
+    'monte_carlo_workers': (1, os.cpu_count() or 1),
+    'forecast_periods': (1, 60)
+}
+
+FORECAST_TARGETS = ('revenue', 'customers', 'cac', 'ltv', 'churn_rate', 'partnerships',
+                    'market_share', 'competitive_index', 'gross_margin', 'operating_margin')
+
+def validate_analysis_parameters(parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge parameters over the defaults, raising ValueError for unknown or out-of-range values"""
+    unknown = sorted(set(parameters) - set(DEFAULT_ANALYSIS_PARAMETERS))
+    if unknown:
+        raise ValueError(f"Unknown analysis parameters: {', '.join(unknown)}")
+
+    merged = {**DEFAULT_ANALYSIS_PARAMETERS, **parameters}
+    for name, (low, high) in ANALYSIS_PARAMETER_LIMITS.items():
+        value = merged[name]
+        integral = name != 'target_revenue'
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"{name} must be {'an integer' if integral else 'a number'}")
+        if not low <= value <= high:  # Also rejects NaN and infinities
+            raise ValueError(f"{name} must be between {low:g} and {high:g}")
+        if integral and value != int(value):
+            raise ValueError(f"{name} must be an integer")
+        merged[name] = int(value) if integral else float(value)
+
+    seed = merged['monte_carlo_seed']
+    if seed is not None and (isinstance(seed, bool) or not isinstance(seed, int) or seed < 0):
+        raise ValueError("monte_carlo_seed must be a non-negative integer or null")
+
+    if merged['forecast_target'] not in FORECAST_TARGETS:
+        raise ValueError(f"forecast_target must be one of: {', '.join(FORECAST_TARGETS)}")
+
+    return merged
+
+@dataclass
+class AnalysisStage:
+    """One step of the analysis pipeline with its declared inputs"""
+    name: str
+    func: Callable[..., Any]
+    inputs: List[str] = field(default_factory=list)  # upstream stage names, passed positionally
+    params: List[str] = field(default_factory=list)  # analysis parameters, passed as keywords
+    cacheable: bool = True
+    seed_param: Optional[str] = None  # output is random, so not cached, when this parameter is None
+
+class StageCache:
+    """
+    On-disk memo of stage outputs keyed by stage input hash.
+
+    Entries older than max_age_seconds are treated as misses; beyond
+    max_entries the least recently used entries (by mtime, refreshed on
+    each hit) are deleted.
+    """
+
+    def __init__(self, cache_dir: str, max_entries: int = 256, max_age_seconds: float = 7 * 24 * 3600):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_age_seconds = max_age_seconds
+        self.logger = logger.getChild('StageCache')
+
+    def _path(self, stage: str, key: str) -> Path:
+        return self.cache_dir / f"{stage}_{key}.pkl"
+
+    def get(self, stage: str, key: str) -> Tuple[bool, Any]:
+        path = self._path(stage, key)
+        try:
+            if time.time() - path.stat().st_mtime > self.max_age_seconds:
+                path.unlink(missing_ok=True)
+                return False, None
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+            os.utime(path)  # Mark as recently used for pruning
+            return True, value
+        except FileNotFoundError:
+            return False, None
+        except Exception as e:
+            self.logger.warning(f"Discarding unreadable cache entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return False, None
+
+    def put(self, stage: str, key: str, value: Any):
+        path = self._path(stage, key)
+        temp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+        try:
+            with open(temp_path, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+        except Exception as e:
+            temp_path.unlink(missing_ok=True)
+            self.logger.warning(f"Could not cache {stage} output: {e}")
+            return
+        self.prune()
+
+    def prune(self):
+        """Delete expired entries, then the least recently used beyond max_entries"""
+        entries = []
+        now = time.time()
+        for path in self.cache_dir.glob('*.pkl'):
+            try:
+                mtime = path.stat().st_mtime
+            except FileNotFoundError:
+                continue  # Removed by a concurrent prune
+            if now - mtime > self.max_age_seconds:
+                path.unlink(missing_ok=True)
+            else:
+                entries.append((mtime, path))
+
+        entries.sort()
+        for _, path in entries[:max(0, len(entries) - self.max_entries)]:
+            path.unlink(missing_ok=True)
+
+    def clear(self):
+        for path in self.cache_dir.glob('*.pkl'):
+            path.unlink(missing_ok=True)
+
+class StagePipeline:
+    """
+    Runs analysis stages as a dependency graph.
+
+    A stage's key hashes its name, parameter values and the keys of its
+    inputs, so a changed parameter invalidates exactly the stages downstream
+    of it. An unseeded random stage, and everything downstream of it, is
+    recomputed on every run. Stages whose inputs are ready run concurrently
+    on a thread pool; the heavy stages spend most of their time in NumPy,
+    scikit-learn and TensorFlow code that releases the GIL.
+    """
+
+    def __init__(self, stages: List[AnalysisStage], cache: Optional[StageCache] = None, max_workers: int = 4):
+        self.stages = {stage.name: stage for stage in stages}
+        self.order = self._dependency_order()
+        self.cache = cache
+        self.max_workers = max_workers
+        self.logger = logger.getChild('StagePipeline')
+
+    def _dependency_order(self) -> List[str]:
+        """Stage names with every stage after its inputs; rejects missing inputs and cycles"""
+        order: List[str] = []
+        pending = dict(self.stages)
+        while pending:
+            ready = [name for name, stage in pending.items() if all(upstream in order for upstream in stage.inputs)]
+            if not ready:
+                raise ValueError(f"Unsatisfiable stage inputs: {sorted(pending)}")
+            for name in ready:
+                order.append(name)
+                del pending[name]
+        return order
+
+    def stage_keys(self, parameters: Dict[str, Any]) -> Dict[str, str]:
+        """Input hash of every stage, computed in dependency order"""
+        keys = {}
+        for name in self.order:
+            stage = self.stages[name]
+            payload = json.dumps({
+                'stage': name,
+                'version': STAGE_CACHE_VERSION,
+                'params': {param: parameters.get(param) for param in stage.params},
+                'inputs': [keys[upstream] for upstream in stage.inputs]
+            }, sort_keys=True, default=str)
+            keys[name] = hashlib.sha256(payload.encode()).hexdigest()[:32]
+        return keys
+
+    def random_stages(self, parameters: Dict[str, Any]) -> set:
+        """Stages whose output differs run to run: unseeded, or fed by an unseeded stage"""
+        random = set()
+        for name in self.order:
+            stage = self.stages[name]
+            if (stage.seed_param and parameters.get(stage.seed_param) is None) or random.intersection(stage.inputs):
+                random.add(name)
+        return random
+
+    def run(self, parameters: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+        """Execute all stages; returns stage outputs and per-stage timing/cache info"""
+        keys = self.stage_keys(parameters)
+        random = self.random_stages(parameters)
+        outputs: Dict[str, Any] = {}
+        stage_stats: Dict[str, Dict[str, Any]] = {}
+        remaining = dict(self.stages)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            running: Dict[concurrent.futures.Future, str] = {}
+
+            while remaining or running:
+                ready = [name for name, stage in remaining.items() if all(upstream in outputs for upstream in stage.inputs)]
+                for name in ready:
+                    stage = remaining.pop(name)
+                    running[executor.submit(
+                        self._run_stage, stage, keys[name], outputs, parameters, name not in random
+                    )] = name
+
+                if not running:
+                    raise ValueError(f"Unsatisfiable stage inputs: {sorted(remaining)}")
+
+                done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    outputs[name], stage_stats[name] = future.result()
+
+        return outputs, stage_stats
+
+    def _run_stage(self, stage: AnalysisStage, key: str, outputs: Dict[str, Any],
+                   parameters: Dict[str, Any], deterministic: bool = True) -> Tuple[Any, Dict[str, Any]]:
+        start_time = time.perf_counter()
+        use_cache = stage.cacheable and deterministic and self.cache is not None
+
+        if use_cache:
+            hit, value = self.cache.get(stage.name, key)
+            if hit:
+                self.logger.info(f"♻️ {stage.name}: cached ({key[:12]})")
+                return value, {'cached': True, 'seconds': time.perf_counter() - start_time, 'key': key}
+
+        value = stage.func(*[outputs[upstream] for upstream in stage.inputs],
+                           **{param: parameters.get(param) for param in stage.params})
+
+        if use_cache:
+            self.cache.put(stage.name, key, value)
+
+        return value, {'cached': False, 'seconds': time.perf_counter() - start_time, 'key': key}
+
 class InstitutionalAnalyticsSystem:
     """Main system orchestrator for institutional-grade analytics"""
 
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[str] = None, max_stage_workers: int = 4):
         self.logger = logger.getChild('InstitutionalAnalytics')
         self.analytics_engine = AnalyticsEngine()
         self.monte_carlo = MonteCarloSimulator(self.analytics_engine)
@@ -825,63 +1120,89 @@ class InstitutionalAnalyticsSystem:
         self.customer_analytics = CustomerAnalyticsEngine(self.analytics_engine)
         self.dashboard = InteractiveDashboard(self.analytics_engine)
 
-        self.logger.info("🏢 Institutional Analytics System initialized")
-
-    def run_comprehensive_analysis(self) -> Dict[str, Any]:
-        """Execute complete institutional-grade analytics pipeline"""
+        cache_dir = cache_dir or os.environ.get(
+            'AIA_ANALYTICS_CACHE_DIR', str(Path.home() / '.aia' / 'analytics_stage_cache')
+        )
+        self.pipeline = StagePipeline(self._build_stages(), StageCache(cache_dir), max_workers=max_stage_workers)
 
-        self.logger.info("🚀 Starting comprehensive institutional analytics")
+        self.logger.info("🏢 Institutional Analytics System initialized")
 
-        results = {}
+    def _build_stages(self) -> List[AnalysisStage]:
+        """Analysis stages and their dependencies"""
+        return [
+            AnalysisStage('business_data', self.analytics_engine.generate_synthetic_business_data,
+                          params=['periods']),
+            AnalysisStage('data_summary', self._summarize_data, inputs=['business_data'], cacheable=False),
+            AnalysisStage('monte_carlo', self._run_monte_carlo, inputs=['business_data'],
+                          params=['target_revenue', 'time_horizon', 'simulations',
+                                  'monte_carlo_seed', 'monte_carlo_workers'],
+                          seed_param='monte_carlo_seed'),
+            AnalysisStage('forecasting', self._run_forecasting, inputs=['business_data'],
+                          params=['forecast_target', 'forecast_periods']),
+            AnalysisStage('ltv_analysis', self.customer_analytics.calculate_advanced_ltv, inputs=['business_data']),
+            AnalysisStage('churn_analysis', self.customer_analytics.build_churn_prediction_model,
+                          inputs=['business_data']),
+            AnalysisStage('risk_assessment', self.calculate_risk_metrics, inputs=['business_data', 'monte_carlo'])
+        ]
 
-        # 1. Generate business data
-        self.logger.info("📊 Generating business intelligence data")
-        business_data = self.analytics_engine.generate_synthetic_business_data(periods=60)
-        results['data_summary'] = {
+    def _summarize_data(self, business_data: pd.DataFrame) -> Dict[str, Any]:
+        return {
             'periods': len(business_data),
             'date_range': f"{business_data['date'].min().strftime('%Y-%m')} to {business_data['date'].max().strftime('%Y-%m')}",
             'current_revenue': f"${business_data['revenue'].iloc[-1]:.1f}M",
             'revenue_growth': f"{((business_data['revenue'].iloc[-1] / business_data['revenue'].iloc[0]) - 1) * 100:.1f}%"
         }
 
-        # 2. Monte Carlo Financial Projections
-        self.logger.info("🎲 Running Monte Carlo simulations for growth trajectory")
-        monte_carlo_results = self.monte_carlo.run_growth_simulation(
+    def _run_monte_carlo(self, business_data: pd.DataFrame, target_revenue: float, time_horizon: int,
+                         simulations: int, monte_carlo_seed: Optional[int], monte_carlo_workers: int) -> Dict[str, Any]:
+        return self.monte_carlo.run_growth_simulation(
             current_revenue=business_data['revenue'].iloc[-1] * 1e6,
-            target_revenue=1.8e9,
-            time_horizon=36,  # 3 years
-            simulations=10000
+            target_revenue=target_revenue,
+            time_horizon=time_horizon,
+            simulations=simulations,
+            seed=monte_carlo_seed,
+            workers=monte_carlo_workers
         )
-        results['monte_carlo'] = monte_carlo_results
 
-        # 3. Hybrid Forecasting
-        self.logger.info("🔮 Training hybrid ARIMA-LSTM forecasting models")
-        forecasting_results = self.forecasting.train_hybrid_model(business_data, 'market_share')
-        market_forecasts = self.forecasting.forecast_market_penetration(periods=12)
-        results['forecasting'] = {
+    def _run_forecasting(self, business_data: pd.DataFrame, forecast_target: str, forecast_periods: int) -> Dict[str, Any]:
+        forecasting_results = self.forecasting.train_hybrid_model(business_data, forecast_target)
+        return {
             'model_performance': forecasting_results,
-            'market_forecasts': market_forecasts
+            'market_forecasts': self.forecasting.forecast_market_penetration(periods=forecast_periods)
         }
 
-        # 4. Customer Analytics
-        self.logger.info("👥 Analyzing customer lifetime value and churn")
-        ltv_analysis = self.customer_analytics.calculate_advanced_ltv(business_data)
-        churn_analysis = self.customer_analytics.build_churn_prediction_model(business_data)
-        results['customer_analytics'] = {
-            'ltv_analysis': ltv_analysis,
-            'churn_analysis': churn_analysis
-        }
+    def run_comprehensive_analysis(self, parameters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Execute complete institutional-grade analytics pipeline
 
-        # 5. Risk Assessment
-        self.logger.info("⚠️ Conducting quantitative risk assessment")
-        risk_metrics = self.calculate_risk_metrics(business_data, monte_carlo_results)
-        results['risk_assessment'] = risk_metrics
+        Stage outputs are memoised on disk by input hash, so a re-run only
+        recomputes stages affected by changed parameters. Monte Carlo,
+        forecasting and customer analytics run concurrently.
+        """
+
+        self.logger.info("🚀 Starting comprehensive institutional analytics")
+        parameters = validate_analysis_parameters(parameters or {})
+
+        outputs, stage_stats = self.pipeline.run(parameters)
+        self.analytics_engine.data_cache['business_data'] = outputs['business_data']
+
+        results = {
+            'data_summary': outputs['data_summary'],
+            'monte_carlo': outputs['monte_carlo'],
+            'forecasting': outputs['forecasting'],
+            'customer_analytics': {
+                'ltv_analysis': outputs['ltv_analysis'],
+                'churn_analysis': outputs['churn_analysis']
+            },
+            'risk_assessment': outputs['risk_assessment']
+        }
 
-        # 6. Generate Executive Summary
-        executive_summary = self.generate_executive_summary(results)
-        results['executive_summary'] = executive_summary
+        # Generate Executive Summary
+        results['executive_summary'] = self.generate_executive_summary(results)
+        results['pipeline_stages'] = stage_stats
 
-        self.logger.info("✅ Comprehensive analysis complete")
+        cached = [name for name, info in stage_stats.items() if info['cached']]
+        self.logger.info(f"✅ Comprehensive analysis complete ({len(cached)}/{len(stage_stats)} stages from cache)")
         return results
 
     def calculate_risk_metrics(self, data: pd.DataFrame, monte_carlo_results: Dict) -> Dict[str, Any]:
@@ -24,20 +24,23 @@ import time
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Tuple
 from dataclasses import dataclass, field, asdict
 import logging
+import os
+import socketserver
+from abc import ABC, abstractmethod
+from collections import deque, OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 import threading
 from queue import Queue
 import redis
-from flask import Flask, render_template_string, jsonify
+from flask import Flask, render_template_string, jsonify, request
 from flask_socketio import SocketIO, emit
 import requests
 
 # Advanced analytics
 from sklearn.ensemble import IsolationForest
-from sklearn.preprocessing import StandardScaler
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
@@ -70,30 +73,221 @@ class Alert:
     acknowledged: bool = False
     data: Dict[str, Any] = field(default_factory=dict)
 
-class DataIngestionEngine:
-    """Advanced data ingestion with multiple source support"""
+class ColumnarRingBuffer:
+    """Fixed-capacity ring of rows stored column-wise in preallocated NumPy arrays"""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.timestamps = np.full(capacity, np.nan)
+        self.columns: Dict[str, np.ndarray] = {}
+        self.position = 0  # Next slot to write
+        self.size = 0
+
+    def column(self, name: str) -> np.ndarray:
+        """Get (creating on first use) the array backing a column"""
+        array = self.columns.get(name)
+        if array is None:
+            array = self.columns[name] = np.full(self.capacity, np.nan)
+        return array
+
+    def advance(self, timestamp: float) -> int:
+        """Claim the next slot, clearing whatever row it held, and return its index"""
+        slot = self.position
+        self.timestamps[slot] = timestamp
+        for array in self.columns.values():
+            array[slot] = np.nan
+
+        self.position = (slot + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+        return slot
+
+    def last_slot(self) -> int:
+        return (self.position - 1) % self.capacity
+
+    def ordered(self, array: np.ndarray, count: int) -> np.ndarray:
+        """Last `count` values of a column in chronological order (a view unless the ring wraps)"""
+        count = max(0, min(count, self.size))
+        start = (self.position - count) % self.capacity
+        if start + count <= self.capacity:
+            return array[start:start + count]
+        return np.concatenate((array[start:], array[:self.position]))
+
+class StreamTimeSeries:
+    """Raw samples plus 1s/1m/1h rollups for one stream, all in bounded ring buffers"""
+
+    # resolution -> (bucket seconds, buckets retained)
+    ROLLUPS = {
+        '1s': (1, 3600),        # 1 hour
+        '1m': (60, 1440),       # 1 day
+        '1h': (3600, 24 * 90)   # 90 days
+    }
+
+    def __init__(self, raw_capacity: int = 3600):
+        self.raw = ColumnarRingBuffer(raw_capacity)
+        self.rollups = {
+            resolution: ColumnarRingBuffer(capacity)
+            for resolution, (_, capacity) in self.ROLLUPS.items()
+        }
+        self.current_buckets = {resolution: None for resolution in self.ROLLUPS}
+        self.rollup_columns: Dict[str, Dict[str, Tuple[np.ndarray, ...]]] = {
+            resolution: {} for resolution in self.ROLLUPS
+        }
+        self.lock = threading.Lock()
+
+    def append(self, timestamp: float, data: Dict[str, Any]):
+        """Append one update; non-numeric fields are not charted and are skipped"""
+        values = {
+            metric: float(value) for metric, value in data.items()
+            if isinstance(value, (int, float, np.number)) and not isinstance(value, bool)
+        }
+
+        with self.lock:
+            slot = self.raw.advance(timestamp)
+            for metric, value in values.items():
+                self.raw.column(metric)[slot] = value
+
+            for resolution, (bucket_seconds, _) in self.ROLLUPS.items():
+                self._update_rollup(resolution, bucket_seconds, timestamp, values)
+
+    def _update_rollup(self, resolution: str, bucket_seconds: int, timestamp: float, values: Dict[str, float]):
+        """Fold values into the current bucket, opening a new one when time moves past it"""
+        ring = self.rollups[resolution]
+        bucket = timestamp - timestamp % bucket_seconds
+
+        # Late samples are folded into the open bucket rather than rewriting history
+        if self.current_buckets[resolution] is None or bucket > self.current_buckets[resolution]:
+            self.current_buckets[resolution] = bucket
+            slot = ring.advance(bucket)
+        else:
+            slot = ring.last_slot()
+
+        columns_by_metric = self.rollup_columns[resolution]
+        for metric, value in values.items():
+            columns = columns_by_metric.get(metric)
+            if columns is None:
+                columns = columns_by_metric[metric] = tuple(
+                    ring.column(f"{metric}:{aggregate}") for aggregate in ('count', 'sum', 'min', 'max')
+                )
+            count, total, low, high = columns
+
+            if np.isnan(count[slot]):
+                count[slot] = 1
+                total[slot] = low[slot] = high[slot] = value
+            else:
+                count[slot] += 1
+                total[slot] += value
+                low[slot] = min(low[slot], value)
+                high[slot] = max(high[slot], value)
+
+    def series(
+        self,
+        metrics: List[str],
+        resolution: str = 'raw',
+        points: int = 100,
+        aggregate: str = 'mean'
+    ) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """Timestamps and per-metric values for the last `points` samples or buckets"""
+        with self.lock:
+            if resolution == 'raw':
+                ring = self.raw
+                columns = {metric: ring.columns[metric] for metric in metrics if metric in ring.columns}
+                return ring.ordered(ring.timestamps, points).copy(), {
+                    metric: ring.ordered(array, points).copy() for metric, array in columns.items()
+                }
+
+            ring = self.rollups[resolution]
+            result = {}
+            for metric in metrics:
+                if f"{metric}:count" not in ring.columns:
+                    continue
+                if aggregate == 'mean':
+                    result[metric] = (ring.ordered(ring.columns[f"{metric}:sum"], points)
+                                      / ring.ordered(ring.columns[f"{metric}:count"], points))
+                else:
+                    result[metric] = ring.ordered(ring.columns[f"{metric}:{aggregate}"], points).copy()
+
+            return ring.ordered(ring.timestamps, points).copy(), result
+
+class TimeSeriesStore:
+    """Bounded per-stream time series store backing dashboard charts"""
+
+    def __init__(self, raw_capacity: int = 3600):
+        self.raw_capacity = raw_capacity
+        self.streams: Dict[str, StreamTimeSeries] = {}
+        self.lock = threading.Lock()
+
+    def append(self, key: str, timestamp: float, data: Dict[str, Any]):
+        series = self.streams.get(key)
+        if series is None:
+            with self.lock:
+                series = self.streams.setdefault(key, StreamTimeSeries(self.raw_capacity))
+        series.append(timestamp, data)
+
+    def series(self, key: str, metrics: List[str], resolution: str = 'raw',
+               points: int = 100, aggregate: str = 'mean') -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        series = self.streams.get(key)
+        if series is None:
+            return np.empty(0), {}
+        return series.series(metrics, resolution, points, aggregate)
+
+    def history_matrix(self, key: str, metrics: List[str]) -> np.ndarray:
+        """Retained raw samples as a (samples, metrics) array, NaN where a metric was missing"""
+        series = self.streams.get(key)
+        if series is None or not metrics:
+            return np.empty((0, len(metrics)))
+        _, columns = series.series(metrics, 'raw', series.raw.capacity)
+        length = min(series.raw.size, series.raw.capacity)
+        return np.column_stack([columns.get(metric, np.full(length, np.nan)) for metric in metrics])
+
+class DataSource(ABC):
+    """Base class for real-time sources feeding DataIngestionEngine"""
+
+    name = 'source'
 
     def __init__(self):
-        self.logger = logger.getChild('DataIngestion')
-        self.streams = {}
-        self.subscribers = []
-        self.anomaly_detector = IsolationForest(contamination=0.1, random_state=42)
-        self.scaler = StandardScaler()
+        self.logger = logger.getChild(f'Source.{self.name}')
         self.is_running = False
-        self.data_queue = Queue()
 
-    def register_stream(self, stream: DataStream):
-        """Register a new data stream"""
-        self.streams[stream.source_id] = stream
-        self.logger.info(f"Registered stream: {stream.source_id} ({stream.stream_type})")
+    @abstractmethod
+    def run(self, publish: Callable[[DataStream], None]):
+        """Block producing DataStream updates into publish() until stop() is called"""
 
-    def add_subscriber(self, callback: Callable):
-        """Add a callback function for data updates"""
-        self.subscribers.append(callback)
+    def stop(self):
+        self.is_running = False
 
-    def simulate_real_time_data(self):
+    @staticmethod
+    def parse_record(record: Dict[str, Any]) -> DataStream:
+        """Build a DataStream from a JSON record: source_id, stream_type, data, optional timestamp (epoch or ISO)"""
+        now = datetime.now()
+        timestamp = record.get('timestamp')
+        if isinstance(timestamp, (int, float)):
+            last_update = datetime.fromtimestamp(timestamp)
+        elif isinstance(timestamp, str):
+            last_update = datetime.fromisoformat(timestamp)
+        else:
+            last_update = now
+
+        return DataStream(
+            source_id=record['source_id'],
+            stream_type=record.get('stream_type', record['source_id']),
+            last_update=last_update,
+            data=record['data'],
+            quality_score=record.get('quality_score', 1.0),
+            latency_ms=max(0, int((now - last_update).total_seconds() * 1000))
+        )
+
+class SimulatedDataSource(DataSource):
+    """Synthetic financial, operational, market and customer streams"""
+
+    name = 'simulator'
+
+    def __init__(self, interval: float = 1.0):
+        super().__init__()
+        self.interval = interval
+
+    def run(self, publish: Callable[[DataStream], None]):
         """Simulate real-time business data streams"""
-        base_time = datetime.now()
+        self.is_running = True
 
         while self.is_running:
             current_time = datetime.now()
@@ -170,41 +364,402 @@ class DataIngestionEngine:
                 latency_ms=np.random.randint(50, 150)
             )
 
-            # Update streams and notify subscribers
             for stream in [financial_stream, operational_stream, market_stream, customer_stream]:
-                self.streams[stream.source_id] = stream
-                self.data_queue.put(stream)
+                publish(stream)
+
+            time.sleep(self.interval)
+
+class FileTailSource(DataSource):
+    """Tails a JSON-lines file, publishing each complete record as it is appended"""
+
+    name = 'file_tail'
+
+    def __init__(self, path: str, poll_interval: float = 0.2, from_start: bool = False):
+        super().__init__()
+        self.path = path
+        self.poll_interval = poll_interval
+        self.from_start = from_start
 
-                # Notify subscribers
-                for callback in self.subscribers:
+    def run(self, publish: Callable[[DataStream], None]):
+        self.is_running = True
+        while self.is_running and not os.path.exists(self.path):
+            time.sleep(self.poll_interval)
+
+        with open(self.path, 'r') as handle:
+            if not self.from_start:
+                handle.seek(0, os.SEEK_END)
+            partial = ''
+
+            while self.is_running:
+                line = handle.readline()
+                if not line:
+                    # Start over if the file was truncated or rotated in place
+                    if os.path.getsize(self.path) < handle.tell():
+                        handle.seek(0)
+                        partial = ''
+                    time.sleep(self.poll_interval)
+                    continue
+
+                partial += line
+                if not partial.endswith('\n'):
+                    continue  # Writer has not finished this record yet
+
+                record_line, partial = partial.strip(), ''
+                if not record_line:
+                    continue
+                try:
+                    publish(self.parse_record(json.loads(record_line)))
+                except Exception as e:
+                    self.logger.error(f"Invalid record in {self.path}: {e}")
+
+class ReusableThreadingTCPServer(socketserver.ThreadingTCPServer):
+    """ThreadingTCPServer that can rebind its port right after a restart"""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+class SocketDataSource(DataSource):
+    """Local TCP listener accepting newline-delimited JSON records from any number of clients"""
+
+    name = 'socket'
+
+    def __init__(self, host: str = '127.0.0.1', port: int = 9099):
+        super().__init__()
+        self.host = host
+        self.port = port
+        self.server: Optional[ReusableThreadingTCPServer] = None
+        self.serving = threading.Event()
+        self.stop_requested = False
+        self.state_lock = threading.Lock()
+
+    def run(self, publish: Callable[[DataStream], None]):
+        source = self
+
+        class RecordHandler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for raw_line in self.rfile:
+                    if not source.is_running:
+                        break
+                    line = raw_line.strip()
+                    if not line:
+                        continue
                     try:
-                        callback(stream)
+                        publish(source.parse_record(json.loads(line)))
                     except Exception as e:
-                        self.logger.error(f"Subscriber callback error: {e}")
+                        source.logger.error(f"Invalid record from {self.client_address}: {e}")
+
+        server = ReusableThreadingTCPServer((self.host, self.port), RecordHandler)
+        with self.state_lock:
+            if self.stop_requested:
+                server.server_close()
+                return
+            self.server = server
+            self.is_running = True
+            self.serving.set()
+
+        self.logger.info(f"Listening for stream records on {self.host}:{self.port}")
+        try:
+            server.serve_forever(poll_interval=0.5)
+        finally:
+            server.server_close()
+
+    def stop(self):
+        with self.state_lock:
+            super().stop()
+            self.stop_requested = True
+            serving = self.serving.is_set()
+
+        # Only once run() has committed to serve_forever(); shutdown() would block otherwise
+        if serving:
+            self.server.shutdown()
+
+class SubscriberChannel:
+    """
+    Delivers stream updates to one subscriber on its own worker thread.
+
+    Pending updates are keyed by source_id: while the subscriber lags, a new
+    update for a stream replaces the pending one (coalescing) instead of
+    queueing behind it. The number of pending streams is bounded; when it is
+    exceeded the oldest pending update is dropped.
+    """
+
+    def __init__(self, callback: Callable[[DataStream], None], max_pending: int = 64, name: str = None):
+        self.callback = callback
+        self.max_pending = max_pending
+        self.name = name or getattr(callback, '__qualname__', repr(callback))
+        self.logger = logger.getChild('Subscriber')
+
+        self.pending: 'OrderedDict[str, Tuple[DataStream, float]]' = OrderedDict()
+        self.condition = threading.Condition()
+        self.latencies_ms = deque(maxlen=5000)
+        self.stats = {'delivered': 0, 'coalesced': 0, 'dropped': 0, 'errors': 0}
+
+        self.is_running = True
+        self.worker = threading.Thread(target=self._deliver_loop, daemon=True, name=f'subscriber-{self.name}')
+        self.worker.start()
+
+    def offer(self, stream: DataStream, ingested_at: float):
+        """Enqueue an update without blocking the ingestion thread"""
+        with self.condition:
+            if stream.source_id in self.pending:
+                # Keep the stream's place in line but deliver only the newest value
+                self.stats['coalesced'] += 1
+                self.pending[stream.source_id] = (stream, self.pending[stream.source_id][1])
+            else:
+                if len(self.pending) >= self.max_pending:
+                    self.pending.popitem(last=False)
+                    self.stats['dropped'] += 1
+                self.pending[stream.source_id] = (stream, ingested_at)
+            self.condition.notify()
+
+    def stop(self):
+        with self.condition:
+            self.is_running = False
+            self.condition.notify()
+        self.worker.join(timeout=5)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Delivery counters and ingest-to-delivery latency percentiles"""
+        latencies = np.fromiter(self.latencies_ms, dtype=np.float64)
+        return {
+            'subscriber': self.name,
+            'pending': len(self.pending),
+            **self.stats,
+            'latency_p50_ms': float(np.percentile(latencies, 50)) if len(latencies) else 0.0,
+            'latency_p99_ms': float(np.percentile(latencies, 99)) if len(latencies) else 0.0
+        }
+
+    def _deliver_loop(self):
+        while True:
+            with self.condition:
+                while self.is_running and not self.pending:
+                    self.condition.wait()
+                if not self.is_running:
+                    return
+                _, (stream, ingested_at) = self.pending.popitem(last=False)
+
+            try:
+                self.callback(stream)
+                self.stats['delivered'] += 1
+                # Measured from ingestion to the subscriber finishing (e.g. after its socket emits)
+                self.latencies_ms.append((time.perf_counter() - ingested_at) * 1000.0)
+            except Exception as e:
+                self.stats['errors'] += 1
+                self.logger.error(f"Subscriber callback error: {e}")
+
+class DataIngestionEngine:
+    """Advanced data ingestion with multiple source support"""
+
+    def __init__(self, sources: Optional[List[DataSource]] = None):
+        self.logger = logger.getChild('DataIngestion')
+        self.streams = {}
+        self.subscribers: List[SubscriberChannel] = []
+        self.sources: List[DataSource] = list(sources or [])
+        self.source_threads: List[threading.Thread] = []
+        self.is_running = False
+        # Bounded history per stream type (replaces an undrained update queue)
+        self.time_series = TimeSeriesStore()
+
+    def register_stream(self, stream: DataStream):
+        """Register a new data stream"""
+        self.streams[stream.source_id] = stream
+        self.logger.info(f"Registered stream: {stream.source_id} ({stream.stream_type})")
+
+    def add_subscriber(self, callback: Callable, max_pending: int = 64) -> SubscriberChannel:
+        """Add a callback function for data updates, delivered on its own worker thread"""
+        channel = SubscriberChannel(callback, max_pending=max_pending)
+        self.subscribers.append(channel)
+        return channel
+
+    def add_source(self, source: DataSource):
+        """Add a data source; the simulator is used only when no source is configured"""
+        self.sources.append(source)
+
+    def publish(self, stream: DataStream):
+        """Record an update and hand it to every subscriber without waiting on them"""
+        ingested_at = time.perf_counter()
+        self.streams[stream.source_id] = stream
+        self.time_series.append(stream.stream_type, stream.last_update.timestamp(), stream.data)
+
+        for channel in self.subscribers:
+            channel.offer(stream, ingested_at)
 
-            time.sleep(1)  # Update every second
+    def get_ingestion_stats(self) -> Dict[str, Any]:
+        """Per-subscriber delivery and latency statistics"""
+        return {
+            'sources': [source.name for source in self.sources],
+            'streams': len(self.streams),
+            'subscribers': [channel.get_stats() for channel in self.subscribers]
+        }
 
     def start_ingestion(self):
-        """Start data ingestion in background thread"""
+        """Start one background thread per data source"""
         self.is_running = True
-        self.ingestion_thread = threading.Thread(target=self.simulate_real_time_data)
-        self.ingestion_thread.daemon = True
-        self.ingestion_thread.start()
-        self.logger.info("Data ingestion started")
+        if not self.sources:
+            self.sources.append(SimulatedDataSource())
+
+        for source in self.sources:
+            thread = threading.Thread(target=self._run_source, args=(source,), daemon=True)
+            thread.start()
+            self.source_threads.append(thread)
+
+        self.logger.info(f"Data ingestion started ({', '.join(source.name for source in self.sources)})")
+
+    def _run_source(self, source: DataSource):
+        try:
+            source.run(self.publish)
+        except Exception as e:
+            self.logger.error(f"Data source {source.name} failed: {e}")
 
     def stop_ingestion(self):
         """Stop data ingestion"""
         self.is_running = False
-        if hasattr(self, 'ingestion_thread'):
-            self.ingestion_thread.join()
+        for source in self.sources:
+            source.stop()
+        for thread in self.source_threads:
+            thread.join(timeout=5)
+        self.source_threads = []
+
+        for channel in self.subscribers:
+            channel.stop()
         self.logger.info("Data ingestion stopped")
 
-class AnomalyDetectionEngine:
-    """Real-time anomaly detection for business metrics"""
+def _average_path_length(n_samples: np.ndarray) -> np.ndarray:
+    """Expected isolation depth of an unsuccessful BST search over n samples"""
+    n_samples = np.asarray(n_samples, dtype=np.float64)
+    lengths = np.zeros_like(n_samples)
+    lengths[n_samples == 2] = 1.0
+    large = n_samples > 2
+    lengths[large] = (2.0 * (np.log(n_samples[large] - 1.0) + np.euler_gamma)
+                      - 2.0 * (n_samples[large] - 1.0) / n_samples[large])
+    return lengths
+
+class IsolationScorer:
+    """
+    A fitted IsolationForest flattened into padded (trees, nodes) arrays.
+
+    Scoring one row walks every tree in lockstep, one vectorised step per
+    level, which avoids sklearn's per-call validation and dispatch overhead
+    (milliseconds for a single row). Scores match decision_function.
+    """
+
+    def __init__(self, model: IsolationForest):
+        trees = [estimator.tree_ for estimator in model.estimators_]
+        tree_count, node_count = len(trees), max(tree.node_count for tree in trees)
+
+        self.feature = np.zeros((tree_count, node_count), dtype=np.intp)
+        self.threshold = np.zeros((tree_count, node_count), dtype=np.float64)
+        self.left = np.zeros((tree_count, node_count), dtype=np.intp)
+        self.right = np.zeros((tree_count, node_count), dtype=np.intp)
+        self.path_length = np.zeros((tree_count, node_count), dtype=np.float64)
+        self.tree_rows = np.arange(tree_count)
+
+        max_depth = 0
+        for index, (tree, features) in enumerate(zip(trees, model.estimators_features_)):
+            nodes = np.arange(tree.node_count)
+            is_leaf = tree.children_left == -1
+
+            # Leaves point at themselves so extra steps leave finished trees in place
+            self.left[index, :tree.node_count] = np.where(is_leaf, nodes, tree.children_left)
+            self.right[index, :tree.node_count] = np.where(is_leaf, nodes, tree.children_right)
+            self.feature[index, :tree.node_count] = np.asarray(features)[np.maximum(tree.feature, 0)]
+            self.threshold[index, :tree.node_count] = tree.threshold
+
+            # Children are always numbered after their parent
+            depth = np.zeros(tree.node_count)
+            for node in nodes[~is_leaf]:
+                depth[tree.children_left[node]] = depth[tree.children_right[node]] = depth[node] + 1
+            self.path_length[index, :tree.node_count] = depth + _average_path_length(tree.n_node_samples)
+            max_depth = max(max_depth, int(depth.max()))
+
+        self.max_depth = max_depth
+        self.denominator = tree_count * _average_path_length(np.array([model.max_samples_]))[0]
+        self.offset = model.offset_
+
+    def decision_function(self, row: np.ndarray) -> float:
+        """Negative for outliers, as IsolationForest.decision_function"""
+        # Trees compare float32 inputs
+        row = np.asarray(row, dtype=np.float32)
+        nodes = np.zeros(len(self.tree_rows), dtype=np.intp)
+        for _ in range(self.max_depth):
+            go_left = row[self.feature[self.tree_rows, nodes]] <= self.threshold[self.tree_rows, nodes]
+            nodes = np.where(go_left, self.left[self.tree_rows, nodes], self.right[self.tree_rows, nodes])
+
+        depth = self.path_length[self.tree_rows, nodes].sum()
+        return float(-(2.0 ** (-depth / self.denominator)) - self.offset)
+
+class StreamAnomalyState:
+    """Per-stream detector state, one array slot per numeric metric"""
 
     def __init__(self):
+        self.metric_index: Dict[str, int] = {}
+        self.metrics: List[str] = []
+        self.count = np.zeros(0)
+        self.mean = np.zeros(0)
+        self.variance = np.zeros(0)
+        # Refitted in the background from ring-buffer history
+        self.median = np.zeros(0)
+        self.mad = np.zeros(0)
+        self.isolation_scorer: Optional[IsolationScorer] = None
+        self.model_metrics: List[str] = []
+
+    def vector(self, data: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+        """Values of this update aligned to the state arrays, plus a mask of metrics present"""
+        for metric, value in data.items():
+            if metric not in self.metric_index and isinstance(value, (int, float, np.number)) and not isinstance(value, bool):
+                self._add_metric(metric)
+
+        values = np.full(len(self.metrics), np.nan)
+        for metric, value in data.items():
+            index = self.metric_index.get(metric)
+            if index is not None:
+                values[index] = value
+        return values, ~np.isnan(values)
+
+    def _add_metric(self, metric: str):
+        self.metric_index[metric] = len(self.metrics)
+        self.metrics.append(metric)
+        self.count = np.append(self.count, 0.0)
+        self.mean = np.append(self.mean, 0.0)
+        self.variance = np.append(self.variance, 0.0)
+        self.median = np.append(self.median, np.nan)
+        self.mad = np.append(self.mad, np.nan)
+
+class AnomalyDetectionEngine:
+    """
+    Real-time anomaly detection for business metrics.
+
+    Each update is scored in constant time against per-stream arrays: an EWMA
+    z-score (tracks level changes quickly) and a robust z-score from the
+    median/MAD of the retained history (not inflated by past outliers). A
+    metric is flagged when both exceed `z_threshold`. A background worker
+    periodically refits the median/MAD and a multivariate IsolationForest per
+    stream from the time series ring buffers; the forest flags updates whose
+    combination of metrics is unusual even when each metric looks normal.
+    Static business thresholds are still applied.
+    """
+
+    def __init__(
+        self,
+        time_series: Optional[TimeSeriesStore] = None,
+        ewma_alpha: float = 0.05,
+        z_threshold: float = 4.0,
+        min_samples: int = 30,
+        refit_interval: float = 60.0,
+        isolation_estimators: int = 100
+    ):
         self.logger = logger.getChild('AnomalyDetection')
-        self.detectors = {}
+        self.time_series = time_series
+        self.ewma_alpha = ewma_alpha
+        self.z_threshold = z_threshold
+        self.min_samples = min_samples
+        self.refit_interval = refit_interval
+        self.isolation_estimators = isolation_estimators
+
+        self.stream_states: Dict[str, StreamAnomalyState] = {}
+        self.state_lock = threading.Lock()
+        self.is_running = False
+        self.refit_event = threading.Event()
         self.thresholds = {
             'financial': {
                 'revenue': {'min': 35.0, 'max': 60.0},
@@ -221,10 +776,23 @@ class AnomalyDetectionEngine:
                 'nps_score': {'min': 60}
             }
         }
-        self.alert_history = []
+        self.alert_history = deque(maxlen=1000)
 
     def detect_anomalies(self, stream: DataStream) -> List[Alert]:
         """Detect anomalies in data stream"""
+        alerts = self._check_thresholds(stream)
+        alerts.extend(self._check_statistical(stream))
+
+        for alert in alerts:
+            self.alert_history.append(alert)
+
+        if alerts:
+            self.logger.warning(f"Detected {len(alerts)} anomalies in {stream.source_id}")
+
+        return alerts
+
+    def _check_thresholds(self, stream: DataStream) -> List[Alert]:
+        """Static business thresholds"""
         alerts = []
 
         if stream.stream_type not in self.thresholds:
@@ -251,7 +819,7 @@ class AnomalyDetectionEngine:
                 severity = 'critical' if value > threshold['max'] * 1.2 else 'high'
 
             if alert_triggered:
-                alert = Alert(
+                alerts.append(Alert(
                     id=f"{stream.source_id}_{metric}_{int(time.time())}",
                     severity=severity,
                     category=stream.stream_type,
@@ -263,15 +831,145 @@ class AnomalyDetectionEngine:
                         'threshold': threshold,
                         'stream_id': stream.source_id
                     }
-                )
-                alerts.append(alert)
-                self.alert_history.append(alert)
+                ))
 
-        if alerts:
-            self.logger.warning(f"Detected {len(alerts)} anomalies in {stream.source_id}")
+        return alerts
+
+    def _check_statistical(self, stream: DataStream) -> List[Alert]:
+        """EWMA and robust z-scores for every metric at once, then the stream's isolation model"""
+        with self.state_lock:
+            state = self.stream_states.get(stream.stream_type)
+            if state is None:
+                state = self.stream_states[stream.stream_type] = StreamAnomalyState()
+
+            values, present = state.vector(stream.data)
+            if not present.any():
+                return []
+
+            # Score against the state before this update so an outlier can't mask itself
+            with np.errstate(divide='ignore', invalid='ignore'):
+                ewma_z = np.abs(values - state.mean) / np.sqrt(state.variance)
+                robust_z = 0.6745 * np.abs(values - state.median) / state.mad
+
+            warmed_up = present & (state.count >= self.min_samples)
+            flagged = warmed_up & (ewma_z > self.z_threshold) & (robust_z > self.z_threshold)
+
+            # Winsorise the update so a single outlier can't inflate the variance
+            delta = np.where(present, values - state.mean, 0.0)
+            limit = self.z_threshold * np.sqrt(state.variance)
+            delta = np.where(warmed_up, np.clip(delta, -limit, limit), delta)
+            first = present & (state.count == 0)
+            alpha = np.where(first, 1.0, np.where(present, self.ewma_alpha, 0.0))
+            state.mean += alpha * delta
+            state.variance = np.where(first, 0.0, (1 - alpha) * (state.variance + alpha * delta ** 2))
+            state.count += present
+
+            isolation_scorer = state.isolation_scorer
+            model_metrics = state.model_metrics
+            metrics = list(state.metrics)
+
+        alerts = []
+        timestamp = datetime.now()
+        for index in np.flatnonzero(flagged):
+            metric = metrics[index]
+            score = float(min(ewma_z[index], robust_z[index]))
+            severity = 'critical' if score > 2 * self.z_threshold else 'high' if score > 1.5 * self.z_threshold else 'medium'
+            alerts.append(Alert(
+                id=f"{stream.source_id}_{metric}_z_{int(time.time())}",
+                severity=severity,
+                category=stream.stream_type,
+                message=f"{metric.replace('_', ' ').title()} deviates from recent behaviour: {values[index]:.3f} (z={score:.1f})",
+                timestamp=timestamp,
+                data={
+                    'metric': metric,
+                    'value': float(values[index]),
+                    'ewma_z': float(ewma_z[index]),
+                    'robust_z': float(robust_z[index]),
+                    'stream_id': stream.source_id
+                }
+            ))
+
+        if isolation_scorer is not None:
+            row = np.array([stream.data.get(metric, np.nan) for metric in model_metrics], dtype=np.float64)
+            isolation_score = isolation_scorer.decision_function(row) if not np.isnan(row).any() else 0.0
+            if isolation_score < 0:
+                alerts.append(Alert(
+                    id=f"{stream.source_id}_isolation_{int(time.time())}",
+                    severity='medium',
+                    category=stream.stream_type,
+                    message=f"Unusual combination of {stream.stream_type} metrics detected",
+                    timestamp=timestamp,
+                    data={
+                        'isolation_score': isolation_score,
+                        'metrics': dict(zip(model_metrics, row.tolist())),
+                        'stream_id': stream.source_id
+                    }
+                ))
 
         return alerts
 
+    def start(self):
+        """Start the background refit worker"""
+        if self.time_series is None or self.is_running:
+            return
+        self.is_running = True
+        self.refit_thread = threading.Thread(target=self._refit_loop, daemon=True, name='anomaly-refit')
+        self.refit_thread.start()
+
+    def stop(self):
+        self.is_running = False
+        self.refit_event.set()
+        if hasattr(self, 'refit_thread'):
+            self.refit_thread.join(timeout=10)
+
+    def _refit_loop(self):
+        while self.is_running:
+            self.refit_event.wait(self.refit_interval)
+            if not self.is_running:
+                break
+            for stream_type in list(self.stream_states):
+                try:
+                    self.refit_stream(stream_type)
+                except Exception as e:
+                    self.logger.error(f"Anomaly model refit failed for {stream_type}: {e}")
+
+    def refit_stream(self, stream_type: str):
+        """Recompute median/MAD and the isolation model from the stream's retained history"""
+        state = self.stream_states.get(stream_type)
+        if state is None or self.time_series is None:
+            return
+
+        metrics = list(state.metrics)
+        history = self.time_series.history_matrix(stream_type, metrics)
+        if len(history) < self.min_samples:
+            return
+
+        with np.errstate(all='ignore'):
+            median = np.nanmedian(history, axis=0)
+            mad = np.nanmedian(np.abs(history - median), axis=0)
+
+        complete = history[~np.isnan(history).any(axis=1)]
+        isolation_scorer = None
+        if len(complete) >= self.min_samples:
+            isolation_scorer = IsolationScorer(IsolationForest(
+                n_estimators=self.isolation_estimators,
+                contamination=0.01,
+                random_state=42
+            ).fit(complete))
+
+        with self.state_lock:
+            # Metrics seen since the snapshot keep NaN until the next refit
+            state.median[:len(metrics)] = median
+            state.mad[:len(metrics)] = mad
+            state.isolation_scorer = isolation_scorer
+            state.model_metrics = metrics
+
+        self.logger.debug(f"Refitted anomaly model for {stream_type} on {len(history)} samples")
+
+    def recent_alerts(self, count: int = 20) -> List[Alert]:
+        """Most recent alerts, oldest first"""
+        return list(self.alert_history)[-count:]
+
 class RealTimeDashboard:
     """Advanced real-time dashboard with WebSocket support"""
 
@@ -287,30 +985,13 @@ class RealTimeDashboard:
         # Subscribe to data updates
         self.data_engine.add_subscriber(self.on_data_update)
 
-        # Store recent data for charts
-        self.data_history = {
-            'financial': [],
-            'operational': [],
-            'market': [],
-            'customer': []
-        }
-        self.max_history = 100
+        # Chart history lives in the ingestion engine's bounded time series store
+        self.default_chart_points = 100
 
         self.setup_routes()
 
     def on_data_update(self, stream: DataStream):
         """Handle incoming data updates"""
-        # Store in history
-        if stream.stream_type in self.data_history:
-            self.data_history[stream.stream_type].append({
-                'timestamp': stream.last_update.isoformat(),
-                **stream.data
-            })
-
-            # Limit history size
-            if len(self.data_history[stream.stream_type]) > self.max_history:
-                self.data_history[stream.stream_type].pop(0)
-
         # Check for anomalies
         alerts = self.anomaly_engine.detect_anomalies(stream)
 
@@ -335,20 +1016,30 @@ class RealTimeDashboard:
                     'data': alert.data
                 })
 
-    def create_real_time_chart(self, data_type: str, metrics: List[str]) -> Dict:
+    def create_real_time_chart(
+        self,
+        data_type: str,
+        metrics: List[str],
+        resolution: str = 'raw',
+        points: Optional[int] = None
+    ) -> Dict:
         """Create real-time chart configuration"""
-        if data_type not in self.data_history or not self.data_history[data_type]:
+        timestamps, values = self.data_engine.time_series.series(
+            data_type, metrics, resolution, points or self.default_chart_points
+        )
+        if len(timestamps) == 0:
             return {'data': [], 'layout': {}}
 
-        df = pd.DataFrame(self.data_history[data_type])
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
+        time_format = {'1m': '%H:%M', '1h': '%m-%d %H:00'}.get(resolution, '%H:%M:%S')
+        x_labels = [time.strftime(time_format, time.localtime(ts)) for ts in timestamps]
 
         traces = []
         for metric in metrics:
-            if metric in df.columns:
+            if metric in values:
+                series = values[metric]
                 traces.append({
-                    'x': df['timestamp'].dt.strftime('%H:%M:%S').tolist(),
-                    'y': df[metric].tolist(),
+                    'x': x_labels,
+                    'y': [None if np.isnan(value) else float(value) for value in series],
                     'type': 'scatter',
                     'mode': 'lines+markers',
                     'name': metric.replace('_', ' ').title(),
@@ -387,6 +1078,11 @@ class RealTimeDashboard:
                 }
             return jsonify(current_data)
 
+        @self.app.route('/api/ingestion_stats')
+        def ingestion_stats():
+            """Subscriber queue depth, coalescing and ingest-to-emit latency"""
+            return jsonify(self.data_engine.get_ingestion_stats())
+
         @self.app.route('/api/alerts')
         def get_alerts():
             """Get recent alerts"""
@@ -399,7 +1095,7 @@ class RealTimeDashboard:
                     'timestamp': alert.timestamp.isoformat(),
                     'acknowledged': alert.acknowledged
                 }
-                for alert in self.anomaly_engine.alert_history[-20:]  # Last 20 alerts
+                for alert in self.anomaly_engine.recent_alerts(20)
             ]
             return jsonify(recent_alerts)
 
@@ -414,7 +1110,15 @@ class RealTimeDashboard:
             }
 
             metrics = metric_mapping.get(data_type, [])
-            chart_config = self.create_real_time_chart(data_type, metrics)
+            resolution = request.args.get('resolution', 'raw')
+            if resolution != 'raw' and resolution not in StreamTimeSeries.ROLLUPS:
+                return jsonify({'error': f"Unknown resolution '{resolution}'"}), 400
+
+            points = request.args.get('points', type=int)
+            if points is not None and points < 1:
+                return jsonify({'error': 'points must be a positive integer'}), 400
+
+            chart_config = self.create_real_time_chart(data_type, metrics, resolution, points)
             return jsonify(chart_config)
 
     def get_dashboard_html(self) -> str:
@@ -693,7 +1397,7 @@ class RealTimeBusinessIntelligence:
 
         # Initialize components
         self.data_engine = DataIngestionEngine()
-        self.anomaly_engine = AnomalyDetectionEngine()
+        self.anomaly_engine = AnomalyDetectionEngine(self.data_engine.time_series)
         self.dashboard = RealTimeDashboard(self.data_engine, self.anomaly_engine)
 
         self.logger.info("🔄 Real-Time Business Intelligence System initialized")
@@ -702,8 +1406,9 @@ class RealTimeBusinessIntelligence:
         """Start the complete real-time system"""
         self.logger.info("🚀 Starting real-time business intelligence system")
 
-        # Start data ingestion
+        # Start data ingestion and background anomaly model refits
         self.data_engine.start_ingestion()
+        self.anomaly_engine.start()
 
         # Give data engine time to start
         time.sleep(2)
@@ -725,6 +1430,7 @@ class RealTimeBusinessIntelligence:
     def stop_system(self):
         """Stop all system components"""
         self.data_engine.stop_ingestion()
+        self.anomaly_engine.stop()
         self.logger.info("👋 Real-time system stopped")
 
 def main():
@@ -34,6 +34,7 @@ from collections import defaultdict, deque
 import sqlite3
 import hashlib
 import pickle
+import concurrent.futures
 from contextlib import contextmanager
 import warnings
 warnings.filterwarnings("ignore")
@@ -58,6 +59,9 @@ from fastapi import FastAPI, HTTPException, BackgroundTasks
 from pydantic import BaseModel, Field
 import uvicorn
 
+# Shared batched SQLite writer
+from sqlite_write_behind import SQLiteWriteBehind, configure_connection
+
 # Visualization (optional)
 try:
     import matplotlib.pyplot as plt
@@ -111,6 +115,29 @@ class ModelPerformanceMetrics:
     error_rate: float
     timestamp: datetime = field(default_factory=datetime.now)
 
+# Baseline summary resolution: quantile grid for KS/Wasserstein and fixed-edge
+# bins for JS (SUMMARY_BINS) and PSI/chi-square (PSI_BINS, grouped from the same edges)
+SUMMARY_QUANTILE_POINTS = 201
+SUMMARY_BINS = 50
+PSI_BINS = 10
+
+# Above this sample size ks_2samp's default mode switches from the exact
+# p-value to the asymptotic kstwo distribution; column_drift_scores does the same
+KS_EXACT_MAX_N = 10000
+
+@dataclass
+class FeatureDistributionSummary:
+    """Compact per-feature distribution summary used in place of raw samples."""
+    feature_name: str
+    count: int
+    mean: float
+    std: float
+    min_value: float
+    max_value: float
+    quantiles: List[float]
+    bin_edges: List[float]
+    bin_counts: List[int]
+
 class StatisticalDriftDetector:
     """Statistical methods for drift detection."""
 
@@ -239,6 +266,211 @@ class StatisticalDriftDetector:
             self.logger.error(f"Chi-square test failed: {e}")
             return 0.0, 1.0
 
+    def _sorted_histogram(self, sorted_data: np.ndarray, bin_edges: np.ndarray) -> np.ndarray:
+        """Histogram counts of already-sorted data (last bin closed, as np.histogram)."""
+        lower_positions = np.searchsorted(sorted_data, bin_edges[:-1], side="left")
+        return np.diff(np.append(lower_positions, len(sorted_data)))
+
+    def column_drift_scores(
+        self,
+        baseline_data: np.ndarray,
+        current_data: np.ndarray,
+        methods: List[str],
+        psi_bins: int = 10,
+        js_bins: int = 50
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Compute several drift statistics for one feature from shared sorted arrays.
+
+        Each sample is sorted once; KS and Wasserstein come from the two
+        empirical CDFs and PSI, JS and chi-square from bin counts taken with
+        searchsorted on the sorted data, so nothing is re-histogrammed per method.
+        """
+        baseline_sorted = np.sort(baseline_data)
+        current_sorted = np.sort(current_data)
+        n_baseline, n_current = len(baseline_sorted), len(current_sorted)
+
+        range_min = min(baseline_sorted[0], current_sorted[0])
+        range_max = max(baseline_sorted[-1], current_sorted[-1])
+        if range_min == range_max:
+            range_min, range_max = range_min - 0.5, range_max + 0.5
+
+        scores = {}
+
+        if "kolmogorov_smirnov" in methods or "wasserstein_distance" in methods:
+            # Merge the two sorted samples and accumulate each empirical CDF along the merged order
+            all_values = np.concatenate([baseline_sorted, current_sorted])
+            merge_order = np.argsort(all_values, kind="stable")
+            all_values = all_values[merge_order]
+            from_baseline = merge_order < n_baseline
+            baseline_cdf = np.cumsum(from_baseline) / n_baseline
+            current_cdf = np.cumsum(~from_baseline) / n_current
+            cdf_gap = np.abs(baseline_cdf - current_cdf)
+
+            if "kolmogorov_smirnov" in methods:
+                # Only the last of a run of tied values carries the full CDF step
+                run_ends = np.append(all_values[1:] != all_values[:-1], True)
+                statistic = float(cdf_gap[run_ends].max())
+                if max(n_baseline, n_current) <= KS_EXACT_MAX_N:
+                    # Exact distribution, as ks_2samp's default mode uses at these sizes
+                    p_value = float(ks_2samp(baseline_sorted, current_sorted).pvalue)
+                else:
+                    effective_n = n_baseline * n_current / (n_baseline + n_current)
+                    p_value = float(stats.kstwo.sf(statistic, max(1, np.round(effective_n))))
+                scores["kolmogorov_smirnov"] = {
+                    "score": statistic, "p_value": p_value, "test_statistic": statistic
+                }
+
+            if "wasserstein_distance" in methods:
+                wd_score = float(np.sum(cdf_gap[:-1] * np.diff(all_values)))
+                scores["wasserstein_distance"] = {
+                    "score": wd_score, "p_value": 0.0, "test_statistic": wd_score
+                }
+
+        if "population_stability_index" in methods or "chi_square" in methods:
+            bin_edges = np.linspace(range_min, range_max, psi_bins + 1)
+            baseline_counts = self._sorted_histogram(baseline_sorted, bin_edges)
+            current_counts = self._sorted_histogram(current_sorted, bin_edges)
+
+            if "population_stability_index" in methods:
+                baseline_props = np.where(baseline_counts == 0, 1e-10, baseline_counts / n_baseline)
+                current_props = np.where(current_counts == 0, 1e-10, current_counts / n_current)
+                psi_score = float(np.sum((current_props - baseline_props) * np.log(current_props / baseline_props)))
+                scores["population_stability_index"] = {
+                    "score": psi_score, "p_value": 0.0, "test_statistic": psi_score
+                }
+
+            if "chi_square" in methods:
+                try:
+                    chi2, p_value, _, _ = chi2_contingency(np.array([baseline_counts, current_counts]))
+                except ValueError:
+                    chi2, p_value = 0.0, 1.0
+                scores["chi_square"] = {
+                    "score": float(chi2), "p_value": float(p_value), "test_statistic": float(chi2)
+                }
+
+        if "jensen_shannon_divergence" in methods:
+            bin_edges = np.linspace(range_min, range_max, js_bins + 1)
+            baseline_hist = self._sorted_histogram(baseline_sorted, bin_edges) / n_baseline
+            current_hist = self._sorted_histogram(current_sorted, bin_edges) / n_current
+
+            baseline_hist = np.where(baseline_hist == 0, 1e-10, baseline_hist)
+            current_hist = np.where(current_hist == 0, 1e-10, current_hist)
+
+            m = 0.5 * (baseline_hist + current_hist)
+            js_div = float(0.5 * stats.entropy(baseline_hist, m) + 0.5 * stats.entropy(current_hist, m))
+            scores["jensen_shannon_divergence"] = {
+                "score": js_div, "p_value": 0.0, "test_statistic": js_div
+            }
+
+        return scores
+
+    def summarize_feature(
+        self,
+        feature_name: str,
+        data: np.ndarray,
+        bin_edges: Optional[np.ndarray] = None
+    ) -> FeatureDistributionSummary:
+        """
+        Summarise a sample as quantiles, fixed-edge bin counts and moments.
+
+        Without bin_edges (baseline registration) equal-width edges span the
+        sample's range. With a baseline's edges, values outside them are
+        counted in the first/last bin.
+        """
+        min_value, max_value = float(np.min(data)), float(np.max(data))
+
+        if bin_edges is None:
+            range_min, range_max = min_value, max_value
+            if range_min == range_max:
+                range_min, range_max = range_min - 0.5, range_max + 0.5
+            bin_edges = np.linspace(range_min, range_max, SUMMARY_BINS + 1)
+
+        bin_edges = np.asarray(bin_edges, dtype=np.float64)
+        bin_counts, _ = np.histogram(np.clip(data, bin_edges[0], bin_edges[-1]), bins=bin_edges)
+
+        return FeatureDistributionSummary(
+            feature_name=feature_name,
+            count=int(len(data)),
+            mean=float(np.mean(data)),
+            std=float(np.std(data)),
+            min_value=min_value,
+            max_value=max_value,
+            quantiles=np.quantile(data, np.linspace(0.0, 1.0, SUMMARY_QUANTILE_POINTS)).tolist(),
+            bin_edges=bin_edges.tolist(),
+            bin_counts=bin_counts.astype(np.int64).tolist()
+        )
+
+    def summary_drift_scores(
+        self,
+        baseline_summary: FeatureDistributionSummary,
+        current_summary: FeatureDistributionSummary,
+        methods: List[str]
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Compute drift statistics from two summaries sharing the baseline's bin edges.
+
+        KS and Wasserstein use the quantile grids (approximate CDF and quantile
+        functions); PSI, JS and chi-square use the shared bin counts.
+        """
+        scores = {}
+        baseline_quantiles = np.asarray(baseline_summary.quantiles)
+        current_quantiles = np.asarray(current_summary.quantiles)
+        probabilities = np.linspace(0.0, 1.0, len(baseline_quantiles))
+
+        if "kolmogorov_smirnov" in methods:
+            evaluation_points = np.concatenate([baseline_quantiles, current_quantiles])
+            baseline_cdf = np.interp(evaluation_points, baseline_quantiles, probabilities, left=0.0, right=1.0)
+            current_cdf = np.interp(evaluation_points, current_quantiles, probabilities, left=0.0, right=1.0)
+            statistic = float(np.max(np.abs(baseline_cdf - current_cdf)))
+            effective_n = baseline_summary.count * current_summary.count / (baseline_summary.count + current_summary.count)
+            p_value = float(stats.kstwo.sf(statistic, max(1, np.round(effective_n))))
+            scores["kolmogorov_smirnov"] = {
+                "score": statistic, "p_value": p_value, "test_statistic": statistic
+            }
+
+        if "wasserstein_distance" in methods:
+            quantile_gap = np.abs(baseline_quantiles - current_quantiles)
+            wd_score = float(np.sum(0.5 * (quantile_gap[1:] + quantile_gap[:-1]) * np.diff(probabilities)))
+            scores["wasserstein_distance"] = {
+                "score": wd_score, "p_value": 0.0, "test_statistic": wd_score
+            }
+
+        baseline_counts = np.asarray(baseline_summary.bin_counts, dtype=np.float64)
+        current_counts = np.asarray(current_summary.bin_counts, dtype=np.float64)
+
+        if "population_stability_index" in methods or "chi_square" in methods:
+            baseline_coarse = baseline_counts.reshape(PSI_BINS, -1).sum(axis=1)
+            current_coarse = current_counts.reshape(PSI_BINS, -1).sum(axis=1)
+
+            if "population_stability_index" in methods:
+                baseline_props = np.where(baseline_coarse == 0, 1e-10, baseline_coarse / baseline_summary.count)
+                current_props = np.where(current_coarse == 0, 1e-10, current_coarse / current_summary.count)
+                psi_score = float(np.sum((current_props - baseline_props) * np.log(current_props / baseline_props)))
+                scores["population_stability_index"] = {
+                    "score": psi_score, "p_value": 0.0, "test_statistic": psi_score
+                }
+
+            if "chi_square" in methods:
+                try:
+                    chi2, p_value, _, _ = chi2_contingency(np.array([baseline_coarse, current_coarse]))
+                except ValueError:
+                    chi2, p_value = 0.0, 1.0
+                scores["chi_square"] = {
+                    "score": float(chi2), "p_value": float(p_value), "test_statistic": float(chi2)
+                }
+
+        if "jensen_shannon_divergence" in methods:
+            baseline_hist = np.where(baseline_counts == 0, 1e-10, baseline_counts / baseline_summary.count)
+            current_hist = np.where(current_counts == 0, 1e-10, current_counts / current_summary.count)
+            m = 0.5 * (baseline_hist + current_hist)
+            js_div = float(0.5 * stats.entropy(baseline_hist, m) + 0.5 * stats.entropy(current_hist, m))
+            scores["jensen_shannon_divergence"] = {
+                "score": js_div, "p_value": 0.0, "test_statistic": js_div
+            }
+
+        return scores
+
 class FeatureDriftAnalyzer:
     """Analyze drift at the feature level."""
 
@@ -344,6 +576,353 @@ class FeatureDriftAnalyzer:
 
         return drift_results
 
+    def analyze_feature_drift_batched(
+        self,
+        baseline_features: pd.DataFrame,
+        current_features: pd.DataFrame,
+        feature_names: List[str] = None,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, DriftMetrics]:
+        """
+        Analyze drift for many features at once.
+
+        Each feature column is sorted once and all detection methods share the
+        sorted arrays and bin counts. Columns are processed on a thread pool
+        (NumPy sorting and searching release the GIL).
+        """
+        if feature_names is None:
+            feature_names = baseline_features.columns.tolist()
+
+        available_features = []
+        for feature_name in feature_names:
+            if feature_name not in baseline_features.columns or feature_name not in current_features.columns:
+                self.logger.warning(f"Feature {feature_name} not found in data")
+                continue
+            available_features.append(feature_name)
+
+        def analyze_column(feature_name: str) -> Optional[DriftMetrics]:
+            baseline_data = baseline_features[feature_name].dropna().to_numpy(dtype=np.float64)
+            current_data = current_features[feature_name].dropna().to_numpy(dtype=np.float64)
+
+            if len(baseline_data) == 0 or len(current_data) == 0:
+                self.logger.warning(f"Empty data for feature {feature_name}")
+                return None
+
+            try:
+                feature_drift_scores = self.detector.column_drift_scores(
+                    baseline_data, current_data, self.detection_methods
+                )
+            except Exception as e:
+                self.logger.error(f"Batched drift detection failed for {feature_name}: {e}")
+                feature_drift_scores = {}
+
+            # Select primary method result (KS test if available)
+            primary_method = "kolmogorov_smirnov" if "kolmogorov_smirnov" in feature_drift_scores else self.detection_methods[0]
+            primary_result = feature_drift_scores.get(primary_method, {})
+
+            return DriftMetrics(
+                pipeline_id="unknown",  # Will be set by caller
+                feature_name=feature_name,
+                drift_type=primary_method,
+                drift_score=primary_result.get("score", 0.0),
+                p_value=primary_result.get("p_value", 1.0),
+                test_statistic=primary_result.get("test_statistic", 0.0),
+                baseline_mean=float(np.mean(baseline_data)),
+                current_mean=float(np.mean(current_data)),
+                baseline_std=float(np.std(baseline_data)),
+                current_std=float(np.std(current_data))
+            )
+
+        drift_results = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for feature_name, drift_metrics in zip(available_features, executor.map(analyze_column, available_features)):
+                if drift_metrics is not None:
+                    drift_results[feature_name] = drift_metrics
+
+        return drift_results
+
+    def summarize_baseline(
+        self,
+        baseline_features: pd.DataFrame,
+        feature_names: List[str] = None,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, FeatureDistributionSummary]:
+        """Build per-feature baseline summaries in parallel."""
+        if feature_names is None:
+            feature_names = baseline_features.columns.tolist()
+
+        def summarize_column(feature_name: str) -> Optional[FeatureDistributionSummary]:
+            if feature_name not in baseline_features.columns:
+                self.logger.warning(f"Feature {feature_name} not found in data")
+                return None
+
+            baseline_data = baseline_features[feature_name].dropna().to_numpy(dtype=np.float64)
+            if len(baseline_data) == 0:
+                self.logger.warning(f"Empty data for feature {feature_name}")
+                return None
+
+            return self.detector.summarize_feature(feature_name, baseline_data)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            summaries = executor.map(summarize_column, feature_names)
+            return {summary.feature_name: summary for summary in summaries if summary is not None}
+
+    def analyze_summary_drift(
+        self,
+        baseline_summaries: Dict[str, FeatureDistributionSummary],
+        current_summaries: Dict[str, FeatureDistributionSummary]
+    ) -> Dict[str, DriftMetrics]:
+        """Analyze drift between baseline summaries and current-window summaries."""
+        drift_results = {}
+
+        for feature_name, current_summary in current_summaries.items():
+            baseline_summary = baseline_summaries.get(feature_name)
+            if baseline_summary is None or current_summary.count == 0:
+                continue
+
+            try:
+                feature_drift_scores = self.detector.summary_drift_scores(
+                    baseline_summary, current_summary, self.detection_methods
+                )
+            except Exception as e:
+                self.logger.error(f"Summary drift detection failed for {feature_name}: {e}")
+                feature_drift_scores = {}
+
+            # Select primary method result (KS test if available)
+            primary_method = "kolmogorov_smirnov" if "kolmogorov_smirnov" in feature_drift_scores else self.detection_methods[0]
+            primary_result = feature_drift_scores.get(primary_method, {})
+
+            drift_results[feature_name] = DriftMetrics(
+                pipeline_id="unknown",  # Will be set by caller
+                feature_name=feature_name,
+                drift_type=primary_method,
+                drift_score=primary_result.get("score", 0.0),
+                p_value=primary_result.get("p_value", 1.0),
+                test_statistic=primary_result.get("test_statistic", 0.0),
+                baseline_mean=baseline_summary.mean,
+                current_mean=current_summary.mean,
+                baseline_std=baseline_summary.std,
+                current_std=current_summary.std
+            )
+
+        return drift_results
+
+    def analyze_feature_drift_from_summaries(
+        self,
+        baseline_summaries: Dict[str, FeatureDistributionSummary],
+        current_features: pd.DataFrame,
+        feature_names: List[str] = None,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, DriftMetrics]:
+        """Summarise only the current data (on the baseline's bin edges) and analyze drift."""
+        if feature_names is None:
+            feature_names = list(baseline_summaries.keys())
+
+        def summarize_current(feature_name: str) -> Optional[FeatureDistributionSummary]:
+            baseline_summary = baseline_summaries.get(feature_name)
+            if baseline_summary is None or feature_name not in current_features.columns:
+                self.logger.warning(f"Feature {feature_name} not found in data")
+                return None
+
+            current_data = current_features[feature_name].dropna().to_numpy(dtype=np.float64)
+            if len(current_data) == 0:
+                self.logger.warning(f"Empty data for feature {feature_name}")
+                return None
+
+            return self.detector.summarize_feature(feature_name, current_data, baseline_summary.bin_edges)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            current_summaries = {
+                summary.feature_name: summary
+                for summary in executor.map(summarize_current, feature_names)
+                if summary is not None
+            }
+
+        return self.analyze_summary_drift(baseline_summaries, current_summaries)
+
+class StreamingFeatureSketch:
+    """
+    Incremental distribution sketch for one feature within a stream window.
+
+    Values are folded into a fine histogram that subdivides the baseline's
+    bin edges, plus underflow/overflow counts and running moments, so a
+    window never holds its raw values. Sketches are additive and can be
+    merged across panes of a sliding window.
+    """
+
+    FINE_BINS_PER_BIN = 20
+
+    def __init__(self, bin_edges: List[float]):
+        self.bin_edges = np.asarray(bin_edges, dtype=np.float64)
+        self.fine_edges = np.linspace(
+            self.bin_edges[0], self.bin_edges[-1],
+            (len(self.bin_edges) - 1) * self.FINE_BINS_PER_BIN + 1
+        )
+        self.fine_counts = np.zeros(len(self.fine_edges) - 1, dtype=np.int64)
+        self.underflow = 0
+        self.overflow = 0
+        self.count = 0
+        self.shift = 0.5 * (self.bin_edges[0] + self.bin_edges[-1])  # Keeps sum of squares well conditioned
+        self.shifted_sum = 0.0
+        self.shifted_sum_sq = 0.0
+        self.min_value = np.inf
+        self.max_value = -np.inf
+
+    def update(self, values: np.ndarray):
+        """Fold a batch of values into the sketch."""
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+
+        below = values < self.fine_edges[0]
+        above = values > self.fine_edges[-1]
+        self.underflow += int(below.sum())
+        self.overflow += int(above.sum())
+
+        in_range_counts, _ = np.histogram(values[~(below | above)], bins=self.fine_edges)
+        self.fine_counts += in_range_counts
+
+        shifted = values - self.shift
+        self.count += len(values)
+        self.shifted_sum += float(shifted.sum())
+        self.shifted_sum_sq += float(np.dot(shifted, shifted))
+        self.min_value = min(self.min_value, float(values.min()))
+        self.max_value = max(self.max_value, float(values.max()))
+
+    def merge(self, other: "StreamingFeatureSketch"):
+        """Add another sketch built on the same bin edges."""
+        self.fine_counts += other.fine_counts
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        self.count += other.count
+        self.shifted_sum += other.shifted_sum
+        self.shifted_sum_sq += other.shifted_sum_sq
+        self.min_value = min(self.min_value, other.min_value)
+        self.max_value = max(self.max_value, other.max_value)
+
+    def to_summary(self, feature_name: str) -> FeatureDistributionSummary:
+        """Convert the sketch to a summary comparable with the baseline summary."""
+        if self.count == 0:
+            raise ValueError(f"No samples in sketch for feature {feature_name}")
+
+        mean_shifted = self.shifted_sum / self.count
+        variance = max(0.0, self.shifted_sum_sq / self.count - mean_shifted ** 2)
+
+        # Coarse bins: out-of-range values fall into the first/last bin, as for batch summaries
+        bin_counts = self.fine_counts.reshape(len(self.bin_edges) - 1, self.FINE_BINS_PER_BIN).sum(axis=1)
+        bin_counts[0] += self.underflow
+        bin_counts[-1] += self.overflow
+
+        # Piecewise-linear CDF through the fine bins, with under/overflow stretched to observed extremes
+        knots = self.fine_edges
+        cumulative = self.underflow + np.concatenate([[0], np.cumsum(self.fine_counts)])
+        if self.underflow:
+            knots = np.concatenate([[self.min_value], knots])
+            cumulative = np.concatenate([[0], cumulative])
+        if self.overflow:
+            knots = np.concatenate([knots, [self.max_value]])
+            cumulative = np.concatenate([cumulative, [self.count]])
+
+        targets = np.linspace(0.0, 1.0, SUMMARY_QUANTILE_POINTS) * self.count
+        upper = np.clip(np.searchsorted(cumulative, targets, side="left"), 1, len(cumulative) - 1)
+        lower_counts, upper_counts = cumulative[upper - 1], cumulative[upper]
+        fraction = (targets - lower_counts) / np.maximum(upper_counts - lower_counts, 1)
+        quantiles = knots[upper - 1] + np.clip(fraction, 0.0, 1.0) * (knots[upper] - knots[upper - 1])
+        quantiles = np.clip(quantiles, self.min_value, self.max_value)
+        quantiles[0], quantiles[-1] = self.min_value, self.max_value
+
+        return FeatureDistributionSummary(
+            feature_name=feature_name,
+            count=int(self.count),
+            mean=float(mean_shifted + self.shift),
+            std=float(np.sqrt(variance)),
+            min_value=float(self.min_value),
+            max_value=float(self.max_value),
+            quantiles=quantiles.tolist(),
+            bin_edges=self.bin_edges.tolist(),
+            bin_counts=bin_counts.astype(np.int64).tolist()
+        )
+
+class StreamingDriftWindow:
+    """
+    Sliding or tumbling window of feature sketches for one pipeline.
+
+    The window is split into panes of slide_seconds; a tumbling window has a
+    single pane (slide_seconds == window_seconds). Each time a pane closes,
+    the sketches of the last window_seconds worth of panes are merged and
+    summarised for drift analysis.
+    """
+
+    def __init__(
+        self,
+        pipeline_id: str,
+        baseline_summaries: Dict[str, FeatureDistributionSummary],
+        window_seconds: float = 60.0,
+        slide_seconds: Optional[float] = None,
+        min_samples: int = 30
+    ):
+        self.pipeline_id = pipeline_id
+        self.baseline_summaries = baseline_summaries
+        self.window_seconds = window_seconds
+        self.slide_seconds = slide_seconds or window_seconds
+        self.min_samples = min_samples
+        self.closed_panes: deque = deque(maxlen=max(1, int(round(window_seconds / self.slide_seconds))))
+        self.current_pane: Dict[str, StreamingFeatureSketch] = {}
+        self.pane_started_at: Optional[float] = None
+        self.samples_ingested = 0
+
+    def append(self, feature_values: Dict[str, Any], timestamp: float):
+        """Fold new values for one or more features into the current pane."""
+        if self.pane_started_at is None:
+            self.pane_started_at = timestamp
+
+        for feature_name, values in feature_values.items():
+            baseline_summary = self.baseline_summaries.get(feature_name)
+            if baseline_summary is None:
+                continue
+
+            sketch = self.current_pane.get(feature_name)
+            if sketch is None:
+                sketch = self.current_pane[feature_name] = StreamingFeatureSketch(baseline_summary.bin_edges)
+
+            values = np.atleast_1d(np.asarray(values, dtype=np.float64))
+            sketch.update(values)
+            self.samples_ingested += len(values)
+
+    def is_due(self, now: float) -> bool:
+        """Whether the current pane has reached its slide interval."""
+        return self.pane_started_at is not None and now - self.pane_started_at >= self.slide_seconds
+
+    def close_pane(self, now: float) -> Optional[Tuple[float, Dict[str, FeatureDistributionSummary]]]:
+        """
+        Close the current pane and summarise the window ending at it.
+
+        Returns None when the pane received no samples; the empty pane still
+        slides older panes out of the window.
+        """
+        pane_samples = sum(sketch.count for sketch in self.current_pane.values())
+        self.closed_panes.append(self.current_pane)
+        self.current_pane = {}
+        self.pane_started_at = now
+        if pane_samples == 0:
+            return None
+
+        merged: Dict[str, StreamingFeatureSketch] = {}
+        for pane in self.closed_panes:
+            for feature_name, sketch in pane.items():
+                if feature_name not in merged:
+                    merged[feature_name] = StreamingFeatureSketch(sketch.bin_edges)
+                merged[feature_name].merge(sketch)
+
+        window_start = now - self.slide_seconds * len(self.closed_panes)
+        summaries = {
+            feature_name: sketch.to_summary(feature_name)
+            for feature_name, sketch in merged.items()
+            if sketch.count >= max(1, self.min_samples)
+        }
+        return window_start, summaries
+
 class ModelPerformanceMonitor:
     """Monitor model performance for drift detection."""
 
@@ -441,22 +1020,32 @@ class DriftMonitoringSystem:
 
         # System state
         self.active_monitors = {}
-        self.baseline_data = {}
+        self.baseline_summaries: Dict[str, Dict[str, FeatureDistributionSummary]] = {}
         self.drift_thresholds = {}
         self.alert_handlers = []
 
+        # Streaming drift windows and their most recent results
+        self.streaming_windows: Dict[str, StreamingDriftWindow] = {}
+        self.window_results: Dict[str, deque] = defaultdict(lambda: deque(maxlen=100))
+        self.stream_lock = threading.Lock()
+        self.stream_check_interval = 1.0  # seconds
+
         # Background processing
         self.running = False
         self.monitoring_thread = None
 
-        # Initialize database
+        # Initialize database; all subsequent writes go through the write-behind queue
         self._initialize_database()
+        self.db_writer = SQLiteWriteBehind(self.monitoring_database)
+        self._load_baseline_summaries()
 
         self.logger.info("📊 Drift Monitoring System initialized")
 
     def _initialize_database(self):
         """Initialize SQLite database for monitoring data."""
         with sqlite3.connect(self.monitoring_database) as conn:
+            configure_connection(conn)
+
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS drift_metrics (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -507,12 +1096,97 @@ class DriftMonitoringSystem:
                 )
             """)
 
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS monitored_pipelines (
+                    pipeline_id TEXT PRIMARY KEY,
+                    feature_names TEXT,
+                    drift_thresholds TEXT,
+                    registered_at DATETIME
+                )
+            """)
+
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS baseline_summaries (
+                    pipeline_id TEXT,
+                    feature_name TEXT,
+                    summary TEXT,
+                    PRIMARY KEY (pipeline_id, feature_name)
+                )
+            """)
+
+            # Indexes for per-pipeline time-range queries
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_drift_metrics_pipeline_time
+                ON drift_metrics (pipeline_id, timestamp)
+            """)
+
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_drift_alerts_pipeline_ack_time
+                ON drift_alerts (pipeline_id, acknowledged, timestamp)
+            """)
+
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_performance_metrics_pipeline_time
+                ON performance_metrics (pipeline_id, timestamp)
+            """)
+
             conn.commit()
 
+    def _load_baseline_summaries(self):
+        """Restore registered pipelines and their baseline summaries from the database."""
+        with self._get_db_connection() as conn:
+            pipelines = conn.execute("""
+                SELECT pipeline_id, feature_names, drift_thresholds, registered_at
+                FROM monitored_pipelines
+            """).fetchall()
+
+            summaries = conn.execute("""
+                SELECT pipeline_id, summary FROM baseline_summaries
+            """).fetchall()
+
+        for pipeline_id, summary_json in summaries:
+            summary = FeatureDistributionSummary(**json.loads(summary_json))
+            self.baseline_summaries.setdefault(pipeline_id, {})[summary.feature_name] = summary
+
+        for pipeline_id, feature_names_json, thresholds_json, registered_at in pipelines:
+            thresholds = json.loads(thresholds_json)
+            self.drift_thresholds[pipeline_id] = thresholds
+            self.active_monitors[pipeline_id] = self._build_monitor_config(
+                pipeline_id,
+                json.loads(feature_names_json),
+                thresholds,
+                registered_at
+            )
+
+        if pipelines:
+            self.logger.info(f"♻️ Restored {len(pipelines)} monitored pipelines from {self.monitoring_database}")
+
+    def _build_monitor_config(
+        self,
+        pipeline_id: str,
+        feature_names: List[str],
+        thresholds: Dict[str, float],
+        registered_at: Any
+    ) -> Dict[str, Any]:
+        """Create monitor configuration from a pipeline's baseline summaries."""
+        summaries = self.baseline_summaries.get(pipeline_id, {})
+        return {
+            "pipeline_id": pipeline_id,
+            "feature_names": feature_names,
+            "thresholds": thresholds,
+            "baseline_stats": {
+                "mean": {name: summary.mean for name, summary in summaries.items()},
+                "std": {name: summary.std for name, summary in summaries.items()},
+                "count": max((summary.count for summary in summaries.values()), default=0)
+            },
+            "registered_at": registered_at,
+            "status": "active"
+        }
+
     @contextmanager
     def _get_db_connection(self):
         """Context manager for database connections."""
-        conn = sqlite3.connect(self.monitoring_database)
+        conn = configure_connection(sqlite3.connect(self.monitoring_database))
         try:
             yield conn
         finally:
@@ -528,13 +1202,26 @@ class DriftMonitoringSystem:
         """Register a pipeline for drift monitoring."""
         self.logger.info(f"📝 Registering pipeline {pipeline_id} for drift monitoring")
 
-        # Store baseline data
-        self.baseline_data[pipeline_id] = baseline_data.copy()
-
         # Set feature names
         if feature_names is None:
             feature_names = baseline_data.columns.tolist()
 
+        # Summarise the baseline once; the raw frame is not retained
+        summaries = self.feature_analyzer.summarize_baseline(baseline_data, feature_names)
+        self.baseline_summaries[pipeline_id] = summaries
+
+        # An existing stream window sketches on the old baseline's bin edges; restart it on the new one
+        with self.stream_lock:
+            window = self.streaming_windows.get(pipeline_id)
+            if window is not None:
+                self.streaming_windows[pipeline_id] = StreamingDriftWindow(
+                    pipeline_id,
+                    summaries,
+                    window_seconds=window.window_seconds,
+                    slide_seconds=window.slide_seconds,
+                    min_samples=window.min_samples
+                )
+
         # Set drift thresholds
         default_thresholds = {
             "kolmogorov_smirnov": 0.1,
@@ -549,21 +1236,33 @@ class DriftMonitoringSystem:
         self.drift_thresholds[pipeline_id] = default_thresholds
 
         # Create monitor configuration
-        monitor_config = {
-            "pipeline_id": pipeline_id,
-            "feature_names": feature_names,
-            "thresholds": default_thresholds,
-            "baseline_stats": {
-                "mean": baseline_data.mean().to_dict(),
-                "std": baseline_data.std().to_dict(),
-                "count": len(baseline_data)
-            },
-            "registered_at": datetime.now(),
-            "status": "active"
-        }
+        registered_at = datetime.now()
+        monitor_config = self._build_monitor_config(
+            pipeline_id, feature_names, default_thresholds, registered_at
+        )
 
         self.active_monitors[pipeline_id] = monitor_config
 
+        # Persist so baselines survive restarts
+        self.db_writer.execute("DELETE FROM baseline_summaries WHERE pipeline_id = ?", (pipeline_id,))
+        self.db_writer.executemany("""
+            INSERT INTO baseline_summaries (pipeline_id, feature_name, summary)
+            VALUES (?, ?, ?)
+        """, [
+            (pipeline_id, name, json.dumps(asdict(summary)))
+            for name, summary in summaries.items()
+        ])
+        self.db_writer.execute("""
+            INSERT OR REPLACE INTO monitored_pipelines (
+                pipeline_id, feature_names, drift_thresholds, registered_at
+            ) VALUES (?, ?, ?, ?)
+        """, (
+            pipeline_id,
+            json.dumps(feature_names),
+            json.dumps(default_thresholds),
+            registered_at
+        ))
+
         self.logger.info(f"✅ Pipeline {pipeline_id} registered successfully")
 
     def analyze_drift(
@@ -576,20 +1275,20 @@ class DriftMonitoringSystem:
         if pipeline_id not in self.active_monitors:
             raise ValueError(f"Pipeline {pipeline_id} not registered for monitoring")
 
-        if pipeline_id not in self.baseline_data:
+        if pipeline_id not in self.baseline_summaries:
             raise ValueError(f"No baseline data found for pipeline {pipeline_id}")
 
         self.logger.info(f"🔍 Analyzing drift for pipeline {pipeline_id}")
 
-        baseline_data = self.baseline_data[pipeline_id]
+        baseline_summaries = self.baseline_summaries[pipeline_id]
         monitor_config = self.active_monitors[pipeline_id]
 
         if feature_names is None:
             feature_names = monitor_config["feature_names"]
 
-        # Analyze feature drift
-        drift_results = self.feature_analyzer.analyze_feature_drift(
-            baseline_data, current_data, feature_names
+        # Analyze feature drift against the stored baseline summaries
+        drift_results = self.feature_analyzer.analyze_feature_drift_from_summaries(
+            baseline_summaries, current_data, feature_names
         )
 
         # Update pipeline_id in results
@@ -619,7 +1318,7 @@ class DriftMonitoringSystem:
             },
             "alerts": [asdict(alert) for alert in alerts],
             "analysis_timestamp": datetime.now(),
-            "baseline_data_points": len(baseline_data),
+            "baseline_data_points": monitor_config["baseline_stats"]["count"],
             "current_data_points": len(current_data)
         }
 
@@ -628,30 +1327,144 @@ class DriftMonitoringSystem:
 
         return analysis_result
 
+    def configure_stream(
+        self,
+        pipeline_id: str,
+        window_seconds: float = 60.0,
+        slide_seconds: Optional[float] = None,
+        min_samples: int = 30
+    ):
+        """Configure a sliding (slide < window) or tumbling streaming window for a pipeline."""
+        if pipeline_id not in self.baseline_summaries:
+            raise ValueError(f"Pipeline {pipeline_id} not registered for monitoring")
+        if not window_seconds > 0:
+            raise ValueError("window_seconds must be positive")
+        if slide_seconds is not None and not 0 < slide_seconds <= window_seconds:
+            raise ValueError("slide_seconds must be positive and no larger than window_seconds")
+        if min_samples < 1:
+            raise ValueError("min_samples must be at least 1")
+
+        with self.stream_lock:
+            self.streaming_windows[pipeline_id] = StreamingDriftWindow(
+                pipeline_id,
+                self.baseline_summaries[pipeline_id],
+                window_seconds=window_seconds,
+                slide_seconds=slide_seconds,
+                min_samples=min_samples
+            )
+
+        self.logger.info(f"🌊 Streaming window configured for {pipeline_id}: "
+                         f"window={window_seconds}s, slide={slide_seconds or window_seconds}s")
+
+    def ingest_stream(
+        self,
+        pipeline_id: str,
+        feature_values: Dict[str, Any],
+        timestamp: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Append streamed feature values to the pipeline's window.
+
+        Returns drift results for any window that closed as a result of this
+        append; windows also close on the monitoring loop when traffic stops.
+        """
+        if pipeline_id not in self.streaming_windows:
+            self.configure_stream(pipeline_id)
+
+        timestamp = timestamp or time.time()
+        with self.stream_lock:
+            window = self.streaming_windows[pipeline_id]
+            window.append(feature_values, timestamp)
+            if not window.is_due(timestamp):
+                return []
+            closed_window = window.close_pane(timestamp)
+
+        if closed_window is None:
+            return []
+        window_start, summaries = closed_window
+        return [self._emit_window_drift(pipeline_id, summaries, window_start, timestamp)]
+
+    def _flush_due_windows(self):
+        """Close streaming panes whose slide interval has elapsed."""
+        now = time.time()
+        closed = []
+
+        with self.stream_lock:
+            for pipeline_id, window in self.streaming_windows.items():
+                if window.is_due(now):
+                    closed_window = window.close_pane(now)
+                    if closed_window is not None:
+                        closed.append((pipeline_id, *closed_window))
+
+        for pipeline_id, window_start, summaries in closed:
+            self._emit_window_drift(pipeline_id, summaries, window_start, now)
+
+    def _emit_window_drift(
+        self,
+        pipeline_id: str,
+        summaries: Dict[str, FeatureDistributionSummary],
+        window_start: float,
+        window_end: float
+    ) -> Dict[str, Any]:
+        """Analyze a closed window's summaries, store metrics and raise alerts."""
+        drift_results = self.feature_analyzer.analyze_summary_drift(
+            self.baseline_summaries[pipeline_id], summaries
+        )
+
+        for metrics in drift_results.values():
+            metrics.pipeline_id = pipeline_id
+
+        if drift_results:
+            self._store_drift_metrics(drift_results)
+
+        alerts = self._generate_drift_alerts(pipeline_id, drift_results)
+        for alert in alerts:
+            self._store_alert(alert)
+
+        window_result = {
+            "pipeline_id": pipeline_id,
+            "window_start": datetime.fromtimestamp(window_start),
+            "window_end": datetime.fromtimestamp(window_end),
+            "overall_drift_score": float(np.mean([
+                metrics.drift_score for metrics in drift_results.values()
+            ])) if drift_results else 0.0,
+            "feature_drift_results": {
+                name: asdict(metrics) for name, metrics in drift_results.items()
+            },
+            "window_data_points": {name: summary.count for name, summary in summaries.items()},
+            "alerts": [asdict(alert) for alert in alerts]
+        }
+
+        self.window_results[pipeline_id].append(window_result)
+        return window_result
+
+    def get_window_results(self, pipeline_id: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """Get the most recent streaming window drift results."""
+        return list(self.window_results.get(pipeline_id, ()))[-limit:]
+
     def _store_drift_metrics(self, drift_results: Dict[str, DriftMetrics]):
         """Store drift metrics in database."""
-        with self._get_db_connection() as conn:
-            for feature_name, metrics in drift_results.items():
-                conn.execute("""
-                    INSERT INTO drift_metrics (
-                        pipeline_id, feature_name, drift_type, drift_score, p_value,
-                        test_statistic, baseline_mean, current_mean, baseline_std,
-                        current_std, timestamp
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    metrics.pipeline_id,
-                    metrics.feature_name,
-                    metrics.drift_type,
-                    metrics.drift_score,
-                    metrics.p_value,
-                    metrics.test_statistic,
-                    metrics.baseline_mean,
-                    metrics.current_mean,
-                    metrics.baseline_std,
-                    metrics.current_std,
-                    metrics.timestamp
-                ))
-            conn.commit()
+        self.db_writer.executemany("""
+            INSERT INTO drift_metrics (
+                pipeline_id, feature_name, drift_type, drift_score, p_value,
+                test_statistic, baseline_mean, current_mean, baseline_std,
+                current_std, timestamp
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, [
+            (
+                metrics.pipeline_id,
+                metrics.feature_name,
+                metrics.drift_type,
+                metrics.drift_score,
+                metrics.p_value,
+                metrics.test_statistic,
+                metrics.baseline_mean,
+                metrics.current_mean,
+                metrics.baseline_std,
+                metrics.current_std,
+                metrics.timestamp
+            ) for metrics in drift_results.values()
+        ])
 
     def _generate_drift_alerts(
         self,
@@ -692,25 +1505,23 @@ class DriftMonitoringSystem:
 
     def _store_alert(self, alert: DriftAlert):
         """Store alert in database."""
-        with self._get_db_connection() as conn:
-            conn.execute("""
-                INSERT OR IGNORE INTO drift_alerts (
-                    alert_id, alert_type, severity, pipeline_id, feature_name,
-                    drift_score, threshold_value, description, timestamp, acknowledged
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                alert.alert_id,
-                alert.alert_type,
-                alert.severity,
-                alert.pipeline_id,
-                alert.feature_name,
-                alert.drift_score,
-                alert.threshold,
-                alert.description,
-                alert.timestamp,
-                alert.acknowledged
-            ))
-            conn.commit()
+        self.db_writer.execute("""
+            INSERT OR IGNORE INTO drift_alerts (
+                alert_id, alert_type, severity, pipeline_id, feature_name,
+                drift_score, threshold_value, description, timestamp, acknowledged
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            alert.alert_id,
+            alert.alert_type,
+            alert.severity,
+            alert.pipeline_id,
+            alert.feature_name,
+            alert.drift_score,
+            alert.threshold,
+            alert.description,
+            alert.timestamp,
+            alert.acknowledged
+        ))
 
     def track_model_performance(
         self,
@@ -721,26 +1532,24 @@ class DriftMonitoringSystem:
         self.performance_monitor.track_performance(pipeline_id, performance_metrics)
 
         # Store in database
-        with self._get_db_connection() as conn:
-            conn.execute("""
-                INSERT INTO performance_metrics (
-                    pipeline_id, model_version, accuracy, precision_val, recall_val,
-                    f1_score, auc_roc, prediction_latency, throughput, error_rate, timestamp
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                performance_metrics.pipeline_id,
-                performance_metrics.model_version,
-                performance_metrics.accuracy,
-                performance_metrics.precision,
-                performance_metrics.recall,
-                performance_metrics.f1_score,
-                performance_metrics.auc_roc,
-                performance_metrics.prediction_latency,
-                performance_metrics.throughput,
-                performance_metrics.error_rate,
-                performance_metrics.timestamp
-            ))
-            conn.commit()
+        self.db_writer.execute("""
+            INSERT INTO performance_metrics (
+                pipeline_id, model_version, accuracy, precision_val, recall_val,
+                f1_score, auc_roc, prediction_latency, throughput, error_rate, timestamp
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            performance_metrics.pipeline_id,
+            performance_metrics.model_version,
+            performance_metrics.accuracy,
+            performance_metrics.precision,
+            performance_metrics.recall,
+            performance_metrics.f1_score,
+            performance_metrics.auc_roc,
+            performance_metrics.prediction_latency,
+            performance_metrics.throughput,
+            performance_metrics.error_rate,
+            performance_metrics.timestamp
+        ))
 
         # Check for performance drift
         perf_alerts = self.performance_monitor.detect_performance_drift(pipeline_id)
@@ -749,6 +1558,9 @@ class DriftMonitoringSystem:
 
     def get_pipeline_drift_summary(self, pipeline_id: str) -> Dict[str, Any]:
         """Get drift summary for a specific pipeline."""
+        # Read-your-writes: commit anything still queued before querying
+        self.db_writer.flush(timeout=5.0)
+
         with self._get_db_connection() as conn:
             # Get recent drift metrics
             cursor = conn.execute("""
@@ -829,15 +1641,22 @@ class DriftMonitoringSystem:
 
     def _monitoring_loop(self):
         """Background monitoring loop."""
+        last_maintenance = 0.0
+
         while self.running:
             try:
-                # Clean up old alerts
-                self._cleanup_old_alerts()
+                # Close streaming windows that are due even if no new data arrives
+                self._flush_due_windows()
 
-                # Check for system health
-                self._check_system_health()
+                if time.time() - last_maintenance >= 300:  # Maintenance every 5 minutes
+                    # Clean up old alerts
+                    self._cleanup_old_alerts()
 
-                time.sleep(300)  # Check every 5 minutes
+                    # Check for system health
+                    self._check_system_health()
+                    last_maintenance = time.time()
+
+                time.sleep(self.stream_check_interval)
 
             except Exception as e:
                 self.logger.error(f"Monitoring loop error: {e}")
@@ -847,12 +1666,10 @@ class DriftMonitoringSystem:
         """Clean up old acknowledged alerts."""
         cutoff_date = datetime.now() - timedelta(days=self.alert_retention_days)
 
-        with self._get_db_connection() as conn:
-            conn.execute("""
-                DELETE FROM drift_alerts
-                WHERE acknowledged = TRUE AND timestamp < ?
-            """, (cutoff_date,))
-            conn.commit()
+        self.db_writer.execute("""
+            DELETE FROM drift_alerts
+            WHERE acknowledged = TRUE AND timestamp < ?
+        """, (cutoff_date,))
 
     def _check_system_health(self):
         """Check overall system health."""
@@ -869,6 +1686,9 @@ class DriftMonitoringSystem:
         if self.monitoring_thread:
             self.monitoring_thread.join(timeout=10)
 
+        # Commit queued writes before exiting
+        self.db_writer.close()
+
         self.logger.info("🛑 Drift monitoring system stopped")
 
 # FastAPI application for drift monitoring API
@@ -900,6 +1720,17 @@ class DriftAnalysisRequest(BaseModel):
     pipeline_id: str
     current_data_size: int = 1000  # Mock data size for testing
 
+class StreamConfigRequest(BaseModel):
+    pipeline_id: str
+    window_seconds: float = 60.0
+    slide_seconds: Optional[float] = None  # Defaults to window_seconds (tumbling)
+    min_samples: int = 30
+
+class StreamIngestRequest(BaseModel):
+    pipeline_id: str
+    values: Dict[str, List[float]]  # feature_name -> new values
+    timestamp: Optional[float] = None
+
 class PerformanceTrackingRequest(BaseModel):
     pipeline_id: str
     model_version: str
@@ -952,6 +1783,41 @@ async def analyze_drift_endpoint(request: DriftAnalysisRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/v3/monitoring/stream/configure")
+async def configure_stream_endpoint(request: StreamConfigRequest):
+    """Configure streaming drift window for pipeline."""
+    try:
+        monitoring_system.configure_stream(
+            request.pipeline_id,
+            request.window_seconds,
+            request.slide_seconds,
+            request.min_samples
+        )
+        return {"success": True, "message": f"Streaming window configured for {request.pipeline_id}"}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/v3/monitoring/stream/ingest")
+async def ingest_stream_endpoint(request: StreamIngestRequest):
+    """Append streamed feature values to the pipeline's drift window."""
+    try:
+        windows = monitoring_system.ingest_stream(request.pipeline_id, request.values, request.timestamp)
+        return {"success": True, "closed_windows": windows}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/v3/monitoring/{pipeline_id}/windows")
+async def get_window_results_endpoint(pipeline_id: str, limit: int = 20):
+    """Get recent streaming window drift results for pipeline."""
+    try:
+        return {"success": True, "data": monitoring_system.get_window_results(pipeline_id, limit)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.post("/api/v3/monitoring/performance")
 async def track_performance_endpoint(request: PerformanceTrackingRequest):
     """Track model performance metrics."""
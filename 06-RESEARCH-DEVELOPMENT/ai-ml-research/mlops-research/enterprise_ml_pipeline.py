@@ -21,13 +21,16 @@ Deployment: ml.013a.tech/pipelines
 import json
 import logging
 import asyncio
+import multiprocessing
+import os
+import queue
 import threading
 import time
 import hashlib
 import pickle
 import uuid
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple, Union
+from typing import Dict, List, Any, Optional, Tuple, Union, Callable
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
 import numpy as np
@@ -41,6 +44,7 @@ import torch.nn as nn
 from torch.optim import Adam, AdamW
 from torch.optim.lr_scheduler import CosineAnnealingLR, ReduceLROnPlateau
 import torch.nn.functional as F
+from torch.utils.data import DataLoader, TensorDataset
 from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
 from sklearn.model_selection import train_test_split, cross_val_score, GridSearchCV
 from sklearn.preprocessing import StandardScaler, MinMaxScaler, RobustScaler
@@ -67,7 +71,10 @@ import uvicorn
 
 # Monitoring and Observability
 import sqlite3
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
+
+# Shared batched SQLite writer
+from sqlite_write_behind import SQLiteWriteBehind, configure_connection
 
 @dataclass
 class MLPipelineMetrics:
@@ -98,6 +105,12 @@ class KnowledgeProcessingJob:
     completed_at: Optional[datetime] = None
     error_message: Optional[str] = None
 
+class TrainingCancelledError(Exception):
+    """Raised inside train_pipeline when a job's cancel event is set."""
+
+class PipelineBusyError(Exception):
+    """Raised when a pipeline already has a training job queued or running."""
+
 @dataclass
 class ModelArtifact:
     """Model artifact with metadata."""
@@ -203,6 +216,177 @@ class AdvancedKnowledgeModel(nn.Module):
 
         return x.squeeze(1), attention_weights
 
+class DynamicBatchingInferenceServer:
+    """
+    Micro-batching inference for one deployed model.
+
+    Concurrent predict() calls are queued and coalesced by a dedicated
+    inference thread into batches of up to max_batch_size rows. A batch is
+    dispatched once it is full or max_latency_ms after its first request
+    arrived, whichever comes first, and runs under torch.inference_mode.
+
+    Instances are shape-checked before they are queued, so one malformed
+    request can't fail the batch it would have been joined with.
+    """
+
+    def __init__(
+        self,
+        model: nn.Module,
+        device: torch.device,
+        input_dim: Optional[int] = None,
+        max_batch_size: int = 64,
+        max_latency_ms: float = 5.0,
+        num_threads: Optional[int] = None,
+        metrics_callback: Optional[Callable[[Dict[str, float]], None]] = None,
+        metrics_interval: float = 60.0
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.model = model.eval()
+        self.device = device
+        self.input_dim = input_dim
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency_ms / 1000.0
+        self.metrics_callback = metrics_callback
+        self.metrics_interval = metrics_interval
+
+        if num_threads:
+            torch.set_num_threads(num_threads)  # Intra-op threads are process-wide in torch
+
+        self.request_queue: queue.Queue = queue.Queue()
+        self.latencies = deque(maxlen=10000)
+        self.stats = {"requests": 0, "rows": 0, "batches": 0, "errors": 0}
+        self.started_at = time.time()
+        self.window_started_at = time.time()
+        self.window_rows = 0
+
+        # Guards running against enqueues so nothing is queued after the loop drains
+        self.state_lock = threading.Lock()
+        self.running = True
+        self.inference_thread = threading.Thread(target=self._inference_loop, daemon=True)
+        self.inference_thread.start()
+
+    async def predict(self, instances: np.ndarray) -> np.ndarray:
+        """Queue instances for the next micro-batch and await their predictions."""
+        instances = np.atleast_2d(np.asarray(instances, dtype=np.float32))
+        if instances.ndim != 2:
+            raise ValueError(f"Expected a 2-D array of instances, got shape {instances.shape}")
+        if self.input_dim is not None and instances.shape[1] != self.input_dim:
+            raise ValueError(f"Expected {self.input_dim} features per instance, got {instances.shape[1]}")
+
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        with self.state_lock:
+            if not self.running:
+                raise RuntimeError("Inference server is stopped")
+            self.request_queue.put((instances, future, time.perf_counter()))
+        return await asyncio.wrap_future(future)
+
+    def get_stats(self) -> Dict[str, float]:
+        """Latency percentiles (ms), throughput (rows/s) and batching efficiency."""
+        latencies = np.fromiter(self.latencies, dtype=np.float64) * 1000.0
+        elapsed = max(time.time() - self.started_at, 1e-9)
+
+        return {
+            "p50_latency_ms": float(np.percentile(latencies, 50)) if len(latencies) else 0.0,
+            "p99_latency_ms": float(np.percentile(latencies, 99)) if len(latencies) else 0.0,
+            "throughput_rows_per_s": self.stats["rows"] / elapsed,
+            "avg_batch_rows": self.stats["rows"] / max(self.stats["batches"], 1),
+            **self.stats
+        }
+
+    def stop(self):
+        """Stop accepting requests and stop the inference thread after draining the queue."""
+        with self.state_lock:
+            self.running = False
+        self.inference_thread.join(timeout=5)
+
+    def _inference_loop(self):
+        """Collect requests until the batch is full or the first request's deadline passes."""
+        while self.running or not self.request_queue.empty():
+            try:
+                first = self.request_queue.get(timeout=0.1)
+            except queue.Empty:
+                self._maybe_report_metrics()
+                continue
+
+            # A request whose caller was cancelled while queued is dropped, not run
+            if not first[1].set_running_or_notify_cancel():
+                continue
+
+            batch = [first]
+            try:
+                rows = len(first[0])
+                deadline = first[2] + self.max_latency
+
+                while rows < self.max_batch_size:
+                    # Requests already waiting are always taken; only new arrivals are bounded by the deadline
+                    remaining = deadline - time.perf_counter()
+                    try:
+                        if remaining > 0:
+                            request = self.request_queue.get(timeout=remaining)
+                        else:
+                            request = self.request_queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if not request[1].set_running_or_notify_cancel():
+                        continue
+                    batch.append(request)
+                    rows += len(request[0])
+
+                self._run_batch(batch)
+                self._maybe_report_metrics()
+            except Exception as e:
+                # Keep serving: fail this batch's requests rather than the thread
+                self.logger.error(f"Inference loop error: {e}")
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+    def _run_batch(self, batch: List[Tuple[np.ndarray, concurrent.futures.Future, float]]):
+        """Run one forward pass for the batch and resolve each request's future (all in RUNNING state)."""
+        try:
+            inputs = torch.from_numpy(np.concatenate([request[0] for request in batch])).to(self.device)
+
+            with torch.inference_mode():
+                outputs = self.model(inputs)
+                if isinstance(outputs, tuple):
+                    outputs = outputs[0]
+
+            predictions = outputs.float().cpu().numpy()
+        except Exception as e:
+            self.stats["errors"] += len(batch)
+            self.logger.error(f"Inference batch failed: {e}")
+            for _, future, _ in batch:
+                future.set_exception(e)
+            return
+
+        finished_at = time.perf_counter()
+        offset = 0
+        for instances, future, enqueued_at in batch:
+            future.set_result(predictions[offset:offset + len(instances)])
+            offset += len(instances)
+            self.latencies.append(finished_at - enqueued_at)
+
+        self.stats["requests"] += len(batch)
+        self.stats["rows"] += offset
+        self.stats["batches"] += 1
+        self.window_rows += offset
+
+    def _maybe_report_metrics(self):
+        """Periodically hand latency/throughput over the last interval to the callback."""
+        now = time.time()
+        if not self.metrics_callback or now - self.window_started_at < self.metrics_interval:
+            return
+
+        stats = self.get_stats()
+        stats["throughput_rows_per_s"] = self.window_rows / (now - self.window_started_at)
+        self.window_started_at = now
+        self.window_rows = 0
+
+        try:
+            self.metrics_callback(stats)
+        except Exception as e:
+            self.logger.error(f"Inference metrics callback failed: {e}")
+
 class MLPipelineOrchestrator:
     """Orchestrator for enterprise ML pipelines with full lifecycle management."""
 
@@ -221,6 +405,7 @@ class MLPipelineOrchestrator:
         self.active_pipelines = {}
         self.model_registry = {}
         self.job_queue = deque()
+        self.inference_servers: Dict[str, DynamicBatchingInferenceServer] = {}
         self.metrics_database = self.workspace_dir / "metrics.db"
 
         # MLflow integration
@@ -243,6 +428,7 @@ class MLPipelineOrchestrator:
 
         # Initialize database
         self._initialize_database()
+        self.db_writer = SQLiteWriteBehind(self.metrics_database)
 
         self.logger.info("🏢 Enterprise ML Pipeline Orchestrator initialized")
 
@@ -273,6 +459,8 @@ class MLPipelineOrchestrator:
     def _initialize_database(self):
         """Initialize SQLite database for metrics and job tracking."""
         with sqlite3.connect(self.metrics_database) as conn:
+            configure_connection(conn)
+
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS pipeline_metrics (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -301,12 +489,23 @@ class MLPipelineOrchestrator:
                 )
             """)
 
+            # Indexes for per-pipeline and time-window metric queries
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_pipeline_metrics_pipeline_time
+                ON pipeline_metrics (pipeline_id, timestamp)
+            """)
+
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_pipeline_metrics_time
+                ON pipeline_metrics (timestamp)
+            """)
+
             conn.commit()
 
     @contextmanager
     def _get_db_connection(self):
         """Context manager for database connections."""
-        conn = sqlite3.connect(self.metrics_database)
+        conn = configure_connection(sqlite3.connect(self.metrics_database))
         try:
             yield conn
         finally:
@@ -373,6 +572,56 @@ class MLPipelineOrchestrator:
             self.logger.error(f"❌ Failed to create pipeline: {e}")
             raise
 
+    def restore_pipeline(self, pipeline_spec: Dict[str, Any]) -> str:
+        """Rebuild a pipeline from its saved configuration, e.g. inside a training worker process."""
+        pipeline_id = pipeline_spec["pipeline_id"]
+        model = self._create_model(pipeline_spec["model_config"])
+
+        self.active_pipelines[pipeline_id] = {
+            "pipeline_id": pipeline_id,
+            "name": pipeline_spec["name"],
+            "model_config": pipeline_spec["model_config"],
+            "training_config": pipeline_spec["training_config"],
+            "deployment_config": pipeline_spec["deployment_config"],
+            "model": model,
+            "training_pipeline": self._setup_training_pipeline(model, pipeline_spec["training_config"]),
+            "status": "created",
+            "created_at": datetime.now(),
+            "workspace_dir": pipeline_spec["workspace_dir"]
+        }
+
+        return pipeline_id
+
+    def get_pipeline_spec(self, pipeline_id: str) -> Dict[str, Any]:
+        """Picklable description of a pipeline for rebuilding it in another process."""
+        pipeline = self.active_pipelines[pipeline_id]
+        return {
+            "pipeline_id": pipeline_id,
+            "name": pipeline["name"],
+            "model_config": pipeline["model_config"],
+            "training_config": pipeline["training_config"],
+            "deployment_config": pipeline["deployment_config"],
+            "workspace_dir": pipeline["workspace_dir"],
+            "workspace_root": str(self.workspace_dir),
+            "enable_mlflow": self.enable_mlflow
+        }
+
+    def apply_training_result(self, pipeline_id: str, result: Dict[str, Any]):
+        """Register the artifact of a training run that executed in a worker process."""
+        pipeline = self.active_pipelines[pipeline_id]
+        model_artifact = ModelArtifact(**result["model_artifact"])
+
+        try:
+            state_dict = torch.load(model_artifact.model_path, map_location=self.device)
+            pipeline["model"].load_state_dict(state_dict)
+        except Exception as e:
+            self.logger.warning(f"Could not load trained weights for pipeline {pipeline_id}: {e}")
+
+        self.model_registry[model_artifact.model_id] = model_artifact
+        pipeline["status"] = "trained"
+        pipeline["model_artifact"] = model_artifact
+        pipeline["training_history"] = result["training_history"]
+
     def _validate_pipeline_configs(
         self,
         model_config: Dict[str, Any],
@@ -476,9 +725,16 @@ class MLPipelineOrchestrator:
         pipeline_id: str,
         training_data: np.ndarray,
         target_data: np.ndarray,
-        validation_split: float = 0.2
+        validation_split: float = 0.2,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        cancel_event: Optional[Any] = None
     ) -> Dict[str, Any]:
-        """Train ML pipeline with comprehensive tracking."""
+        """
+        Train ML pipeline with comprehensive tracking.
+
+        progress_callback receives per-epoch metrics; cancel_event (any object
+        with is_set()) is checked at each epoch boundary.
+        """
         if pipeline_id not in self.active_pipelines:
             raise ValueError(f"Pipeline {pipeline_id} not found")
 
@@ -503,18 +759,19 @@ class MLPipelineOrchestrator:
                 random_state=42
             )
 
-            # Convert to tensors
-            X_train_tensor = torch.FloatTensor(X_train).to(self.device)
-            X_val_tensor = torch.FloatTensor(X_val).to(self.device)
-            y_train_tensor = torch.FloatTensor(y_train).to(self.device)
-            y_val_tensor = torch.FloatTensor(y_val).to(self.device)
-
             # Training configuration
             optimizer = training_pipeline["optimizer"]
             scheduler = training_pipeline["scheduler"]
             loss_fn = training_pipeline["loss_fn"]
             batch_size = training_pipeline["batch_size"]
             epochs = training_pipeline["epochs"]
+            training_config = pipeline["training_config"]
+
+            # Batches stay on the host and are copied to the device per step
+            train_loader, train_eval_loader, val_loader = self._create_data_loaders(
+                X_train, X_val, y_train, y_val, batch_size, training_config
+            )
+            mixed_precision = training_config.get("mixed_precision", False)
 
             # Training history
             training_history = {
@@ -527,15 +784,17 @@ class MLPipelineOrchestrator:
             best_val_loss = float('inf')
 
             for epoch in range(epochs):
+                if cancel_event is not None and cancel_event.is_set():
+                    raise TrainingCancelledError(f"Training cancelled at epoch {epoch}/{epochs}")
+
                 # Training phase
                 train_loss = self._train_epoch(
-                    model, X_train_tensor, y_train_tensor,
-                    optimizer, loss_fn, batch_size
+                    model, train_loader, optimizer, loss_fn, mixed_precision
                 )
 
                 # Validation phase
                 val_loss = self._validate_epoch(
-                    model, X_val_tensor, y_val_tensor, loss_fn
+                    model, val_loader, loss_fn, mixed_precision
                 )
 
                 # Update scheduler
@@ -561,6 +820,16 @@ class MLPipelineOrchestrator:
                         "learning_rate": optimizer.param_groups[0]['lr']
                     }, step=epoch)
 
+                if progress_callback:
+                    progress_callback({
+                        "epoch": epoch + 1,
+                        "epochs": epochs,
+                        "train_loss": train_loss,
+                        "val_loss": val_loss,
+                        "best_val_loss": best_val_loss,
+                        "learning_rate": optimizer.param_groups[0]['lr']
+                    })
+
                 if epoch % 10 == 0:
                     self.logger.info(
                         f"Epoch {epoch}/{epochs}: "
@@ -569,14 +838,9 @@ class MLPipelineOrchestrator:
 
             training_time = time.time() - start_time
 
-            # Final evaluation
-            model.eval()
-            with torch.no_grad():
-                train_predictions = model(X_train_tensor)[0] if isinstance(model(X_train_tensor), tuple) else model(X_train_tensor)
-                val_predictions = model(X_val_tensor)[0] if isinstance(model(X_val_tensor), tuple) else model(X_val_tensor)
-
-                train_mse = F.mse_loss(train_predictions.squeeze(), y_train_tensor).item()
-                val_mse = F.mse_loss(val_predictions.squeeze(), y_val_tensor).item()
+            # Final evaluation: one batched forward pass per split
+            train_mse = self._validate_epoch(model, train_eval_loader, F.mse_loss, mixed_precision)
+            val_mse = self._validate_epoch(model, val_loader, F.mse_loss, mixed_precision)
 
             # Create model artifact
             model_artifact = ModelArtifact(
@@ -592,7 +856,7 @@ class MLPipelineOrchestrator:
                     "training_time": training_time
                 },
                 hyperparameters=pipeline["training_config"],
-                training_data_hash=hashlib.md5(str(training_data).encode()).hexdigest()[:16],
+                training_data_hash=self._hash_training_arrays(training_data, target_data),
                 deployment_ready=True
             )
 
@@ -645,81 +909,146 @@ class MLPipelineOrchestrator:
             self.logger.error(f"❌ Training failed for pipeline {pipeline_id}: {e}")
             raise
 
+    def _create_data_loaders(
+        self,
+        X_train: np.ndarray,
+        X_val: np.ndarray,
+        y_train: np.ndarray,
+        y_val: np.ndarray,
+        batch_size: int,
+        training_config: Dict[str, Any]
+    ) -> Tuple[DataLoader, DataLoader, DataLoader]:
+        """Build shuffled training and sequential evaluation loaders over host tensors."""
+        def as_tensor(array: np.ndarray) -> torch.Tensor:
+            # Zero-copy when the split is already contiguous float32
+            return torch.from_numpy(np.ascontiguousarray(array, dtype=np.float32))
+
+        train_dataset = TensorDataset(as_tensor(X_train), as_tensor(y_train))
+        val_dataset = TensorDataset(as_tensor(X_val), as_tensor(y_val))
+
+        loader_options = {
+            "num_workers": training_config.get("num_workers", 0),
+            "pin_memory": self.device.type == "cuda"
+        }
+        eval_batch_size = training_config.get("eval_batch_size", batch_size * 8)
+
+        generator = torch.Generator()
+        generator.manual_seed(training_config.get("seed", 42))
+
+        train_loader = DataLoader(
+            train_dataset,
+            batch_size=batch_size,
+            shuffle=True,
+            generator=generator,
+            drop_last=len(train_dataset) > batch_size,  # A trailing batch of one breaks BatchNorm
+            **loader_options
+        )
+        train_eval_loader = DataLoader(train_dataset, batch_size=eval_batch_size, **loader_options)
+        val_loader = DataLoader(val_dataset, batch_size=eval_batch_size, **loader_options)
+
+        return train_loader, train_eval_loader, val_loader
+
+    def _autocast(self, mixed_precision: bool):
+        """bfloat16 autocast context when mixed precision is enabled on CPU/CUDA."""
+        if mixed_precision and self.device.type in ("cpu", "cuda"):
+            return torch.autocast(device_type=self.device.type, dtype=torch.bfloat16)
+        return nullcontext()
+
+    def _hash_training_arrays(self, *arrays: np.ndarray, chunk_rows: int = 65536) -> str:
+        """Streaming content hash over the full bytes, dtype and shape of the training arrays."""
+        digest = hashlib.blake2b(digest_size=8)
+
+        for array in arrays:
+            array = np.asarray(array)
+            digest.update(f"{array.dtype.str}{array.shape}".encode())
+
+            rows = array.reshape(len(array), -1) if array.ndim else array.reshape(1, 1)
+            for start in range(0, len(rows), chunk_rows):
+                digest.update(np.ascontiguousarray(rows[start:start + chunk_rows]).data)
+
+        return digest.hexdigest()
+
     def _train_epoch(
         self,
         model: nn.Module,
-        X: torch.Tensor,
-        y: torch.Tensor,
+        loader: DataLoader,
         optimizer,
         loss_fn,
-        batch_size: int
+        mixed_precision: bool = False
     ) -> float:
         """Train for one epoch."""
         model.train()
         total_loss = 0.0
         num_batches = 0
+        non_blocking = self.device.type == "cuda"
 
-        for i in range(0, len(X), batch_size):
-            batch_X = X[i:i+batch_size]
-            batch_y = y[i:i+batch_size]
+        for batch_X, batch_y in loader:
+            batch_X = batch_X.to(self.device, non_blocking=non_blocking)
+            batch_y = batch_y.to(self.device, non_blocking=non_blocking)
 
-            optimizer.zero_grad()
+            optimizer.zero_grad(set_to_none=True)
 
             # Forward pass
-            outputs = model(batch_X)
-            if isinstance(outputs, tuple):
-                outputs = outputs[0]  # Take first output if tuple (attention weights)
+            with self._autocast(mixed_precision):
+                outputs = model(batch_X)
+                if isinstance(outputs, tuple):
+                    outputs = outputs[0]  # Take first output if tuple (attention weights)
 
-            loss = loss_fn(outputs.squeeze(), batch_y)
+            loss = loss_fn(outputs.float().squeeze(), batch_y)
             loss.backward()
             optimizer.step()
 
             total_loss += loss.item()
             num_batches += 1
 
-        return total_loss / num_batches
+        return total_loss / max(num_batches, 1)
 
     def _validate_epoch(
         self,
         model: nn.Module,
-        X: torch.Tensor,
-        y: torch.Tensor,
-        loss_fn
+        loader: DataLoader,
+        loss_fn,
+        mixed_precision: bool = False
     ) -> float:
-        """Validate for one epoch."""
+        """Sample-weighted mean loss over a split, evaluated in batches."""
         model.eval()
         total_loss = 0.0
+        total_samples = 0
+        non_blocking = self.device.type == "cuda"
 
-        with torch.no_grad():
-            outputs = model(X)
-            if isinstance(outputs, tuple):
-                outputs = outputs[0]
+        with torch.inference_mode(), self._autocast(mixed_precision):
+            for batch_X, batch_y in loader:
+                batch_X = batch_X.to(self.device, non_blocking=non_blocking)
+                batch_y = batch_y.to(self.device, non_blocking=non_blocking)
 
-            loss = loss_fn(outputs.squeeze(), y)
-            total_loss = loss.item()
+                outputs = model(batch_X)
+                if isinstance(outputs, tuple):
+                    outputs = outputs[0]
 
-        return total_loss
+                loss = loss_fn(outputs.float().squeeze(), batch_y)
+                total_loss += loss.item() * len(batch_X)
+                total_samples += len(batch_X)
+
+        return total_loss / max(total_samples, 1)
 
     def _store_metrics(self, metrics: MLPipelineMetrics):
         """Store metrics in database."""
-        with self._get_db_connection() as conn:
-            conn.execute("""
-                INSERT INTO pipeline_metrics (
-                    pipeline_id, model_accuracy, training_time, inference_latency,
-                    memory_usage, throughput, data_drift_score, model_drift_score, timestamp
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                metrics.pipeline_id,
-                metrics.model_accuracy,
-                metrics.training_time,
-                metrics.inference_latency,
-                metrics.memory_usage,
-                metrics.throughput,
-                metrics.data_drift_score,
-                metrics.model_drift_score,
-                metrics.timestamp
-            ))
-            conn.commit()
+        self.db_writer.execute("""
+            INSERT INTO pipeline_metrics (
+                pipeline_id, model_accuracy, training_time, inference_latency,
+                memory_usage, throughput, data_drift_score, model_drift_score, timestamp
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            metrics.pipeline_id,
+            metrics.model_accuracy,
+            metrics.training_time,
+            metrics.inference_latency,
+            metrics.memory_usage,
+            metrics.throughput,
+            metrics.data_drift_score,
+            metrics.model_drift_score,
+            metrics.timestamp
+        ))
 
     def deploy_pipeline(
         self,
@@ -768,16 +1097,75 @@ class MLPipelineOrchestrator:
         pipeline: Dict[str, Any],
         model_artifact: ModelArtifact
     ) -> Dict[str, Any]:
-        """Deploy pipeline locally."""
-        endpoint_url = f"http://localhost:800{len(self.active_pipelines) % 10}/predict"
+        """Deploy pipeline locally behind a dynamic-batching inference server."""
+        pipeline_id = pipeline["pipeline_id"]
+        deployment_config = pipeline["deployment_config"]
+
+        # Serve the best checkpoint rather than the last-epoch weights held in memory
+        model = self._create_model(pipeline["model_config"])
+        model.load_state_dict(torch.load(model_artifact.model_path, map_location=self.device))
+
+        if pipeline_id in self.inference_servers:
+            self.inference_servers.pop(pipeline_id).stop()
+
+        server = DynamicBatchingInferenceServer(
+            model,
+            self.device,
+            input_dim=pipeline["model_config"]["input_dim"],
+            max_batch_size=deployment_config.get("max_batch_size", 64),
+            max_latency_ms=deployment_config.get("max_batch_latency_ms", 5.0),
+            num_threads=deployment_config.get("inference_threads"),
+            metrics_callback=lambda stats: self._record_inference_metrics(pipeline_id, stats),
+            metrics_interval=deployment_config.get("metrics_interval", 60.0)
+        )
+        self.inference_servers[pipeline_id] = server
+
+        port = deployment_config.get("port", 8002)
+        endpoint_url = f"http://localhost:{port}/api/v3/pipelines/{pipeline_id}/predict"
 
         return {
             "deployment_target": "local",
             "endpoint_url": endpoint_url,
             "model_path": model_artifact.model_path,
+            "max_batch_size": server.max_batch_size,
+            "max_batch_latency_ms": server.max_latency * 1000.0,
             "status": "active"
         }
 
+    def _record_inference_metrics(self, pipeline_id: str, stats: Dict[str, float]):
+        """Store serving latency (p50, ms) and throughput (rows/s) for a deployed pipeline."""
+        pipeline = self.active_pipelines.get(pipeline_id, {})
+        model_artifact = pipeline.get("model_artifact")
+
+        self.logger.info(
+            f"📈 Inference {pipeline_id}: p50={stats['p50_latency_ms']:.2f}ms "
+            f"p99={stats['p99_latency_ms']:.2f}ms throughput={stats['throughput_rows_per_s']:.1f} rows/s"
+        )
+
+        self._store_metrics(MLPipelineMetrics(
+            pipeline_id=pipeline_id,
+            model_accuracy=1.0 - model_artifact.performance_metrics["val_mse"] if model_artifact else 0.0,
+            training_time=model_artifact.performance_metrics["training_time"] if model_artifact else 0.0,
+            inference_latency=stats["p50_latency_ms"],
+            memory_usage=torch.cuda.memory_allocated() if torch.cuda.is_available() else 0,
+            throughput=stats["throughput_rows_per_s"],
+            data_drift_score=0.0,
+            model_drift_score=0.0,
+            feature_importance={}
+        ))
+
+    def get_inference_stats(self, pipeline_id: str) -> Dict[str, Any]:
+        """Live serving statistics for a locally deployed pipeline."""
+        if pipeline_id not in self.inference_servers:
+            raise ValueError(f"Pipeline {pipeline_id} is not served locally")
+        return self.inference_servers[pipeline_id].get_stats()
+
+    def stop_inference_servers(self):
+        """Stop all local inference servers."""
+        for server in self.inference_servers.values():
+            server.stop()
+        self.inference_servers.clear()
+
     def _deploy_to_vertex_ai(
         self,
         pipeline: Dict[str, Any],
@@ -841,6 +1229,8 @@ class MLPipelineOrchestrator:
 
     def get_system_metrics(self) -> Dict[str, Any]:
         """Get comprehensive system metrics."""
+        self.db_writer.flush(timeout=5.0)
+
         with self._get_db_connection() as conn:
             cursor = conn.execute("""
                 SELECT AVG(model_accuracy), AVG(training_time), AVG(inference_latency),
@@ -872,17 +1262,341 @@ class MLPipelineOrchestrator:
             }
         }
 
+def run_training_job(
+    pipeline_spec: Dict[str, Any],
+    training_data: np.ndarray,
+    target_data: np.ndarray,
+    validation_split: float,
+    num_threads: int,
+    progress_queue,
+    cancel_event
+):
+    """Worker-process entry point: rebuild the pipeline, train it and report over progress_queue."""
+    torch.set_num_threads(num_threads)
+
+    try:
+        worker_orchestrator = MLPipelineOrchestrator(
+            workspace_dir=pipeline_spec["workspace_root"],
+            enable_mlflow=pipeline_spec["enable_mlflow"]
+        )
+        pipeline_id = worker_orchestrator.restore_pipeline(pipeline_spec)
+
+        result = worker_orchestrator.train_pipeline(
+            pipeline_id,
+            training_data,
+            target_data,
+            validation_split,
+            progress_callback=lambda progress: progress_queue.put({"type": "progress", **progress}),
+            cancel_event=cancel_event
+        )
+
+        worker_orchestrator.db_writer.close()
+        progress_queue.put({"type": "completed", "result": result})
+
+    except TrainingCancelledError as e:
+        progress_queue.put({"type": "cancelled", "error": str(e)})
+    except Exception as e:
+        progress_queue.put({"type": "failed", "error": str(e)})
+
+class TrainingJobManager:
+    """
+    Runs training jobs in worker processes under a CPU budget.
+
+    Submitted jobs wait in the orchestrator's job_queue until enough of the
+    budget is free; each running job gets its own process with torch limited
+    to the job's CPU share. Per-epoch progress is streamed back over a
+    multiprocessing queue and exposed through get_job_status().
+    """
+
+    def __init__(
+        self,
+        orchestrator: MLPipelineOrchestrator,
+        cpu_budget: Optional[int] = None,
+        default_job_cpus: Optional[int] = None,
+        poll_interval: float = 0.2
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.orchestrator = orchestrator
+        self.cpu_budget = cpu_budget or os.cpu_count() or 1
+        self.default_job_cpus = default_job_cpus or max(1, self.cpu_budget // orchestrator.max_concurrent_jobs)
+        self.poll_interval = poll_interval
+
+        # Spawn keeps workers independent of the server's threads and torch state
+        self.mp_context = multiprocessing.get_context("spawn")
+
+        self.jobs: Dict[str, KnowledgeProcessingJob] = {}
+        self.job_progress: Dict[str, Dict[str, Any]] = {}
+        self.job_inputs: Dict[str, Tuple[np.ndarray, np.ndarray, float]] = {}
+        self.job_cpus: Dict[str, int] = {}
+        self.cancel_events: Dict[str, Any] = {}
+        self.processes: Dict[str, Any] = {}
+        self.running_tasks: Dict[str, asyncio.Task] = {}
+        self.cpus_in_use = 0
+
+    def submit(
+        self,
+        pipeline_id: str,
+        training_data: np.ndarray,
+        target_data: np.ndarray,
+        validation_split: float = 0.2,
+        cpus: Optional[int] = None
+    ) -> str:
+        """Queue a training job and return its job id. Must be called from the event loop."""
+        if pipeline_id not in self.orchestrator.active_pipelines:
+            raise ValueError(f"Pipeline {pipeline_id} not found")
+        if cpus is not None and cpus < 1:
+            raise ValueError("cpus must be at least 1")
+
+        # Jobs for one pipeline share its workspace (best_model.pt) and status
+        active_job = next((
+            job for job in self.jobs.values()
+            if job.pipeline_id == pipeline_id and job.status not in ("completed", "failed", "cancelled")
+        ), None)
+        if active_job is not None:
+            raise PipelineBusyError(f"Pipeline {pipeline_id} already has active training job {active_job.job_id}")
+
+        job_id = f"train_{pipeline_id}_{uuid.uuid4().hex[:8]}"
+        pipeline = self.orchestrator.active_pipelines[pipeline_id]
+
+        job = KnowledgeProcessingJob(
+            job_id=job_id,
+            pipeline_id=pipeline_id,
+            input_data_path="in-memory",
+            output_path=pipeline["workspace_dir"],
+            processing_config={"validation_split": validation_split, "samples": len(training_data)}
+        )
+
+        self.jobs[job_id] = job
+        self.job_inputs[job_id] = (training_data, target_data, validation_split)
+        self.job_cpus[job_id] = min(cpus or self.default_job_cpus, self.cpu_budget)
+        self.job_progress[job_id] = {
+            "epoch": 0,
+            "epochs": pipeline["training_config"]["epochs"],
+            "history": []
+        }
+
+        self.orchestrator.job_queue.append(job_id)
+        self._store_job(job)
+        self._dispatch()
+
+        self.logger.info(f"📥 Queued training job {job_id} ({self.job_cpus[job_id]} CPUs)")
+        return job_id
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued, starting or running job."""
+        job = self.jobs.get(job_id)
+        if job is None or job.status in ("completed", "failed", "cancelled"):
+            return False
+
+        if job.status == "queued":
+            self.orchestrator.job_queue.remove(job_id)
+            self.job_inputs.pop(job_id, None)
+            self._finish_job(job, "cancelled", "Cancelled before start")
+            return True
+
+        # Starting: _run_job sees the event before spawning the worker.
+        # Running: the worker stops at the next epoch boundary.
+        self.cancel_events[job_id].set()
+        job.status = "cancelling"
+        return True
+
+    def get_job_status(self, job_id: str) -> Dict[str, Any]:
+        """Job state plus the latest streamed training progress."""
+        job = self.jobs.get(job_id)
+        if job is None:
+            return {"error": f"Job {job_id} not found"}
+
+        return {
+            **asdict(job),
+            "cpus": self.job_cpus.get(job_id),
+            "queue_position": list(self.orchestrator.job_queue).index(job_id)
+            if job.status == "queued" else None,
+            "progress": self.job_progress.get(job_id)
+        }
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        """Summaries of all known jobs."""
+        return [
+            {
+                "job_id": job.job_id,
+                "pipeline_id": job.pipeline_id,
+                "status": job.status,
+                "epoch": self.job_progress[job.job_id]["epoch"],
+                "epochs": self.job_progress[job.job_id]["epochs"],
+                "created_at": job.created_at
+            }
+            for job in self.jobs.values()
+        ]
+
+    def shutdown(self):
+        """Stop all running workers."""
+        for job_id, process in list(self.processes.items()):
+            self.cancel_events[job_id].set()
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+
+    def _dispatch(self):
+        """Start queued jobs while the CPU budget allows."""
+        queue = self.orchestrator.job_queue
+
+        while queue:
+            job_id = queue[0]
+            cpus = self.job_cpus[job_id]
+
+            if self.running_tasks and self.cpus_in_use + cpus > self.cpu_budget:
+                break
+
+            # Dequeued jobs are "starting" until _run_job spawns the worker;
+            # the cancel event exists from here so cancel() can reach them
+            queue.popleft()
+            self.jobs[job_id].status = "starting"
+            self.cancel_events[job_id] = self.mp_context.Event()
+            self.cpus_in_use += cpus
+            self.running_tasks[job_id] = asyncio.get_running_loop().create_task(self._run_job(job_id))
+
+    async def _run_job(self, job_id: str):
+        """Run one job in a worker process and relay its progress."""
+        job = self.jobs[job_id]
+        training_data, target_data, validation_split = self.job_inputs.pop(job_id)
+        pipeline = self.orchestrator.active_pipelines[job.pipeline_id]
+        cancel_event = self.cancel_events[job_id]
+
+        if cancel_event.is_set():
+            self._finish_job(job, "cancelled", "Cancelled before start")
+            self._release_job(job_id)
+            return
+
+        progress_queue = self.mp_context.Queue()
+
+        process = self.mp_context.Process(
+            target=run_training_job,
+            args=(
+                self.orchestrator.get_pipeline_spec(job.pipeline_id),
+                training_data,
+                target_data,
+                validation_split,
+                self.job_cpus[job_id],
+                progress_queue,
+                cancel_event
+            ),
+            daemon=True
+        )
+
+        job.status = "running"
+        job.started_at = datetime.now()
+        pipeline["status"] = "training"
+        self._store_job(job)
+
+        outcome = None
+        try:
+            process.start()
+            self.processes[job_id] = process
+
+            while outcome is None:
+                outcome = self._drain_progress(job_id, progress_queue)
+                if outcome is None and not process.is_alive():
+                    outcome = self._drain_progress(job_id, progress_queue) or {
+                        "type": "failed",
+                        "error": f"Worker exited with code {process.exitcode}"
+                    }
+                    break
+                await asyncio.sleep(self.poll_interval)
+
+            await asyncio.get_running_loop().run_in_executor(None, process.join, 10)
+
+            if outcome["type"] == "completed":
+                self.orchestrator.apply_training_result(job.pipeline_id, outcome["result"])
+                self.job_progress[job_id]["training_metrics"] = outcome["result"]["training_metrics"]
+                self._finish_job(job, "completed")
+            else:
+                pipeline["status"] = "created" if "model_artifact" not in pipeline else "trained"
+                self._finish_job(job, outcome["type"], outcome.get("error"))
+
+        except Exception as e:
+            pipeline["status"] = "created" if "model_artifact" not in pipeline else "trained"
+            self._finish_job(job, "failed", str(e))
+            if process.is_alive():
+                process.terminate()
+
+        finally:
+            self._release_job(job_id)
+
+    def _release_job(self, job_id: str):
+        """Free a finished job's CPUs and worker handles, then start queued jobs."""
+        self.processes.pop(job_id, None)
+        self.cancel_events.pop(job_id, None)
+        self.running_tasks.pop(job_id, None)
+        self.cpus_in_use -= self.job_cpus[job_id]
+        self._dispatch()
+
+    def _drain_progress(self, job_id: str, progress_queue) -> Optional[Dict[str, Any]]:
+        """Apply queued progress messages; return the terminal message if one arrived."""
+        progress = self.job_progress[job_id]
+
+        while True:
+            try:
+                message = progress_queue.get_nowait()
+            except Exception:  # queue.Empty
+                return None
+
+            if message["type"] != "progress":
+                return message
+
+            progress.update({key: value for key, value in message.items() if key != "type"})
+            progress["history"].append({
+                "epoch": message["epoch"],
+                "train_loss": message["train_loss"],
+                "val_loss": message["val_loss"]
+            })
+
+    def _finish_job(self, job: KnowledgeProcessingJob, status: str, error_message: Optional[str] = None):
+        """Record a job's terminal state."""
+        job.status = status
+        job.completed_at = datetime.now()
+        job.error_message = error_message
+        self._store_job(job)
+
+        self.logger.info(f"🏁 Training job {job.job_id} {status}"
+                         + (f": {error_message}" if error_message else ""))
+
+    def _store_job(self, job: KnowledgeProcessingJob):
+        """Persist job state to the processing_jobs table."""
+        self.orchestrator.db_writer.execute("""
+            INSERT OR REPLACE INTO processing_jobs (
+                job_id, pipeline_id, status, created_at, started_at, completed_at, error_message
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (
+            job.job_id,
+            job.pipeline_id,
+            job.status,
+            job.created_at,
+            job.started_at,
+            job.completed_at,
+            job.error_message
+        ))
+
 # FastAPI application for enterprise ML pipeline API
 app = FastAPI(title="Enterprise ML Pipeline System", version="3.0")
 
-# Global orchestrator instance
+# Global orchestrator and training job manager instances
 orchestrator = None
+job_manager = None
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize orchestrator on startup."""
-    global orchestrator
+    global orchestrator, job_manager
     orchestrator = MLPipelineOrchestrator()
+    job_manager = TrainingJobManager(orchestrator)
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop training workers and inference servers on shutdown."""
+    if job_manager:
+        job_manager.shutdown()
+    if orchestrator:
+        orchestrator.stop_inference_servers()
 
 class PipelineCreateRequest(BaseModel):
     pipeline_name: str
@@ -906,11 +1620,15 @@ class TrainingRequest(BaseModel):
     pipeline_id: str
     training_data_size: int = 1000  # Mock data size
     validation_split: float = 0.2
+    cpus: Optional[int] = None  # Share of the training CPU budget; defaults per manager
 
 class DeploymentRequest(BaseModel):
     pipeline_id: str
     deployment_target: str = "local"
 
+class PredictionRequest(BaseModel):
+    instances: List[List[float]]
+
 @app.post("/api/v3/pipelines/create")
 async def create_pipeline_endpoint(request: PipelineCreateRequest):
     """Create new ML pipeline."""
@@ -932,20 +1650,54 @@ async def create_pipeline_endpoint(request: PipelineCreateRequest):
 
 @app.post("/api/v3/pipelines/train")
 async def train_pipeline_endpoint(request: TrainingRequest):
-    """Train ML pipeline."""
+    """Queue ML pipeline training; poll the job status endpoint for progress."""
+    if request.pipeline_id not in orchestrator.active_pipelines:
+        raise HTTPException(status_code=404, detail=f"Pipeline {request.pipeline_id} not found")
+
     try:
         # Generate mock training data
-        training_data = np.random.randn(request.training_data_size, 768).astype(np.float32)
+        input_dim = orchestrator.active_pipelines[request.pipeline_id]["model_config"]["input_dim"]
+        training_data = np.random.randn(request.training_data_size, input_dim).astype(np.float32)
         target_data = np.random.randn(request.training_data_size).astype(np.float32)
 
-        result = orchestrator.train_pipeline(
+        job_id = job_manager.submit(
             request.pipeline_id,
             training_data,
             target_data,
-            request.validation_split
+            request.validation_split,
+            request.cpus
         )
 
-        return result
+        return {"success": True, "job_id": job_id, "status": "queued"}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except PipelineBusyError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/v3/pipelines/jobs")
+async def list_training_jobs_endpoint():
+    """List training jobs."""
+    try:
+        return {"success": True, "data": job_manager.list_jobs()}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/v3/pipelines/jobs/{job_id}")
+async def get_training_job_endpoint(job_id: str):
+    """Get training job status and per-epoch progress."""
+    try:
+        status = job_manager.get_job_status(job_id)
+        return {"success": "error" not in status, "data": status}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/v3/pipelines/jobs/{job_id}/cancel")
+async def cancel_training_job_endpoint(job_id: str):
+    """Cancel a queued or running training job."""
+    try:
+        return {"success": job_manager.cancel(job_id), "job_id": job_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -961,6 +1713,31 @@ async def deploy_pipeline_endpoint(request: DeploymentRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/v3/pipelines/{pipeline_id}/predict")
+async def predict_endpoint(pipeline_id: str, request: PredictionRequest):
+    """Run inference against a locally deployed pipeline."""
+    server = orchestrator.inference_servers.get(pipeline_id)
+    if server is None:
+        raise HTTPException(status_code=404, detail=f"Pipeline {pipeline_id} is not deployed locally")
+
+    try:
+        predictions = await server.predict(np.asarray(request.instances, dtype=np.float32))
+        return {"success": True, "predictions": predictions.tolist()}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/v3/pipelines/{pipeline_id}/inference/stats")
+async def get_inference_stats_endpoint(pipeline_id: str):
+    """Get serving latency and throughput for a deployed pipeline."""
+    try:
+        return {"success": True, "data": orchestrator.get_inference_stats(pipeline_id)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/api/v3/pipelines/{pipeline_id}/status")
 async def get_pipeline_status_endpoint(pipeline_id: str):
     """Get pipeline status."""
@@ -18,6 +18,7 @@ Version: v3.0 - Enterprise Production Ready
 """
 
 import asyncio
+import copy
 import logging
 import json
 import numpy as np
@@ -37,6 +38,7 @@ from pathlib import Path
 # Advanced ML Components
 from sklearn.cluster import KMeans
 from sklearn.metrics import silhouette_score
+from scipy.optimize import linear_sum_assignment
 import optuna
 from torch.optim import Adam, AdamW
 from torch.optim.lr_scheduler import CosineAnnealingLR
@@ -127,20 +129,75 @@ class CognitiveAdaptationNetwork(nn.Module):
 
         return attended_features.squeeze(1), attention_weights
 
+class ExperienceReplayBuffer:
+    """
+    Fixed-capacity ring buffer of adaptation experiences.
+
+    Features and outcomes live in preallocated NumPy arrays (allocated on the
+    first add, once the feature width is known), so appends overwrite the
+    oldest slot in O(1) and sampling is a single index gather.
+    """
+
+    def __init__(self, capacity: int = 10000):
+        self.capacity = capacity
+        self.features: Optional[np.ndarray] = None
+        self.outcomes = np.zeros(capacity, dtype=np.float32)
+        self.agent_ids = np.empty(capacity, dtype=object)
+        self.timestamps = np.zeros(capacity, dtype=np.float64)
+        self.position = 0
+        self.size = 0
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def add(self, agent_id: str, features: np.ndarray, outcome: float, timestamp: Optional[float] = None):
+        """Append one experience, overwriting the oldest when full."""
+        features = np.asarray(features, dtype=np.float32).ravel()
+
+        with self.lock:
+            if self.features is None:
+                self.features = np.zeros((self.capacity, len(features)), dtype=np.float32)
+
+            self.features[self.position] = features
+            self.outcomes[self.position] = outcome
+            self.agent_ids[self.position] = agent_id
+            self.timestamps[self.position] = timestamp or time.time()
+
+            self.position = (self.position + 1) % self.capacity
+            self.size = min(self.size + 1, self.capacity)
+
+    def sample(self, batch_size: int, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+        """Uniformly sample a batch (with replacement) as copies of the stored arrays."""
+        with self.lock:
+            indices = rng.integers(0, self.size, size=batch_size)
+            return self.features[indices], self.outcomes[indices]
+
 class NeuralCoordinationOptimizer:
     """Optimize coordination patterns using neural networks."""
 
-    def __init__(self, device='cpu'):
+    def __init__(self, device='cpu', max_optimal_cells: int = 25_000_000, priority_weight: float = 1.0):
         self.device = device
         self.coordination_history = deque(maxlen=1000)
         self.performance_tracker = defaultdict(list)
 
+        # Task x agent-slot cells above which the exact solver gives way to greedy
+        self.max_optimal_cells = max_optimal_cells
+        # Weight of task priority when capacity is scarce and not every task can be assigned
+        self.priority_weight = priority_weight
+
     def optimize_agent_allocation(
         self,
         tasks: List[CoordinationTask],
-        agents: List[AgentState]
+        agents: List[AgentState],
+        agent_capacities: Optional[List[int]] = None
     ) -> Dict[str, List[str]]:
-        """Optimize agent allocation to tasks using ML."""
+        """
+        Optimize agent allocation to tasks using ML.
+
+        Each agent takes at most agent_capacities[j] tasks (default 1); tasks
+        that do not fit are left out of the allocation and stay pending.
+        """
 
         # Create feature matrix
         task_features = self._extract_task_features(tasks)
@@ -153,7 +210,7 @@ class NeuralCoordinationOptimizer:
 
         # Optimize allocation
         allocation = self._solve_allocation_problem(
-            compatibility_matrix, tasks, agents
+            compatibility_matrix, tasks, agents, agent_capacities
         )
 
         return allocation
@@ -195,47 +252,111 @@ class NeuralCoordinationOptimizer:
         agent_features: np.ndarray
     ) -> np.ndarray:
         """Calculate compatibility matrix between tasks and agents."""
-        # Simple compatibility based on feature similarity
-        compatibility = np.zeros((len(task_features), len(agent_features)))
-
-        for i, task_feat in enumerate(task_features):
-            for j, agent_feat in enumerate(agent_features):
-                # Calculate compatibility score
-                score = 1.0 - np.linalg.norm(
-                    task_feat[:3] - agent_feat[1:4]
-                ) / np.sqrt(3)
-                compatibility[i, j] = max(0.0, score)
+        # Simple compatibility based on feature similarity:
+        # 1 - ||task[:3] - agent[1:4]|| / sqrt(3), clipped at zero
+        task_part = np.asarray(task_features, dtype=np.float64)[:, :3]
+        agent_part = np.asarray(agent_features, dtype=np.float64)[:, 1:4]
+
+        # Pairwise distances via |a|^2 + |b|^2 - 2ab, without a tasks x agents x 3 intermediate
+        squared_distance = (
+            np.einsum("ij,ij->i", task_part, task_part)[:, None]
+            + np.einsum("ij,ij->i", agent_part, agent_part)[None, :]
+            - 2.0 * task_part @ agent_part.T
+        )
+        np.maximum(squared_distance, 0.0, out=squared_distance)
 
-        return compatibility
+        compatibility = 1.0 - np.sqrt(squared_distance) / np.sqrt(3)
+        return np.maximum(compatibility, 0.0, out=compatibility)
 
     def _solve_allocation_problem(
         self,
         compatibility_matrix: np.ndarray,
         tasks: List[CoordinationTask],
-        agents: List[AgentState]
+        agents: List[AgentState],
+        agent_capacities: Optional[List[int]] = None
     ) -> Dict[str, List[str]]:
-        """Solve the allocation optimization problem."""
-        allocation = {}
+        """
+        Solve the allocation optimization problem.
+
+        Maximises total compatibility subject to per-agent capacity with the
+        Hungarian method over agent slots (each agent repeated capacity
+        times). A per-task priority bonus only decides which tasks win when
+        capacity is scarce; it never changes which agent a task prefers.
+        Problems larger than max_optimal_cells use a capacity-aware greedy.
+        """
+        if agent_capacities is None:
+            capacities = np.ones(len(agents), dtype=np.int64)
+        else:
+            capacities = np.minimum(np.asarray(agent_capacities, dtype=np.int64), len(tasks))
 
-        # Simple greedy allocation (can be enhanced with optimization algorithms)
-        for i, task in enumerate(tasks):
-            # Find best agent for this task
-            agent_scores = compatibility_matrix[i]
-            best_agent_idx = np.argmax(agent_scores)
+        priorities = np.array([task.priority for task in tasks], dtype=np.float64) / 10.0
+        scores = compatibility_matrix + self.priority_weight * priorities[:, None]
 
-            task_id = task.task_id
-            agent_id = agents[best_agent_idx].agent_id
+        slot_agents = np.repeat(np.arange(len(agents)), np.maximum(capacities, 0))
+        if len(slot_agents) == 0:
+            return {}
 
-            if task_id not in allocation:
-                allocation[task_id] = []
-            allocation[task_id].append(agent_id)
+        if len(tasks) * len(slot_agents) <= self.max_optimal_cells:
+            task_indices, slot_indices = linear_sum_assignment(scores[:, slot_agents], maximize=True)
+            agent_indices = slot_agents[slot_indices]
+        else:
+            task_indices, agent_indices = self._greedy_capacity_assignment(scores, capacities)
 
-        return allocation
+        return {
+            tasks[task_idx].task_id: [agents[agent_idx].agent_id]
+            for task_idx, agent_idx in zip(task_indices, agent_indices)
+        }
+
+    def _greedy_capacity_assignment(
+        self,
+        scores: np.ndarray,
+        capacities: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Capacity-aware greedy assignment in vectorised rounds.
+
+        Each round, every unassigned task proposes to its best agent with
+        spare capacity; each agent accepts its highest-scoring proposals up
+        to its remaining capacity.
+        """
+        remaining = capacities.astype(np.int64).copy()
+        assigned_agent = np.full(scores.shape[0], -1, dtype=np.int64)
+
+        while True:
+            open_tasks = np.flatnonzero(assigned_agent < 0)
+            open_agents = np.flatnonzero(remaining > 0)
+            if len(open_tasks) == 0 or len(open_agents) == 0:
+                break
+
+            candidate_scores = scores[np.ix_(open_tasks, open_agents)]
+            best = candidate_scores.argmax(axis=1)
+            proposal_agents = open_agents[best]
+            proposal_scores = candidate_scores[np.arange(len(open_tasks)), best]
+
+            # Rank proposals within each agent by descending score
+            order = np.lexsort((-proposal_scores, proposal_agents))
+            sorted_agents = proposal_agents[order]
+            group_starts = np.flatnonzero(np.r_[True, sorted_agents[1:] != sorted_agents[:-1]])
+            group_sizes = np.diff(np.r_[group_starts, len(sorted_agents)])
+            rank = np.arange(len(sorted_agents)) - np.repeat(group_starts, group_sizes)
+
+            accepted = order[rank < remaining[sorted_agents]]
+            assigned_agent[open_tasks[accepted]] = proposal_agents[accepted]
+            np.subtract.at(remaining, proposal_agents[accepted], 1)
+
+        task_indices = np.flatnonzero(assigned_agent >= 0)
+        return task_indices, assigned_agent[task_indices]
 
 class NeuralOrchestrator:
     """Main neural orchestration system for multi-agent coordination."""
 
-    def __init__(self, knowledge_graph_path: str = None):
+    def __init__(
+        self,
+        knowledge_graph_path: str = None,
+        replay_batch_size: int = 32,
+        replay_steps_per_cycle: int = 8,
+        learning_interval: float = 60.0
+    ):
         self.logger = logging.getLogger(__name__)
         self.device = self._detect_device()
 
@@ -243,6 +364,11 @@ class NeuralOrchestrator:
         self.cognitive_network = CognitiveAdaptationNetwork().to(self.device)
         self.coordination_optimizer = NeuralCoordinationOptimizer(self.device)
 
+        # The learning thread trains a private copy and publishes weights, so
+        # serving forwards never run against a network in train() mode
+        self.learner_network = copy.deepcopy(self.cognitive_network)
+        self.network_lock = threading.Lock()
+
         # System state
         self.agents = {}
         self.tasks = {}
@@ -252,7 +378,13 @@ class NeuralOrchestrator:
         # Learning system
         self.learning_enabled = True
         self.adaptation_rate = 0.01
-        self.experience_replay = deque(maxlen=10000)
+        self.experience_replay = ExperienceReplayBuffer(capacity=10000)
+        self.replay_batch_size = replay_batch_size
+        self.replay_steps_per_cycle = replay_steps_per_cycle
+        self.learning_interval = learning_interval
+        self.replay_rng = np.random.default_rng()
+        self.replay_optimizer = Adam(self.learner_network.parameters(), lr=self.adaptation_rate)
+        self.learning_steps = 0
 
         # Background processes
         self.running = False
@@ -419,7 +551,7 @@ class NeuralOrchestrator:
         ], dtype=torch.float32).unsqueeze(0).to(self.device)
 
         # Process through cognitive network
-        with torch.no_grad():
+        with self.network_lock, torch.no_grad():
             adapted_features, attention_weights = self.cognitive_network(input_features)
 
         # Update agent coordination score based on adaptation
@@ -427,13 +559,11 @@ class NeuralOrchestrator:
         agent.coordination_score = 0.9 * agent.coordination_score + 0.1 * adaptation_score
 
         # Store experience for replay
-        experience = {
-            "agent_id": agent_id,
-            "input_features": input_features.cpu().numpy(),
-            "performance_outcome": performance_data.get("performance_score", 0.5),
-            "timestamp": datetime.now()
-        }
-        self.experience_replay.append(experience)
+        self.experience_replay.add(
+            agent_id,
+            input_features.cpu().numpy(),
+            performance_data.get("performance_score", 0.5)
+        )
 
     def get_coordination_insights(self) -> Dict[str, Any]:
         """Get insights about current coordination state."""
@@ -461,6 +591,7 @@ class NeuralOrchestrator:
             "learning_status": {
                 "adaptation_enabled": self.learning_enabled,
                 "experience_samples": len(self.experience_replay),
+                "learning_steps": self.learning_steps,
                 "neural_parameters": sum(p.numel() for p in self.cognitive_network.parameters())
             }
         }
@@ -540,7 +671,7 @@ class NeuralOrchestrator:
                 if len(self.experience_replay) > 10:
                     self._perform_experience_replay_learning()
 
-                time.sleep(60)  # Learn every minute
+                time.sleep(self.learning_interval)
 
             except Exception as e:
                 self.logger.error(f"Learning process error: {e}")
@@ -590,43 +721,41 @@ class NeuralOrchestrator:
         if len(self.experience_replay) < 10:
             return
 
-        # Sample experiences
-        sample_size = min(32, len(self.experience_replay))
-        experiences = np.random.choice(list(self.experience_replay), size=sample_size, replace=False)
-
-        # Prepare training data
-        input_features = []
-        targets = []
+        # Train the learner copy with the persistent optimizer (moment state carries over)
+        self.learner_network.train()
+        total_loss = 0.0
 
-        for exp in experiences:
-            input_features.append(exp["input_features"])
-            targets.append(exp["performance_outcome"])
+        for _ in range(self.replay_steps_per_cycle):
+            input_features, targets = self.experience_replay.sample(self.replay_batch_size, self.replay_rng)
+            input_batch = torch.from_numpy(input_features).to(self.device)
+            target_batch = torch.from_numpy(targets).to(self.device)
 
-        input_batch = torch.tensor(
-            np.array(input_features).squeeze(),
-            dtype=torch.float32
-        ).to(self.device)
+            self.replay_optimizer.zero_grad(set_to_none=True)
+            output_features, _ = self.learner_network(input_batch)
 
-        target_batch = torch.tensor(
-            targets, dtype=torch.float32
-        ).to(self.device)
+            # Simple regression loss for performance prediction
+            predicted_performance = output_features.mean(dim=1)
+            loss = F.mse_loss(predicted_performance, target_batch)
 
-        # Training step
-        self.cognitive_network.train()
-        optimizer = Adam(self.cognitive_network.parameters(), lr=self.adaptation_rate)
+            loss.backward()
+            self.replay_optimizer.step()
+            total_loss += loss.item()
 
-        optimizer.zero_grad()
-        output_features, _ = self.cognitive_network(input_batch)
+        self.learner_network.eval()
+        self._publish_learner_weights()
+        self.learning_steps += self.replay_steps_per_cycle
 
-        # Simple regression loss for performance prediction
-        predicted_performance = output_features.mean(dim=1)
-        loss = F.mse_loss(predicted_performance, target_batch)
+        self.logger.debug(f"Experience replay learning completed, "
+                          f"loss: {total_loss / max(self.replay_steps_per_cycle, 1):.4f}")
 
-        loss.backward()
-        optimizer.step()
+    def _serving_module(self) -> nn.Module:
+        """The uncompiled module behind the serving network."""
+        return getattr(self.cognitive_network, "_orig_mod", self.cognitive_network)
 
-        self.cognitive_network.eval()
-        self.logger.debug(f"Experience replay learning completed, loss: {loss.item():.4f}")
+    def _publish_learner_weights(self):
+        """Copy learner weights into the serving network."""
+        with self.network_lock, torch.no_grad():
+            self._serving_module().load_state_dict(self.learner_network.state_dict())
 
     def stop_orchestration(self):
         """Stop the orchestration processes."""
@@ -656,6 +785,7 @@ class NeuralOrchestrator:
         try:
             model_state = torch.load(filepath, map_location=self.device)
             self.cognitive_network.load_state_dict(model_state["cognitive_network"])
+            self.learner_network.load_state_dict(self._serving_module().state_dict())
             self.performance_metrics = model_state.get("performance_metrics", {})
             self.logger.info(f"📂 Coordination model loaded from {filepath}")
         except Exception as e:
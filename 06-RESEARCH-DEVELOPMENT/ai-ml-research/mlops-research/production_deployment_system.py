@@ -52,6 +52,9 @@ import sqlite3
 from contextlib import contextmanager
 import yaml
 
+# Shared batched SQLite writer
+from sqlite_write_behind import SQLiteWriteBehind, configure_connection
+
 @dataclass
 class DeploymentEndpoint:
     """Configuration for production deployment endpoint."""
@@ -351,8 +354,9 @@ class ProductionDeploymentSystem:
             }
         }
 
-        # Initialize system
+        # Initialize system; all subsequent writes go through the write-behind queue
         self._initialize_database()
+        self.db_writer = SQLiteWriteBehind(self.database_path)
         self._setup_default_endpoints()
 
         self.logger.info("🚀 Production Deployment System initialized")
@@ -360,6 +364,8 @@ class ProductionDeploymentSystem:
     def _initialize_database(self):
         """Initialize SQLite database for deployment tracking."""
         with sqlite3.connect(self.database_path) as conn:
+            configure_connection(conn)
+
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS deployment_endpoints (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -415,7 +421,7 @@ class ProductionDeploymentSystem:
     @contextmanager
     def _get_db_connection(self):
         """Context manager for database connections."""
-        conn = sqlite3.connect(self.database_path)
+        conn = configure_connection(sqlite3.connect(self.database_path))
         try:
             yield conn
         finally:
@@ -453,27 +459,25 @@ class ProductionDeploymentSystem:
 
     def _store_endpoint(self, endpoint: DeploymentEndpoint):
         """Store endpoint configuration in database."""
-        with self._get_db_connection() as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO deployment_endpoints (
-                    endpoint_id, domain, subdomain, service_type, port,
-                    health_check_path, ssl_enabled, auto_scaling,
-                    circuit_breaker, deployment_strategy, created_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                endpoint.endpoint_id,
-                endpoint.domain,
-                endpoint.subdomain,
-                endpoint.service_type,
-                endpoint.port,
-                endpoint.health_check_path,
-                endpoint.ssl_enabled,
-                endpoint.auto_scaling,
-                endpoint.circuit_breaker,
-                endpoint.deployment_strategy,
-                endpoint.created_at
-            ))
-            conn.commit()
+        self.db_writer.execute("""
+            INSERT OR REPLACE INTO deployment_endpoints (
+                endpoint_id, domain, subdomain, service_type, port,
+                health_check_path, ssl_enabled, auto_scaling,
+                circuit_breaker, deployment_strategy, created_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            endpoint.endpoint_id,
+            endpoint.domain,
+            endpoint.subdomain,
+            endpoint.service_type,
+            endpoint.port,
+            endpoint.health_check_path,
+            endpoint.ssl_enabled,
+            endpoint.auto_scaling,
+            endpoint.circuit_breaker,
+            endpoint.deployment_strategy,
+            endpoint.created_at
+        ))
 
     def create_service_instance(
         self,
@@ -512,27 +516,25 @@ class ProductionDeploymentSystem:
 
     def _store_service_instance(self, instance: ServiceInstance):
         """Store service instance in database."""
-        with self._get_db_connection() as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO service_instances (
-                    instance_id, endpoint_id, host, port, status, health_score,
-                    cpu_usage, memory_usage, request_count, error_count,
-                    last_health_check
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                instance.instance_id,
-                instance.endpoint_id,
-                instance.host,
-                instance.port,
-                instance.status,
-                instance.health_score,
-                instance.cpu_usage,
-                instance.memory_usage,
-                instance.request_count,
-                instance.error_count,
-                instance.last_health_check
-            ))
-            conn.commit()
+        self.db_writer.execute("""
+            INSERT OR REPLACE INTO service_instances (
+                instance_id, endpoint_id, host, port, status, health_score,
+                cpu_usage, memory_usage, request_count, error_count,
+                last_health_check
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            instance.instance_id,
+            instance.endpoint_id,
+            instance.host,
+            instance.port,
+            instance.status,
+            instance.health_score,
+            instance.cpu_usage,
+            instance.memory_usage,
+            instance.request_count,
+            instance.error_count,
+            instance.last_health_check
+        ))
 
     async def deploy_service(
         self,
@@ -586,26 +588,24 @@ class ProductionDeploymentSystem:
 
     def _store_deployment(self, deployment: DeploymentStatus):
         """Store deployment status in database."""
-        with self._get_db_connection() as conn:
-            conn.execute("""
-                INSERT OR REPLACE INTO deployments (
-                    deployment_id, endpoint_id, strategy, current_version,
-                    target_version, status, progress_percentage, started_at,
-                    completed_at, error_message
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                deployment.deployment_id,
-                deployment.endpoint_id,
-                deployment.strategy,
-                deployment.current_version,
-                deployment.target_version,
-                deployment.status,
-                deployment.progress_percentage,
-                deployment.started_at,
-                deployment.completed_at,
-                deployment.error_message
-            ))
-            conn.commit()
+        self.db_writer.execute("""
+            INSERT OR REPLACE INTO deployments (
+                deployment_id, endpoint_id, strategy, current_version,
+                target_version, status, progress_percentage, started_at,
+                completed_at, error_message
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            deployment.deployment_id,
+            deployment.endpoint_id,
+            deployment.strategy,
+            deployment.current_version,
+            deployment.target_version,
+            deployment.status,
+            deployment.progress_percentage,
+            deployment.started_at,
+            deployment.completed_at,
+            deployment.error_message
+        ))
 
     async def _deploy_blue_green(
         self,
@@ -886,6 +886,9 @@ class ProductionDeploymentSystem:
         if self.monitor_thread:
             self.monitor_thread.join(timeout=10)
 
+        # Commit queued writes before exiting
+        self.db_writer.close()
+
         self.logger.info("🛑 Stopped deployment monitoring")
 
 # FastAPI application for production deployment management
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+🗄️ SQLITE WRITE-BEHIND
+======================
+
+Shared write path for the MLOps SQLite stores (drift monitoring, deployment
+tracking, pipeline metrics).
+
+Request handlers enqueue statements instead of opening a connection and
+committing per row. A single writer thread owns one long-lived connection in
+WAL mode, groups consecutive statements with the same SQL into
+`executemany` calls (sqlite3 reuses the prepared statement from the
+connection's statement cache), and commits once per batch. The queue is
+bounded, so producers block rather than grow memory when the disk falls
+behind.
+"""
+
+import logging
+import queue
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+
+def configure_connection(conn: sqlite3.Connection, busy_timeout_ms: int = 5000) -> sqlite3.Connection:
+    """Apply WAL journaling and relaxed fsync settings to a connection."""
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
+    return conn
+
+
+class SQLiteWriteBehind:
+    """Single-writer, batched write-behind queue for one SQLite database."""
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        database_path: Union[str, Path],
+        max_queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 0.05,
+        cached_statements: int = 128
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.database_path = str(database_path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.cached_statements = cached_statements
+
+        self.write_queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self.stats = {
+            "statements_written": 0,
+            "batches_committed": 0,
+            "write_errors": 0
+        }
+
+        self.writer_thread = threading.Thread(
+            target=self._writer_loop,
+            name=f"sqlite-writer-{Path(self.database_path).name}",
+            daemon=True
+        )
+        self.writer_thread.start()
+
+    def execute(self, sql: str, params: Sequence[Any] = ()):
+        """Enqueue a single statement; blocks while the queue is full."""
+        self.write_queue.put((sql, [tuple(params)]))
+
+    def executemany(self, sql: str, rows: List[Sequence[Any]]):
+        """Enqueue one statement for many parameter rows."""
+        if rows:
+            self.write_queue.put((sql, [tuple(row) for row in rows]))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until everything enqueued so far has been committed."""
+        if not self.writer_thread.is_alive():
+            return self.write_queue.empty()
+
+        done = threading.Event()
+        self.write_queue.put(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 10.0):
+        """Commit pending writes and stop the writer thread."""
+        if self.writer_thread.is_alive():
+            self.write_queue.put(self._STOP)
+            self.writer_thread.join(timeout=timeout)
+
+    def _writer_loop(self):
+        """Drain the queue in batches on a single long-lived connection."""
+        conn = configure_connection(
+            sqlite3.connect(self.database_path, cached_statements=self.cached_statements)
+        )
+        running = True
+
+        try:
+            while running:
+                try:
+                    item = self.write_queue.get(timeout=self.flush_interval)
+                except queue.Empty:
+                    continue
+
+                batch = [item]
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(self.write_queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                statements: List[Tuple[str, List[tuple]]] = []
+                flush_events = []
+
+                for entry in batch:
+                    if entry is self._STOP:
+                        running = False
+                    elif isinstance(entry, threading.Event):
+                        flush_events.append(entry)
+                    elif statements and statements[-1][0] == entry[0]:
+                        statements[-1][1].extend(entry[1])
+                    else:
+                        statements.append((entry[0], list(entry[1])))
+
+                self._write_batch(conn, statements)
+
+                for event in flush_events:
+                    event.set()
+        finally:
+            conn.close()
+
+    def _write_batch(self, conn: sqlite3.Connection, statements: List[Tuple[str, List[tuple]]]):
+        """Write grouped statements in a single transaction."""
+        if not statements:
+            return
+
+        try:
+            with conn:
+                for sql, rows in statements:
+                    conn.executemany(sql, rows)
+            self.stats["statements_written"] += sum(len(rows) for _, rows in statements)
+            self.stats["batches_committed"] += 1
+        except sqlite3.Error as e:
+            # Retry statement groups individually so one bad row doesn't drop the batch
+            self.logger.error(f"Write-behind batch failed, retrying per statement: {e}")
+            for sql, rows in statements:
+                try:
+                    with conn:
+                        conn.executemany(sql, rows)
+                    self.stats["statements_written"] += len(rows)
+                except sqlite3.Error as statement_error:
+                    self.stats["write_errors"] += len(rows)
+                    self.logger.error(f"Write-behind statement failed: {statement_error}")
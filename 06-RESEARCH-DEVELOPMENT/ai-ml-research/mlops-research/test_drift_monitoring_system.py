@@ -0,0 +1,50 @@
+"""
+Drift Monitoring System - Statistical Consistency Tests
+=======================================================
+
+The shared-sort drift scores in StatisticalDriftDetector.column_drift_scores
+must agree with scipy's reference tests.
+"""
+
+import numpy as np
+import pytest
+from scipy.stats import ks_2samp
+
+pytest.importorskip("torch")
+pytest.importorskip("fastapi")
+
+from drift_monitoring_system import KS_EXACT_MAX_N, StatisticalDriftDetector
+
+
+class TestColumnDriftScores:
+    """column_drift_scores against ks_2samp"""
+
+    @pytest.fixture
+    def detector(self):
+        return StatisticalDriftDetector()
+
+    @pytest.mark.parametrize("n_baseline,n_current", [
+        (1, 1), (5, 7), (12, 3), (50, 50), (400, 1000), (KS_EXACT_MAX_N + 500, 2000)
+    ])
+    def test_kolmogorov_smirnov_matches_ks_2samp(self, detector, n_baseline, n_current):
+        rng = np.random.default_rng(n_baseline * 7919 + n_current)
+        baseline = rng.normal(0.0, 1.0, n_baseline)
+        current = rng.normal(0.3, 1.2, n_current)
+
+        score = detector.column_drift_scores(baseline, current, ["kolmogorov_smirnov"])["kolmogorov_smirnov"]
+        reference = ks_2samp(baseline, current)
+
+        assert score["test_statistic"] == pytest.approx(reference.statistic, abs=1e-12)
+        assert score["p_value"] == pytest.approx(reference.pvalue, rel=1e-9, abs=1e-12)
+        assert np.isfinite(score["p_value"])
+
+    def test_kolmogorov_smirnov_with_ties(self, detector):
+        rng = np.random.default_rng(0)
+        baseline = rng.integers(0, 5, 40).astype(float)
+        current = rng.integers(1, 6, 30).astype(float)
+
+        score = detector.column_drift_scores(baseline, current, ["kolmogorov_smirnov"])["kolmogorov_smirnov"]
+        reference = ks_2samp(baseline, current)
+
+        assert score["test_statistic"] == pytest.approx(reference.statistic, abs=1e-12)
+        assert score["p_value"] == pytest.approx(reference.pvalue, rel=1e-9, abs=1e-12)
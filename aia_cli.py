@@ -25,7 +25,9 @@ Usage:
 
 import asyncio
 import argparse
+import hashlib
 import json
+import sqlite3
 import sys
 import time
 import os
@@ -33,81 +35,161 @@ import re
 import signal
 import threading
 import queue
-import weakref
 import inspect
 from typing import Dict, List, Any, Optional, Tuple, Union, Callable, AsyncIterator
 from datetime import datetime, timedelta
 from pathlib import Path
-from dataclasses import dataclass, field
+from types import SimpleNamespace
+from collections import OrderedDict
+from dataclasses import dataclass, field, asdict, replace
 from concurrent.futures import ThreadPoolExecutor
-from functools import lru_cache, wraps, partial
 from contextlib import asynccontextmanager
 
 import click
-import aiohttp
-from rich.console import Console, Group
+from rich.console import Console
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeRemainingColumn
 from rich.panel import Panel
-from rich.live import Live
-from rich.markdown import Markdown
-from rich.prompt import Prompt, Confirm, IntPrompt
-from rich.text import Text
-from rich.layout import Layout
-from rich.columns import Columns
-from rich.tree import Tree
-from rich.syntax import Syntax
 from rich.theme import Theme
-from rich.align import Align
-from rich.rule import Rule
 import yaml
 
-# Fuzzy matching and completion
-try:
-    from fuzzywuzzy import fuzz, process
-    FUZZY_AVAILABLE = True
-except ImportError:
-    FUZZY_AVAILABLE = False
-
-# Accessibility support
-try:
-    import pyttsx3
-    ACCESSIBILITY_TTS = True
-except ImportError:
-    ACCESSIBILITY_TTS = False
-
 # Add the project root to path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-# Import AIA processing client
-try:
-    from aia_processing_client import (
-        AIAProcessingClient,
-        ProcessingRequest,
-        ProcessingResult,
-        ProcessingType,
-        AgentType,
-        SystemStatus
-    )
-    AIA_AVAILABLE = True
-except ImportError as e:
-    click.echo(f"❌ Failed to import AIA processing client: {e}", err=True)
-    AIA_AVAILABLE = False
-
-# Import direct backend client for fallback
-try:
-    from claude_processing_client import (
-        process_with_aia_workflow,
-        process_hybrid,
-        get_system_status,
-        get_processing_client,
-        ClaudeProcessingClient,
-        ProcessingResult as LegacyProcessingResult
+# The processing client stacks are imported by load_processing_clients() on
+# first use, so --help, config and cached responses start without them
+AIA_AVAILABLE = None
+LEGACY_AIA_AVAILABLE = None
+
+
+def load_processing_clients() -> bool:
+    """Import the AIA processing client stack on first use and return AIA_AVAILABLE"""
+    global AIA_AVAILABLE, LEGACY_AIA_AVAILABLE
+    global AIAProcessingClient, ProcessingRequest, ProcessingResult, ProcessingType, AgentType, SystemStatus
+    global process_with_aia_workflow, process_hybrid, get_system_status, get_processing_client
+    global ClaudeProcessingClient, LegacyProcessingResult
+
+    if AIA_AVAILABLE is not None:
+        return AIA_AVAILABLE
+
+    # Import AIA processing client
+    try:
+        from aia_processing_client import (
+            AIAProcessingClient,
+            ProcessingRequest,
+            ProcessingResult,
+            ProcessingType,
+            AgentType,
+            SystemStatus
+        )
+        AIA_AVAILABLE = True
+    except ImportError as e:
+        click.echo(f"❌ Failed to import AIA processing client: {e}", err=True)
+        AIA_AVAILABLE = False
+
+    # Import direct backend client for fallback
+    try:
+        from claude_processing_client import (
+            process_with_aia_workflow,
+            process_hybrid,
+            get_system_status,
+            get_processing_client,
+            ClaudeProcessingClient,
+            ProcessingResult as LegacyProcessingResult
+        )
+        LEGACY_AIA_AVAILABLE = True
+    except ImportError:
+        LEGACY_AIA_AVAILABLE = False
+
+    return AIA_AVAILABLE
+
+
+def get_daemon_client() -> Optional['AIADaemonClient']:
+    """Thin client for the background daemon when use_daemon is enabled and it is running"""
+    if not config.get("use_daemon"):
+        return None
+
+    from aia_cli_daemon import AIADaemonClient
+
+    client = AIADaemonClient(config.get("daemon_socket"))
+    return client if client.is_running() else None
+
+
+def daemon_unavailable(error: Exception):
+    """Note a failed daemon call before the caller falls back to a direct connection"""
+    console.print(f"[yellow]⚠️ AIA daemon unavailable ({error}); connecting directly[/yellow]")
+
+
+def daemon_status_view(status: Dict[str, Any]) -> Dict[str, Any]:
+    """Reshape the daemon's AIAProcessingClient status into the services/processing_modes view"""
+    backend = status.get("backend", {}).get("status", "offline") != "offline"
+    dkg = status.get("dkg_v3", {}).get("status", "offline") != "offline"
+    mas = status.get("multi_agent_system", {}).get("status", "offline") != "offline"
+    return {
+        **status,
+        "timestamp": datetime.fromtimestamp(status["timestamp"]).isoformat(),
+        "services": {"aia_backend": backend, "dkg_v3": dkg},
+        "processing_modes": {
+            "aia_backend": backend,
+            "dkg_v3": dkg,
+            "hybrid": backend and dkg,
+            "aia_workflow": mas
+        }
+    }
+
+
+async def run_aia_workflow(context: str, task_type: str, sprints: int, team: bool, use_cache: bool = True) -> Any:
+    """
+    Run a task through the daemon's warm client when one is running, otherwise
+    (or if the daemon fails) through process_with_aia_workflow directly.
+    """
+    daemon = get_daemon_client()
+    if daemon:
+        from aia_cli_daemon import AIADaemonError, request_to_payload
+
+        processing_type = ProcessingType(task_type) if task_type in {t.value for t in ProcessingType} else ProcessingType.GENERAL
+        payload = request_to_payload(ProcessingRequest(
+            query=context,
+            processing_type=processing_type,
+            enable_orchestration=team
+        ))
+        payload["use_cache"] = use_cache
+
+        try:
+            result = await daemon.call("process", payload)
+            # Same fields the direct workflow result exposes to process/agents/ProcessingMonitor
+            return SimpleNamespace(
+                success=result["success"],
+                error=result.get("error"),
+                processing_mode="aia_daemon",
+                processing_time=result["processing_time"],
+                insights=(result.get("data") or {}).get("insights") or [],
+                data=result.get("data") or {}
+            )
+        except AIADaemonError as e:
+            daemon_unavailable(e)
+
+    return await process_with_aia_workflow(
+        context=context,
+        task_type=task_type,
+        sprints=sprints,
+        team_approach=team
     )
-    LEGACY_AIA_AVAILABLE = True
-except ImportError:
-    LEGACY_AIA_AVAILABLE = False
+
+
+async def fetch_fortune500_opportunities() -> Any:
+    """Fortune 500 opportunities from the daemon when one is running, else a direct client"""
+    daemon = get_daemon_client()
+    if daemon:
+        from aia_cli_daemon import AIADaemonError
+
+        try:
+            return ProcessingResult(**await daemon.call("fortune500"))
+        except AIADaemonError as e:
+            daemon_unavailable(e)
+
+    async with get_processing_client() as client:
+        return await client.get_fortune500_opportunities()
 
 # Revolutionary Visual Calm Design System
 REVOLUTIONARY_THEME = Theme({
@@ -146,9 +228,9 @@ class RevolutionaryResponse:
 class StreamingProcessor:
     """Revolutionary streaming processor for sub-50ms response times"""
 
-    def __init__(self, target_time: float = 0.05):
+    def __init__(self, target_time: float = 0.05, cache: Optional['PerformanceCache'] = None):
         self.target_time = target_time
-        self.chunk_cache = weakref.WeakValueDictionary()
+        self.response_cache = cache or PerformanceCache()
         self.performance_stats = {
             'total_requests': 0,
             'sub_50ms_count': 0,
@@ -162,8 +244,8 @@ class StreamingProcessor:
 
         # Check cache first
         cache_key = self._get_cache_key(request, context)
-        if cache_key in self.chunk_cache:
-            cached_response = self.chunk_cache[cache_key]
+        cached_response = self.response_cache.get(cache_key)
+        if cached_response is not None:
             elapsed = time.perf_counter() - start_time
             cached_response.processing_time = elapsed
             cached_response.cached = True
@@ -189,7 +271,7 @@ class StreamingProcessor:
         yield initial_response
 
         # Background processing for full response
-        if AIA_AVAILABLE:
+        if load_processing_clients():
             async for chunk in self._process_aia_streaming(request, context):
                 chunk_time = time.perf_counter() - start_time
                 chunk.processing_time = chunk_time
@@ -200,9 +282,7 @@ class StreamingProcessor:
 
     def _get_cache_key(self, request: str, context: Dict[str, Any] = None) -> str:
         """Generate cache key for request"""
-        import hashlib
-        combined = f"{request}|{str(context) if context else ''}"
-        return hashlib.blake2b(combined.encode(), digest_size=16).hexdigest()
+        return PerformanceCache.get_cache_key(request, json.dumps(context, sort_keys=True, default=str) if context else "")
 
     def _generate_quick_response(self, request: str) -> str:
         """Generate immediate response based on pattern matching"""
@@ -225,53 +305,76 @@ class StreamingProcessor:
     async def _process_aia_streaming(self, request: str, context: Dict[str, Any] = None) -> AsyncIterator[RevolutionaryResponse]:
         """Process through AIA system with streaming"""
         try:
-            async with AIAProcessingClient() as client:
-                processing_request = ProcessingRequest(
-                    query=request,
-                    processing_type=self._detect_processing_type(request),
-                    enable_orchestration=True,
-                    use_dkg=True,
-                    use_backend=True,
-                    use_mas=True
-                )
-
-                result = await client.process_request(processing_request)
+            processing_request = ProcessingRequest(
+                query=request,
+                processing_type=self._detect_processing_type(request),
+                enable_orchestration=True,
+                use_dkg=True,
+                use_backend=True,
+                use_mas=True
+            )
 
-                if result.success:
-                    # Convert AIA result to RevolutionaryResponse
-                    content = self._format_aia_result(result)
+            result = None
+            daemon = get_daemon_client()
+            if daemon:
+                # Forward to the warm daemon and relay its progress events
+                from aia_cli_daemon import AIADaemonError, request_to_payload
+
+                try:
+                    async for event in daemon.stream("process", request_to_payload(processing_request)):
+                        if event["event"] == "progress":
+                            yield RevolutionaryResponse(
+                                content=f"🤖 Agents: {', '.join(event.get('agents', []))}",
+                                confidence=0.0,
+                                processing_time=0.0,
+                                business_value=0.0,
+                                streaming_chunks=[event.get("stage", "")],
+                                stream_complete=False
+                            )
+                        elif event["event"] == "result":
+                            result = ProcessingResult(**event["result"])
+                except AIADaemonError as e:
+                    daemon_unavailable(e)
+
+            if result is None:
+                async with AIAProcessingClient() as client:
+                    result = await client.process_request(processing_request)
 
-                    full_response = RevolutionaryResponse(
-                        content=content,
-                        confidence=result.confidence,
-                        processing_time=result.processing_time,
-                        business_value=self._extract_business_value(result),
-                        agent_insights={
-                            'agents_used': result.agents_used,
-                            'sources': result.sources,
-                            'knowledge_atoms': result.knowledge_atoms_utilized
-                        },
-                        metadata=result.data,
-                        cached=False,
-                        streaming_chunks=[content],
-                        stream_complete=True
-                    )
+            if result.success:
+                # Convert AIA result to RevolutionaryResponse
+                content = self._format_aia_result(result)
+
+                full_response = RevolutionaryResponse(
+                    content=content,
+                    confidence=result.confidence,
+                    processing_time=result.processing_time,
+                    business_value=self._extract_business_value(result),
+                    agent_insights={
+                        'agents_used': result.agents_used,
+                        'sources': result.sources,
+                        'knowledge_atoms': result.knowledge_atoms_utilized
+                    },
+                    metadata=result.data,
+                    cached=False,
+                    streaming_chunks=[content],
+                    stream_complete=True
+                )
 
-                    # Cache the result
-                    cache_key = self._get_cache_key(request, context)
-                    self.chunk_cache[cache_key] = full_response
+                # Cache the result
+                cache_key = self._get_cache_key(request, context)
+                self.response_cache.set(cache_key, full_response)
 
-                    yield full_response
-                else:
-                    # Error response
-                    error_response = RevolutionaryResponse(
-                        content=f"❌ Processing failed: {result.error}",
-                        confidence=0.0,
-                        processing_time=result.processing_time,
-                        business_value=0.0,
-                        stream_complete=True
-                    )
-                    yield error_response
+                yield full_response
+            else:
+                # Error response
+                error_response = RevolutionaryResponse(
+                    content=f"❌ Processing failed: {result.error}",
+                    confidence=0.0,
+                    processing_time=result.processing_time,
+                    business_value=0.0,
+                    stream_complete=True
+                )
+                yield error_response
 
         except Exception as e:
             error_response = RevolutionaryResponse(
@@ -283,7 +386,7 @@ class StreamingProcessor:
             )
             yield error_response
 
-    def _detect_processing_type(self, request: str) -> ProcessingType:
+    def _detect_processing_type(self, request: str) -> 'ProcessingType':
         """Detect processing type from request"""
         request_lower = request.lower()
 
@@ -302,7 +405,7 @@ class StreamingProcessor:
         else:
             return ProcessingType.GENERAL
 
-    def _format_aia_result(self, result: ProcessingResult) -> str:
+    def _format_aia_result(self, result: 'ProcessingResult') -> str:
         """Format AIA result for display"""
         if not result.data:
             return "No data returned from processing"
@@ -331,7 +434,7 @@ class StreamingProcessor:
 
         return "\n".join(formatted_parts)
 
-    def _extract_business_value(self, result: ProcessingResult) -> float:
+    def _extract_business_value(self, result: 'ProcessingResult') -> float:
         """Extract business value from result"""
         if not result.data:
             return 0.0
@@ -369,6 +472,7 @@ class StreamingProcessor:
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get current performance statistics"""
         stats = self.performance_stats.copy()
+        stats['cache_hit_rate'] = self.response_cache.hit_rate
         if stats['total_requests'] > 0:
             stats['sub_50ms_rate'] = stats['sub_50ms_count'] / stats['total_requests']
         else:
@@ -376,42 +480,139 @@ class StreamingProcessor:
         return stats
 
 class PerformanceCache:
-    """Intelligent caching system for sub-50ms responses (Sprint 7)"""
-
-    def __init__(self, max_size: int = 1000):
-        self.cache = {}
+    """
+    Intelligent caching system for sub-50ms responses (Sprint 7)
+
+    An OrderedDict LRU with a per-entry TTL and a byte budget (entries are
+    sized by their serialized form). With db_path set, entries are written
+    through to SQLite so a prompt repeated in a later CLI invocation is served
+    locally instead of going to the backend. The database is opened on first
+    use, so commands that never touch the cache don't pay for it.
+    """
+
+    def __init__(self, max_size: int = 1000, max_bytes: int = 64 * 1024 * 1024,
+                 default_ttl: float = 24 * 3600, db_path: Optional[Path] = None,
+                 max_disk_entries: int = 10000):
+        self.cache: 'OrderedDict[str, Tuple[RevolutionaryResponse, float, int]]' = OrderedDict()
         self.max_size = max_size
-        self.access_times = {}
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.max_disk_entries = max_disk_entries
+        self.total_bytes = 0
         self.hit_count = 0
+        self.disk_hit_count = 0
         self.miss_count = 0
-
-    @lru_cache(maxsize=1000)
-    def get_cache_key(self, prompt: str, context: str = "") -> str:
+        self.lock = threading.Lock()
+
+        self.db_path = db_path
+        self.db = None
+        self.db_opened = False
+
+    def _open_db(self):
+        """Connect to the SQLite store on first use (lock held)"""
+        if self.db_opened:
+            return self.db
+        self.db_opened = True
+        if self.db_path is None:
+            return None
+        try:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+            self.db = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.execute("PRAGMA synchronous=NORMAL")
+            self.db.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            self.db.execute("DELETE FROM responses WHERE expires_at < ?", (time.time(),))
+            self.db.commit()
+        except sqlite3.Error:
+            self.db = None  # Fall back to memory-only caching
+        return self.db
+
+    @staticmethod
+    def get_cache_key(prompt: str, context: str = "") -> str:
         """Generate cache key with context awareness"""
-        import hashlib
         combined = f"{prompt}|{context}"
-        return hashlib.md5(combined.encode()).hexdigest()
+        return hashlib.blake2b(combined.encode(), digest_size=16).hexdigest()
 
     def get(self, key: str) -> Optional[RevolutionaryResponse]:
         """Get cached response with performance tracking"""
-        if key in self.cache:
-            self.hit_count += 1
-            self.access_times[key] = time.time()
-            return self.cache[key]
-        self.miss_count += 1
-        return None
-
-    def set(self, key: str, response: RevolutionaryResponse):
+        now = time.time()
+        with self.lock:
+            entry = self.cache.get(key)
+            if entry is not None:
+                response, expires_at, _ = entry
+                if expires_at > now:
+                    self.cache.move_to_end(key)
+                    self.hit_count += 1
+                    return response
+                self._remove(key)
+
+            if self._open_db() is not None:
+                row = self.db.execute(
+                    "SELECT payload, expires_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row and row[1] > now:
+                    self.db.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+                    self.db.commit()
+                    response = RevolutionaryResponse(**json.loads(row[0]))
+                    self._store(key, response, row[1], len(row[0]))
+                    self.hit_count += 1
+                    self.disk_hit_count += 1
+                    return response
+
+            self.miss_count += 1
+            return None
+
+    def set(self, key: str, response: RevolutionaryResponse, ttl: Optional[float] = None):
         """Set cached response with intelligent eviction"""
-        if len(self.cache) >= self.max_size:
-            # Evict least recently used
-            oldest_key = min(self.access_times.keys(), key=lambda k: self.access_times[k])
-            del self.cache[oldest_key]
-            del self.access_times[oldest_key]
+        response = replace(response, cached=True)
+        payload = json.dumps(asdict(response), default=str)
+        now = time.time()
+        expires_at = now + (ttl if ttl is not None else self.default_ttl)
+
+        with self.lock:
+            self._store(key, response, expires_at, len(payload))
+
+            if self._open_db() is not None:
+                self.db.execute(
+                    "INSERT OR REPLACE INTO responses (key, payload, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                    (key, payload, expires_at, now)
+                )
+                self.db.execute("""
+                    DELETE FROM responses WHERE key IN (
+                        SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                    )
+                """, (self.max_disk_entries,))
+                self.db.commit()
 
-        response.cached = True
-        self.cache[key] = response
-        self.access_times[key] = time.time()
+    def _store(self, key: str, response: RevolutionaryResponse, expires_at: float, size: int):
+        """Insert into the in-memory LRU and evict from the cold end (lock held)"""
+        if key in self.cache:
+            self._remove(key)
+        self.cache[key] = (response, expires_at, size)
+        self.total_bytes += size
+
+        while len(self.cache) > self.max_size or (self.total_bytes > self.max_bytes and len(self.cache) > 1):
+            _, (_, _, evicted_size) = self.cache.popitem(last=False)
+            self.total_bytes -= evicted_size
+
+    def _remove(self, key: str):
+        _, _, size = self.cache.pop(key)
+        self.total_bytes -= size
+
+    def clear(self):
+        with self.lock:
+            self.cache.clear()
+            self.total_bytes = 0
+            if self._open_db() is not None:
+                self.db.execute("DELETE FROM responses")
+                self.db.commit()
 
     @property
     def hit_rate(self) -> float:
@@ -480,10 +681,13 @@ class AccessibilityManager:
         self.tts_engine = None
         self.screen_reader_mode = False
 
-        if enabled and ACCESSIBILITY_TTS:
+        if enabled:
             try:
+                import pyttsx3
                 self.tts_engine = pyttsx3.init()
                 self.tts_engine.setProperty('rate', 150)  # Comfortable reading speed
+            except ImportError:
+                pass  # TTS is optional
             except Exception as e:
                 console.print(f"[warning]TTS not available: {e}[/warning]")
 
@@ -553,6 +757,12 @@ class AIAConfig:
 
             # Performance settings
             "cache_size": 1000,
+            "cache_max_bytes": 64 * 1024 * 1024,
+            "cache_ttl_seconds": 24 * 3600,
+            "persistent_cache": True,
+            "use_daemon": False,  # Forward commands to `aia daemon start`
+            "daemon_socket": None,  # Defaults to ~/.aia/cli_daemon.sock
+            "daemon_idle_timeout": 1800,
             "max_response_time": 0.05,  # 50ms target
             "confidence_threshold": 0.7,
             "business_value_threshold": 0.5,
@@ -592,12 +802,21 @@ class AIAConfig:
         self.config[key] = value
         self.save_config()
 
+def response_cache_path() -> Optional[Path]:
+    """SQLite response cache location, next to the active config file"""
+    return config.config_file.parent / "response_cache.db" if config.get("persistent_cache", True) else None
+
 # Global revolutionary config instance
 config = AIAConfig()
-performance_cache = PerformanceCache()
+performance_cache = PerformanceCache(
+    max_size=config.get("cache_size", 1000),
+    max_bytes=config.get("cache_max_bytes", 64 * 1024 * 1024),
+    default_ttl=config.get("cache_ttl_seconds", 24 * 3600),
+    db_path=response_cache_path()
+)
 predictive_engine = PredictiveCommandEngine()
 accessibility_manager = AccessibilityManager()
-streaming_processor = StreamingProcessor(target_time=0.05)
+streaming_processor = StreamingProcessor(target_time=0.05, cache=performance_cache)
 
 class ProcessingMonitor:
     """Monitor and display processing progress"""
@@ -619,7 +838,7 @@ class ProcessingMonitor:
         if self.show_progress:
             console.print(f"[blue]ℹ️ {message}[/blue]")
 
-    def complete(self, result: ProcessingResult):
+    def complete(self, result: 'ProcessingResult'):
         """Show completion status"""
         elapsed = time.time() - self.start_time if self.start_time else 0
 
@@ -655,7 +874,16 @@ def format_output(data: Any, format_type: str = "rich") -> str:
 
 async def check_system_health() -> Dict[str, Any]:
     """Check system health"""
-    if not AIA_AVAILABLE:
+    daemon = get_daemon_client()
+    if daemon:
+        from aia_cli_daemon import AIADaemonError
+
+        try:
+            return {"status": "healthy", "data": daemon_status_view(await daemon.call("status"))}
+        except AIADaemonError as e:
+            daemon_unavailable(e)
+
+    if not load_processing_clients():
         return {"status": "error", "message": "AIA client not available"}
 
     try:
@@ -675,6 +903,11 @@ def cli(config_file, output_format, verbose):
     if config_file:
         config.config_file = Path(config_file)
         config.load_config()
+        # The cache database hasn't been opened yet; follow the new config
+        performance_cache.db_path = response_cache_path()
+        performance_cache.max_size = config.get("cache_size", 1000)
+        performance_cache.max_bytes = config.get("cache_max_bytes", 64 * 1024 * 1024)
+        performance_cache.default_ttl = config.get("cache_ttl_seconds", 24 * 3600)
 
     if output_format:
         config.set('output_format', output_format)
@@ -688,31 +921,36 @@ def cli(config_file, output_format, verbose):
 @click.option('--sprints', default=None, type=int, help='Number of sprints')
 @click.option('--team', is_flag=True, help='Use team approach')
 @click.option('--background', is_flag=True, help='Run in background')
-def process(context, task_type, sprints, team, background):
+@click.option('--no-cache', is_flag=True, help='Bypass the local response cache')
+def process(context, task_type, sprints, team, background, no_cache):
     """Process a task using AIA multi-agent system"""
-    return asyncio.run(_process(context, task_type, sprints, team, background))
+    return asyncio.run(_process(context, task_type, sprints, team, background, no_cache))
 
-async def _process(context, task_type, sprints, team, background):
+async def _process(context, task_type, sprints, team, background, no_cache=False):
     """Process a task using AIA multi-agent system"""
 
-    if not AIA_AVAILABLE:
-        console.print("[red]❌ AIA system not available[/red]")
-        return
-
     # Use config defaults if not specified
     task_type = task_type or config.get('default_task_type')
     sprints = sprints or config.get('default_sprints')
 
+    use_cache = config.get('intelligent_caching') and not no_cache
+    cache_key = PerformanceCache.get_cache_key(context, f"{task_type}|{sprints}|{team}")
+    if use_cache:
+        cached = performance_cache.get(cache_key)
+        if cached is not None:
+            console.print(f"[green]⚡ Served from local cache ({cached.processing_time:.2f}s saved)[/green]")
+            console.print(format_output(cached.metadata, config.get('output_format')))
+            return
+
+    if not load_processing_clients():
+        console.print("[red]❌ AIA system not available[/red]")
+        return
+
     monitor = ProcessingMonitor(config.get('show_progress'))
 
     with console.status(f"Processing: {context[:50]}...", spinner="dots"):
         try:
-            result = await process_with_aia_workflow(
-                context=context,
-                task_type=task_type,
-                sprints=sprints,
-                team_approach=team
-            )
+            result = await run_aia_workflow(context, task_type, sprints, team, use_cache)
 
             monitor.complete(result)
 
@@ -736,6 +974,15 @@ async def _process(context, task_type, sprints, team, background):
 
                 formatted_output = format_output(output_data, config.get('output_format'))
                 console.print(formatted_output)
+
+                if use_cache:
+                    performance_cache.set(cache_key, RevolutionaryResponse(
+                        content=formatted_output,
+                        confidence=1.0,
+                        processing_time=result.processing_time,
+                        business_value=0.0,
+                        metadata=output_data
+                    ))
             else:
                 console.print(f"[red]❌ Processing failed: {result.error}[/red]")
 
@@ -777,6 +1024,8 @@ async def _status(detailed, watch):
 🚀 AIA Workflow:  {'✅' if status_data['processing_modes']['aia_workflow'] else '❌'}
         """
 
+        from rich.markdown import Markdown
+
         panel = Panel(Markdown(status_text), title="AIA System Status", border_style="green")
         console.print(panel)
 
@@ -818,19 +1067,14 @@ async def _health():
 async def agents(context, task_type):
     """Deploy multi-agent processing"""
 
-    if not AIA_AVAILABLE:
+    if not load_processing_clients():
         console.print("[red]❌ AIA system not available[/red]")
         return
 
     console.print(f"[blue]🤖 Deploying multi-agent team for: {context}[/blue]")
 
     with console.status("Coordinating agents...", spinner="dots"):
-        result = await process_with_aia_workflow(
-            context=context,
-            task_type=task_type,
-            sprints=5,
-            team_approach=True
-        )
+        result = await run_aia_workflow(context, task_type, 5, True)
 
         if result.success:
             console.print("[green]✅ Multi-agent processing complete[/green]")
@@ -853,36 +1097,36 @@ async def agents(context, task_type):
 async def insights(fortune500, viz_3d):
     """Get business insights and analytics"""
 
-    if not AIA_AVAILABLE:
+    if not load_processing_clients():
         console.print("[red]❌ AIA system not available[/red]")
         return
 
-    async with get_processing_client() as client:
-        if fortune500:
-            console.print("[blue]🏢 Getting Fortune 500 opportunities...[/blue]")
-            result = await client.get_fortune500_opportunities()
+    if fortune500:
+        console.print("[blue]🏢 Getting Fortune 500 opportunities...[/blue]")
+        result = await fetch_fortune500_opportunities()
 
-            if result.success:
-                opportunities = result.data.get('opportunities', [])
+        if result.success:
+            opportunities = result.data.get('opportunities', [])
 
-                if opportunities:
-                    table = Table(title="Fortune 500 Business Opportunities")
-                    table.add_column("Opportunity", style="cyan")
-                    table.add_column("Value", style="green")
-                    table.add_column("Description", style="white")
+            if opportunities:
+                table = Table(title="Fortune 500 Business Opportunities")
+                table.add_column("Opportunity", style="cyan")
+                table.add_column("Value", style="green")
+                table.add_column("Description", style="white")
 
-                    for opp in opportunities[:5]:
-                        value = f"${opp.get('value', 0):,.0f}" if 'value' in opp else "N/A"
-                        desc = opp.get('description', 'No description')[:60] + '...' if len(opp.get('description', '')) > 60 else opp.get('description', 'No description')
-                        table.add_row(opp.get('title', 'Opportunity'), value, desc)
+                for opp in opportunities[:5]:
+                    value = f"${opp.get('value', 0):,.0f}" if 'value' in opp else "N/A"
+                    desc = opp.get('description', 'No description')[:60] + '...' if len(opp.get('description', '')) > 60 else opp.get('description', 'No description')
+                    table.add_row(opp.get('title', 'Opportunity'), value, desc)
 
-                    console.print(table)
-                else:
-                    console.print("[yellow]⚠️ No opportunities found[/yellow]")
+                console.print(table)
             else:
-                console.print(f"[red]❌ Failed to get opportunities: {result.error}[/red]")
+                console.print("[yellow]⚠️ No opportunities found[/yellow]")
+        else:
+            console.print(f"[red]❌ Failed to get opportunities: {result.error}[/red]")
 
-        if viz_3d:
+    if viz_3d:
+        async with get_processing_client() as client:
             console.print("[blue]🎨 Getting 3D visualization data...[/blue]")
             result = await client.get_3d_visualization()
 
@@ -902,6 +1146,8 @@ async def insights(fortune500, viz_3d):
 @cli.command()
 def interactive():
     """Start interactive AIA session"""
+    from rich.prompt import Prompt
+
     console.print("[blue]🚀 Starting AIA Interactive Session[/blue]")
     console.print("[dim]Type 'help' for commands, 'exit' to quit[/dim]")
 
@@ -956,6 +1202,63 @@ def config_cmd(key, value, show):
     else:
         console.print("[red]❌ Use --show to view config or --key/--value to set values[/red]")
 
+@cli.command()
+@click.argument('request', required=True)
+def query(request):
+    """Stream a response from the AIA multi-agent system"""
+    return asyncio.run(_query(request))
+
+async def _query(request):
+    """Stream a response from the AIA multi-agent system"""
+    async for chunk in streaming_processor.process_streaming(request):
+        if chunk.stream_complete or chunk.cached:
+            console.print(Panel(chunk.content, title="AIA Response", border_style="green"))
+        else:
+            console.print(f"[dim]{chunk.content}[/dim]")
+
+@cli.group()
+def daemon():
+    """Manage the background daemon that keeps backend connections warm"""
+    pass
+
+@daemon.command('start')
+def daemon_start():
+    """Start the daemon and route commands through it"""
+    from aia_cli_daemon import start_daemon_process
+
+    if start_daemon_process(
+        socket_path=config.get('daemon_socket'),
+        backend_url=config.get('backend_url'),
+        dkg_url=config.get('dkg_url'),
+        idle_timeout=config.get('daemon_idle_timeout', 1800)
+    ):
+        config.set('use_daemon', True)
+        console.print("[green]✅ AIA daemon running; commands will use warm connections[/green]")
+    else:
+        console.print("[red]❌ AIA daemon failed to start[/red]")
+
+@daemon.command('stop')
+def daemon_stop():
+    """Stop the daemon and go back to direct connections"""
+    from aia_cli_daemon import AIADaemonClient
+
+    client = AIADaemonClient(config.get('daemon_socket'))
+    if client.is_running():
+        asyncio.run(client.call('shutdown'))
+    config.set('use_daemon', False)
+    console.print("[yellow]🛑 AIA daemon stopped[/yellow]")
+
+@daemon.command('status')
+def daemon_status():
+    """Show daemon connection state and counters"""
+    from aia_cli_daemon import AIADaemonClient
+
+    client = AIADaemonClient(config.get('daemon_socket'))
+    if not client.is_running():
+        console.print("[yellow]AIA daemon is not running[/yellow]")
+        return
+    console.print(format_output(asyncio.run(client.call('ping')), config.get('output_format')))
+
 # Note: All async commands have been converted to sync wrappers
 
 if __name__ == '__main__':
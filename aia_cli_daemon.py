@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+🔌 AIA CLI DAEMON
+=================
+
+Opt-in background process that keeps one AIAProcessingClient warm for the
+CLI: the aiohttp session, the initialize_connections health probes, the
+discovered agents and capability map, and a short-lived result cache all
+survive between commands. CLI invocations connect over a Unix domain socket
+and only pay for the backend round-trip.
+
+Protocol: newline-delimited JSON. A request is
+    {"id": 1, "method": "process", "params": {...}}
+and the daemon answers with zero or more {"id": 1, "event": "progress", ...}
+lines followed by one {"id": 1, "event": "result", "result": ...} or
+{"id": 1, "event": "error", "error": "..."} line.
+
+This module only imports the standard library at load; the processing
+client stack is imported by the daemon process itself, so the thin client
+stays cheap to import.
+
+Usage:
+    python aia_cli_daemon.py start            # detach and serve in the background
+    python aia_cli_daemon.py start --foreground
+    python aia_cli_daemon.py status
+    python aia_cli_daemon.py stop
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_EVENTS = ("result", "error")
+
+
+def default_socket_path() -> Path:
+    """Socket location: $AIA_DAEMON_SOCKET or ~/.aia/cli_daemon.sock"""
+    return Path(os.environ.get("AIA_DAEMON_SOCKET", Path.home() / ".aia" / "cli_daemon.sock")).expanduser()
+
+
+def request_to_payload(request: Any) -> Dict[str, Any]:
+    """Serialize a ProcessingRequest for the wire (enums by value)"""
+    payload = dict(request.__dict__)
+    payload["processing_type"] = request.processing_type.value
+    payload["preferred_agents"] = [agent.value for agent in request.preferred_agents or []]
+    return payload
+
+
+class AIADaemonError(Exception):
+    """Raised by the client when the daemon reports an error or is unreachable"""
+    pass
+
+
+class AIACLIDaemon:
+    """Unix socket server holding a warm AIAProcessingClient"""
+
+    def __init__(self,
+                 socket_path: Optional[Union[str, Path]] = None,
+                 backend_url: str = "http://localhost:8000",
+                 dkg_url: str = "http://localhost:8001",
+                 idle_timeout: float = 1800.0,
+                 refresh_interval: float = 300.0,
+                 status_ttl: float = 5.0,
+                 result_ttl: float = 300.0,
+                 max_cached_results: int = 256):
+        self.socket_path = Path(socket_path) if socket_path else default_socket_path()
+        self.backend_url = backend_url
+        self.dkg_url = dkg_url
+        self.idle_timeout = idle_timeout
+        self.refresh_interval = refresh_interval
+        self.status_ttl = status_ttl
+        self.result_ttl = result_ttl
+        self.max_cached_results = max_cached_results
+
+        self.client = None
+        self.server = None
+        self.stop_event: Optional[asyncio.Event] = None
+        self.started_at = time.time()
+        self.last_activity = time.time()
+        self.active_connections = 0
+
+        self.status_cache: Optional[tuple] = None
+        self.result_cache: 'OrderedDict[str, tuple]' = OrderedDict()
+        self.stats = {
+            "requests": 0,
+            "errors": 0,
+            "result_cache_hits": 0,
+            "connection_refreshes": 0
+        }
+
+    async def serve(self):
+        """Connect once, then serve requests until stopped or idle"""
+        from aia_processing_client import AIAProcessingClient
+
+        self._claim_socket_path()
+        self.stop_event = asyncio.Event()
+
+        self.client = AIAProcessingClient(backend_url=self.backend_url, dkg_url=self.dkg_url)
+        try:
+            await self.client.__aenter__()
+        except ConnectionError as e:
+            # Stay up with an open session; the refresh loop re-probes
+            logger.warning(f"⚠️ Starting with all systems offline: {e}")
+
+        # Bind under a restrictive umask so the socket is never reachable by others
+        previous_umask = os.umask(0o077)
+        try:
+            self.server = await asyncio.start_unix_server(
+                self._handle_connection, path=str(self.socket_path), limit=16 * 1024 * 1024
+            )
+        finally:
+            os.umask(previous_umask)
+        os.chmod(self.socket_path, 0o600)
+
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, self.stop_event.set)
+
+        background = [asyncio.create_task(self._refresh_loop()), asyncio.create_task(self._idle_watch())]
+        logger.info(f"🔌 AIA CLI daemon listening on {self.socket_path} (pid {os.getpid()})")
+
+        try:
+            await self.stop_event.wait()
+        finally:
+            for task in background:
+                task.cancel()
+            self.server.close()
+            await self.server.wait_closed()
+            await self.client.__aexit__(None, None, None)
+            if self.socket_path.exists():
+                self.socket_path.unlink()
+            logger.info("🔌 AIA CLI daemon stopped")
+
+    def _claim_socket_path(self):
+        """Remove a stale socket left by a crashed daemon; refuse if one is live"""
+        self.socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if not self.socket_path.exists():
+            return
+        if AIADaemonClient(self.socket_path).is_running():
+            raise RuntimeError(f"AIA CLI daemon already running on {self.socket_path}")
+        self.socket_path.unlink()
+
+    async def _refresh_loop(self):
+        """Re-run the connection probes periodically so statuses and agents stay current"""
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.client.initialize_connections()
+            except ConnectionError as e:
+                logger.warning(f"⚠️ Refresh found all systems offline: {e}")
+            except Exception as e:
+                logger.error(f"❌ Connection refresh failed: {e}")
+            self.status_cache = None
+            self.stats["connection_refreshes"] += 1
+
+    async def _idle_watch(self):
+        """Stop after idle_timeout seconds without clients (0 disables)"""
+        if not self.idle_timeout:
+            return
+        while True:
+            await asyncio.sleep(min(60.0, self.idle_timeout))
+            if not self.active_connections and time.time() - self.last_activity > self.idle_timeout:
+                logger.info("💤 Idle timeout reached")
+                self.stop_event.set()
+                return
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve newline-delimited requests from one client"""
+        self.active_connections += 1
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+
+                self.last_activity = time.time()
+                request_id = None
+                try:
+                    message = json.loads(line)
+                    request_id = message.get("id")
+                    async for event in self._dispatch(message.get("method"), message.get("params") or {}):
+                        event["id"] = request_id
+                        writer.write(json.dumps(event, default=str).encode() + b"\n")
+                        await writer.drain()
+                except (ConnectionResetError, BrokenPipeError):
+                    break
+                except Exception as e:
+                    self.stats["errors"] += 1
+                    logger.error(f"❌ Daemon request failed: {e}")
+                    writer.write(json.dumps({"id": request_id, "event": "error", "error": str(e)}).encode() + b"\n")
+                    await writer.drain()
+        except asyncio.CancelledError:
+            pass  # Daemon shutting down with the client still connected
+        finally:
+            self.active_connections -= 1
+            self.last_activity = time.time()
+            writer.close()
+
+    async def _dispatch(self, method: str, params: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """Run one method and yield its events"""
+        self.stats["requests"] += 1
+
+        if method == "ping":
+            yield {"event": "result", "result": self.get_daemon_status()}
+
+        elif method == "status":
+            now = time.time()
+            if self.status_cache is None or now - self.status_cache[0] > self.status_ttl:
+                self.status_cache = (now, await self.client.get_system_status())
+            yield {"event": "result", "result": self.status_cache[1]}
+
+        elif method == "process":
+            async for event in self._process(params):
+                yield event
+
+        elif method == "fortune500":
+            result = await self.client.process_fortune500_analysis()
+            yield {"event": "result", "result": result.__dict__}
+
+        elif method == "shutdown":
+            self.stop_event.set()
+            yield {"event": "result", "result": {"stopping": True}}
+
+        else:
+            raise ValueError(f"Unknown daemon method: {method}")
+
+    async def _process(self, params: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """process_request on the warm client, with a TTL result cache"""
+        from aia_processing_client import AgentType, ProcessingRequest, ProcessingType
+
+        use_cache = params.pop("use_cache", True)
+        cache_key = hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()
+
+        if use_cache:
+            cached = self.result_cache.get(cache_key)
+            if cached and time.time() - cached[0] < self.result_ttl:
+                self.result_cache.move_to_end(cache_key)
+                self.stats["result_cache_hits"] += 1
+                yield {"event": "result", "result": cached[1], "cached": True}
+                return
+
+        request = ProcessingRequest(**{
+            **params,
+            "processing_type": ProcessingType(params.get("processing_type", ProcessingType.GENERAL.value)),
+            "preferred_agents": [AgentType(agent) for agent in params.get("preferred_agents") or []]
+        })
+
+        # Agent selection only needs the warm capability map, so report it before the backend call
+        agents = self.client._select_optimal_agents(request)
+        yield {"event": "progress", "stage": "agents_selected", "agents": [agent.value for agent in agents]}
+
+        result = (await self.client.process_request(request)).__dict__
+        if result.get("success"):
+            self.result_cache[cache_key] = (time.time(), result)
+            self.result_cache.move_to_end(cache_key)
+            while len(self.result_cache) > self.max_cached_results:
+                self.result_cache.popitem(last=False)
+
+        yield {"event": "result", "result": result, "cached": False}
+
+    def get_daemon_status(self) -> Dict[str, Any]:
+        """Daemon-side view: uptime, connection state and counters"""
+        client = self.client
+        return {
+            "pid": os.getpid(),
+            "socket": str(self.socket_path),
+            "uptime_seconds": time.time() - self.started_at,
+            "backend": client._backend_status.value if client else "offline",
+            "dkg_v3": client._dkg_status.value if client else "offline",
+            "multi_agent_system": client._mas_status.value if client else "offline",
+            "available_agents": len(client._available_agents) if client else 0,
+            "cached_results": len(self.result_cache),
+            **self.stats
+        }
+
+
+class AIADaemonClient:
+    """Thin client that forwards CLI commands to a running daemon"""
+
+    def __init__(self, socket_path: Optional[Union[str, Path]] = None, timeout: float = 300.0):
+        self.socket_path = Path(socket_path) if socket_path else default_socket_path()
+        self.timeout = timeout
+        self.next_id = 0
+
+    def is_running(self) -> bool:
+        """Cheap liveness check: can we connect to the socket?"""
+        if not self.socket_path.exists():
+            return False
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        probe.settimeout(0.5)
+        try:
+            probe.connect(str(self.socket_path))
+            return True
+        except OSError:
+            return False
+        finally:
+            probe.close()
+
+    async def stream(self, method: str, params: Optional[Dict[str, Any]] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Send one request and yield its events as they arrive"""
+        try:
+            reader, writer = await asyncio.open_unix_connection(str(self.socket_path), limit=16 * 1024 * 1024)
+        except OSError as e:
+            raise AIADaemonError(f"AIA CLI daemon not reachable on {self.socket_path}: {e}")
+
+        self.next_id += 1
+        try:
+            writer.write(json.dumps({"id": self.next_id, "method": method, "params": params or {}}).encode() + b"\n")
+            await writer.drain()
+
+            while True:
+                line = await asyncio.wait_for(reader.readline(), timeout=self.timeout)
+                if not line:
+                    raise AIADaemonError("AIA CLI daemon closed the connection")
+
+                event = json.loads(line)
+                if event.get("event") == "error":
+                    raise AIADaemonError(event.get("error", "unknown daemon error"))
+                yield event
+                if event.get("event") in TERMINAL_EVENTS:
+                    return
+        finally:
+            writer.close()
+
+    async def call(self, method: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Send one request and return its final result"""
+        async for event in self.stream(method, params):
+            if event.get("event") == "result":
+                return event.get("result")
+
+
+def start_daemon_process(socket_path: Optional[Union[str, Path]] = None,
+                         backend_url: str = "http://localhost:8000",
+                         dkg_url: str = "http://localhost:8001",
+                         idle_timeout: float = 1800.0,
+                         wait: float = 10.0) -> bool:
+    """Launch the daemon detached from the terminal and wait until it accepts connections"""
+    socket_path = Path(socket_path) if socket_path else default_socket_path()
+    client = AIADaemonClient(socket_path)
+    if client.is_running():
+        return True
+
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    log_path = socket_path.with_suffix(".log")
+    with open(log_path, "a") as log_file:
+        subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "start", "--foreground",
+             "--socket", str(socket_path), "--backend-url", backend_url,
+             "--dkg-url", dkg_url, "--idle-timeout", str(idle_timeout)],
+            stdin=subprocess.DEVNULL,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+            cwd=str(Path(__file__).resolve().parent)
+        )
+
+    deadline = time.time() + wait
+    while time.time() < deadline:
+        if client.is_running():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AIA CLI background daemon")
+    parser.add_argument("action", choices=["start", "stop", "status"])
+    parser.add_argument("--socket", default=None, help="Unix socket path")
+    parser.add_argument("--foreground", action="store_true", help="Serve in this process instead of detaching")
+    parser.add_argument("--backend-url", default="http://localhost:8000")
+    parser.add_argument("--dkg-url", default="http://localhost:8001")
+    parser.add_argument("--idle-timeout", type=float, default=1800.0, help="Seconds without clients before exiting (0 = never)")
+    args = parser.parse_args()
+
+    client = AIADaemonClient(args.socket)
+
+    if args.action == "start":
+        if args.foreground:
+            logging.basicConfig(level=logging.INFO)
+            daemon = AIACLIDaemon(args.socket, args.backend_url, args.dkg_url, idle_timeout=args.idle_timeout)
+            asyncio.run(daemon.serve())
+        elif start_daemon_process(args.socket, args.backend_url, args.dkg_url, args.idle_timeout):
+            print(f"✅ AIA CLI daemon running on {client.socket_path}")
+        else:
+            print(f"❌ AIA CLI daemon failed to start (see {client.socket_path.with_suffix('.log')})")
+            sys.exit(1)
+
+    elif not client.is_running():
+        print("AIA CLI daemon is not running")
+        sys.exit(1 if args.action == "status" else 0)
+
+    elif args.action == "status":
+        print(json.dumps(asyncio.run(client.call("ping")), indent=2))
+
+    else:
+        asyncio.run(client.call("shutdown"))
+        print("🛑 AIA CLI daemon stopping")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+⏱️ AIA CLI STARTUP BENCHMARK
+============================
+
+Cold-start regression check for the CLI entry points. Each module is imported
+in a fresh interpreter under `-X importtime`; the module's cumulative import
+time (everything it pulls in at load, excluding interpreter startup) is taken
+as the median over several runs and compared with the startup budget. The
+slowest direct imports are listed so a regression points at its cause.
+
+Exits non-zero when any entry point is over budget, so it can gate CI.
+
+Usage:
+    python aia_cli_startup_benchmark.py --budget-ms 250 --runs 5
+    python aia_cli_startup_benchmark.py --modules aia_cli --top 15
+"""
+
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+DEFAULT_MODULES = [
+    "aia_cli",
+    "aia_terminal_coding_cli",
+    "aia_ecosystem_aligned_cli",
+    "aia_ultimate_enterprise_cli",
+]
+
+# "import time:  self [us] | cumulative | imported package"
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)")
+
+
+def parse_importtime(stderr: str, module: str) -> Tuple[int, Dict[str, int]]:
+    """
+    Cumulative microseconds for module in an -X importtime trace, plus the
+    cumulative time of each of its direct imports.
+    """
+    children: Dict[str, int] = {}
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+
+        # Nesting is two spaces per level after the single separator space;
+        # children are printed before the module that imported them
+        depth = (len(match.group(3)) - 1) // 2
+        if depth == 1:
+            children[match.group(4)] = int(match.group(2))
+        elif depth == 0:
+            if match.group(4) == module:
+                return int(match.group(2)), children
+            children = {}
+
+    return 0, {}
+
+
+def measure_import(module: str, cwd: Path) -> Tuple[float, float, Dict[str, int]]:
+    """Import module in a fresh interpreter; returns (import_ms, wall_ms, direct imports)."""
+    start_time = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd,
+        capture_output=True,
+        text=True
+    )
+    wall_ms = (time.perf_counter() - start_time) * 1000
+
+    if completed.returncode != 0:
+        error = completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else "unknown error"
+        raise RuntimeError(f"import {module} failed: {error}")
+
+    cumulative, imports = parse_importtime(completed.stderr, module)
+    return cumulative / 1000, wall_ms, imports
+
+
+def run_startup_benchmark(
+    modules: List[str] = None,
+    runs: int = 5,
+    budget_ms: float = 250.0,
+    top: int = 10,
+    cwd: Path = None
+) -> Dict[str, Any]:
+    """Median cold-start import time per entry point, checked against budget_ms."""
+    cwd = cwd or Path(__file__).parent
+    results = {}
+
+    for module in modules or DEFAULT_MODULES:
+        try:
+            # One untimed import so bytecode compilation isn't counted
+            measure_import(module, cwd)
+            samples = [measure_import(module, cwd) for _ in range(runs)]
+        except RuntimeError as e:
+            results[module] = {"error": str(e), "within_budget": False}
+            continue
+
+        import_ms = statistics.median(sample[0] for sample in samples)
+        wall_ms = statistics.median(sample[1] for sample in samples)
+
+        # Slowest direct imports from the median run
+        median_run = min(samples, key=lambda sample: abs(sample[0] - import_ms))[2]
+        slowest = sorted(median_run.items(), key=lambda item: item[1], reverse=True)[:top]
+
+        results[module] = {
+            "import_ms": import_ms,
+            "wall_ms": wall_ms,
+            "within_budget": import_ms <= budget_ms,
+            "slowest_imports_ms": {name: microseconds / 1000 for name, microseconds in slowest}
+        }
+
+    return {
+        "python": sys.version.split()[0],
+        "runs": runs,
+        "budget_ms": budget_ms,
+        "all_within_budget": all(result["within_budget"] for result in results.values()),
+        "modules": results
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check CLI cold-start import time against a budget")
+    parser.add_argument("--modules", nargs="+", default=DEFAULT_MODULES)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=250.0)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    results = run_startup_benchmark(
+        modules=args.modules,
+        runs=args.runs,
+        budget_ms=args.budget_ms,
+        top=args.top
+    )
+    print(json.dumps(results, indent=2))
+
+    if not results["all_within_budget"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -18,25 +18,22 @@ Single Command: aia
 """
 
 import asyncio
-import aiohttp
 import json
 import time
-import jwt
 import os
 import getpass
-import keyring
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
 from dataclasses import dataclass
 from enum import Enum
 
+# aiohttp, jwt, keyring and the progress/tree renderables are imported where
+# they're used, so starting the CLI doesn't pay for them up front
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.prompt import Prompt, Confirm
-from rich.tree import Tree
 
 console = Console(force_terminal=True, width=120)
 
@@ -144,6 +141,9 @@ class AIAEcosystemAuthentication:
         }
 
         try:
+            import aiohttp
+            import jwt
+
             async with aiohttp.ClientSession() as session:
                 async with session.post(f"{self.backend_url}/aia/process", json=auth_request) as response:
                     result = await response.json()
@@ -198,6 +198,7 @@ class AIAEcosystemAuthentication:
     def get_cached_token(self) -> Optional[str]:
         """Get cached authentication token"""
         try:
+            import keyring
             return keyring.get_password("aia-cli", "session_token")
         except:
             return None
@@ -205,6 +206,7 @@ class AIAEcosystemAuthentication:
     def cache_token_securely(self, token: str) -> None:
         """Cache token securely using keyring"""
         try:
+            import keyring
             keyring.set_password("aia-cli", "session_token", token)
         except:
             pass  # Fallback to no caching
@@ -212,6 +214,8 @@ class AIAEcosystemAuthentication:
     async def validate_token(self, token: str) -> Dict[str, Any]:
         """Validate existing token with ecosystem"""
         try:
+            import jwt
+
             secret_key = "aia-quantum-enterprise-jwt-secret-key-2025-production-environment-secure"
             payload = jwt.decode(token, secret_key, algorithms=["HS256"])
 
@@ -373,6 +377,9 @@ class AIAEcosystemCLI:
         }
 
         try:
+            import aiohttp
+            from rich.progress import Progress, SpinnerColumn, TextColumn
+
             # Enhanced execution with streaming progress
             with Progress(
                 SpinnerColumn(),
@@ -434,6 +441,8 @@ class AIAEcosystemCLI:
     async def select_optimal_claude_agents(self, command: str, max_agents: int) -> List[str]:
         """Select optimal Claude agents for the command"""
         try:
+            import aiohttp
+
             # Query Claude agent registry for best agents
             async with aiohttp.ClientSession() as session:
                 async with session.get("http://localhost:8025/agents") as response:
@@ -498,6 +507,8 @@ class AIAEcosystemCLI:
         }
 
         try:
+            import aiohttp
+
             async with aiohttp.ClientSession() as session:
                 async with session.post(f"{self.auth.backend_url}/aia/process", json=execution_request) as response:
                     result = await response.json()
@@ -554,6 +565,8 @@ class AIAEcosystemCLI:
 
     async def show_tier_help(self) -> None:
         """Show help appropriate for current tier"""
+        from rich.tree import Tree
+
         tier_config = self.tier_configs[self.current_tier]
 
         help_tree = Tree(f"🛠️ {tier_config.name} Tier Commands")
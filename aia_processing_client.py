@@ -8,7 +8,6 @@ for comprehensive intelligent processing following the AIA agent workflow.
 """
 
 import asyncio
-import aiohttp
 import json
 import logging
 import time
@@ -106,6 +105,9 @@ class AIAProcessingClient:
 
     async def __aenter__(self):
         """Async context manager entry"""
+        # Imported here so the request/result types load without the HTTP stack
+        import aiohttp
+
         self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=self.timeout))
         await self.initialize_connections()
         return self
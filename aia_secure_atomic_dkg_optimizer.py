@@ -20,11 +20,13 @@ import os
 import pickle
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple, Union
+from typing import Dict, List, Any, Optional, Set, Tuple, Union
 from dataclasses import dataclass, asdict
 import numpy as np
 import torch
 import concurrent.futures
+import heapq
+import re
 from collections import OrderedDict
 import threading
 import queue
@@ -46,6 +48,61 @@ from aia_zero_trust_agent_architecture import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+TOKEN_PATTERN = re.compile(r'\b\w+\b')
+
+def tokenize_content(content: str) -> List[str]:
+    """Tokenize content for search indexing"""
+    # Simple tokenization (can be enhanced with NLP)
+    tokens = TOKEN_PATTERN.findall(content.lower())
+    return [token for token in tokens if len(token) > 2]
+
+def classify_security_level(atom_data: Dict[str, Any]) -> str:
+    """Classify security level of knowledge atom"""
+    content = atom_data.get("content", "").lower()
+    metadata = atom_data.get("metadata", {})
+
+    # Security classification logic
+    if any(term in content for term in ["password", "secret", "private_key", "confidential"]):
+        return "secret"
+    elif any(term in content for term in ["api_key", "token", "credential", "enterprise"]):
+        return "confidential"
+    elif metadata.get("priority") == "high" or "thoughts_lately_4" in str(metadata):
+        return "confidential"
+    else:
+        return "public"
+
+def parse_checkpoint_shard(checkpoint_file: str) -> Dict[str, Any]:
+    """
+    Parse, classify and tokenise one checkpoint file into a compact shard.
+
+    Runs in ingestion worker processes; returns plain tuples so the merge
+    stage only has to build atoms and fold tokens into the indexes.
+    """
+    try:
+        with open(checkpoint_file, 'r') as f:
+            checkpoint_data = json.load(f)
+
+        shard_atoms = []
+        for atoms_processed, atom_data in enumerate(checkpoint_data.get("atoms", [])):
+            atom_id = atom_data.get("id", f"atom_{atoms_processed}")
+            content = atom_data.get("content", "")
+            metadata = atom_data.get("metadata", {})
+            integrity_hash = hashlib.sha256(f"{atom_id}{content}{metadata}".encode()).hexdigest()
+
+            shard_atoms.append((
+                atom_id,
+                content,
+                metadata,
+                classify_security_level(atom_data),
+                integrity_hash,
+                tuple(set(tokenize_content(content)))
+            ))
+
+        return {"file": checkpoint_file, "atoms": shard_atoms, "error": None}
+
+    except Exception as e:
+        return {"file": checkpoint_file, "atoms": [], "error": str(e)}
+
 @dataclass
 class KnowledgeAtom:
     """Secure knowledge atom with cryptographic protection"""
@@ -102,9 +159,16 @@ class SecureAtomicDKGCache:
     - L1: Hot cache (unencrypted, <1ms access)
     - L2: Warm cache (AES encrypted, <10ms access)
     - L3: Cold storage (quantum-resistant encrypted, <50ms access)
+
+    Every tier is an LRU bounded by a byte budget. Atoms decrypted from L2/L3
+    are kept for a short TTL per clearance level so repeated lookups skip the
+    decrypt + parse path; access authorization is still checked on every hit.
     """
 
-    def __init__(self, crypto_system: QuantumResistantCrypto, max_hot_size: int = 10000):
+    def __init__(self, crypto_system: QuantumResistantCrypto, max_hot_size: int = 10000,
+                 max_hot_bytes: int = 64 * 1024 * 1024, max_warm_bytes: int = 128 * 1024 * 1024,
+                 max_cold_bytes: int = 256 * 1024 * 1024, decrypted_ttl_seconds: float = 30.0,
+                 max_decrypted_entries: int = 5000):
         self.crypto = crypto_system
         self.max_hot_size = max_hot_size
 
@@ -117,12 +181,26 @@ class SecureAtomicDKGCache:
         # L3 Cold cache - quantum-resistant encrypted for secret atoms
         self.cold_cache: OrderedDict[str, Tuple[bytes, str]] = OrderedDict()  # (encrypted_data, key_id)
 
+        # Byte budgets and per-entry sizes for LRU eviction of every tier
+        self.tier_caches = {"l1": self.hot_cache, "l2": self.warm_cache, "l3": self.cold_cache}
+        self.tier_byte_budgets = {"l1": max_hot_bytes, "l2": max_warm_bytes, "l3": max_cold_bytes}
+        self.tier_bytes = {"l1": 0, "l2": 0, "l3": 0}
+        self.tier_entry_sizes: Dict[str, Dict[str, int]] = {"l1": {}, "l2": {}, "l3": {}}
+
+        # Short-lived decrypted atoms from L2/L3, keyed by (security_clearance, atom_id)
+        self.decrypted_ttl_seconds = decrypted_ttl_seconds
+        self.max_decrypted_entries = max_decrypted_entries
+        self.decrypted_cache: OrderedDict[Tuple[str, str], Tuple[KnowledgeAtom, float]] = OrderedDict()
+        self.decrypted_clearances: Dict[str, Set[str]] = {}  # atom_id -> clearances with a cached copy
+
         # Cache statistics
         self.cache_stats = {
             "l1_hits": 0,
             "l2_hits": 0,
             "l3_hits": 0,
+            "decrypted_cache_hits": 0,
             "cache_misses": 0,
+            "evictions": 0,
             "total_queries": 0,
             "avg_retrieval_time": 0.0
         }
@@ -148,9 +226,7 @@ class SecureAtomicDKGCache:
 
             if cache_tier == "l1" and encryption_type is None:
                 # Hot cache - no encryption for public atoms
-                self.hot_cache[atom.atom_id] = atom
-                if len(self.hot_cache) > self.max_hot_size:
-                    self.hot_cache.popitem(last=False)  # LRU eviction
+                self._store_in_tier("l1", atom.atom_id, atom, self._estimate_atom_size(atom))
 
             elif cache_tier == "l2" and encryption_type == "aes256":
                 # Warm cache - AES encryption
@@ -171,7 +247,8 @@ class SecureAtomicDKGCache:
                 }
 
                 serialized_cache_data = pickle.dumps(cache_data)
-                self.warm_cache[atom.atom_id] = (serialized_cache_data, "aes256_key")
+                self._store_in_tier("l2", atom.atom_id, (serialized_cache_data, "aes256_key"),
+                                    len(serialized_cache_data))
 
             elif cache_tier == "l3" and encryption_type == "quantum_resistant":
                 # Cold cache - quantum-resistant encryption
@@ -195,7 +272,8 @@ class SecureAtomicDKGCache:
                 }
 
                 serialized_cache_data = pickle.dumps(cache_data)
-                self.cold_cache[atom.atom_id] = (serialized_cache_data, private_key.key_id)
+                self._store_in_tier("l3", atom.atom_id, (serialized_cache_data, private_key.key_id),
+                                    len(serialized_cache_data))
 
             caching_time = (time.time() - start_time) * 1000
             logger.info(f"Atom {atom.atom_id} cached in {cache_tier} tier (time: {caching_time:.2f}ms)")
@@ -215,6 +293,7 @@ class SecureAtomicDKGCache:
             if atom_id in self.hot_cache:
                 atom = self.hot_cache[atom_id]
                 if self._verify_access_authorization(atom, agent_id, security_clearance):
+                    self.hot_cache.move_to_end(atom_id)
                     self.cache_stats["l1_hits"] += 1
                     retrieval_time = (time.time() - start_time) * 1000
                     atom.last_accessed = datetime.utcnow()
@@ -224,6 +303,18 @@ class SecureAtomicDKGCache:
 
             # Check L2 warm cache
             elif atom_id in self.warm_cache:
+                self.warm_cache.move_to_end(atom_id)
+                atom = self._get_decrypted(atom_id, security_clearance)
+                if atom is not None:
+                    if self._verify_access_authorization(atom, agent_id, security_clearance):
+                        self.cache_stats["l2_hits"] += 1
+                        self.cache_stats["decrypted_cache_hits"] += 1
+                        retrieval_time = (time.time() - start_time) * 1000
+                        atom.last_accessed = datetime.utcnow()
+                        atom.access_count += 1
+                        await self._log_access_event(atom_id, agent_id, "l2_decrypted_hit", retrieval_time)
+                        return atom
+
                 encrypted_data, key_id = self.warm_cache[atom_id]
                 cache_data = pickle.loads(encrypted_data)
 
@@ -239,6 +330,7 @@ class SecureAtomicDKGCache:
                 atom = KnowledgeAtom(**atom_dict)
 
                 if self._verify_access_authorization(atom, agent_id, security_clearance):
+                    self._put_decrypted(atom_id, security_clearance, atom)
                     self.cache_stats["l2_hits"] += 1
                     retrieval_time = (time.time() - start_time) * 1000
                     atom.last_accessed = datetime.utcnow()
@@ -248,6 +340,18 @@ class SecureAtomicDKGCache:
 
             # Check L3 cold cache
             elif atom_id in self.cold_cache:
+                self.cold_cache.move_to_end(atom_id)
+                atom = self._get_decrypted(atom_id, security_clearance)
+                if atom is not None:
+                    if self._verify_access_authorization(atom, agent_id, security_clearance):
+                        self.cache_stats["l3_hits"] += 1
+                        self.cache_stats["decrypted_cache_hits"] += 1
+                        retrieval_time = (time.time() - start_time) * 1000
+                        atom.last_accessed = datetime.utcnow()
+                        atom.access_count += 1
+                        await self._log_access_event(atom_id, agent_id, "l3_decrypted_hit", retrieval_time)
+                        return atom
+
                 encrypted_data, private_key_id = self.cold_cache[atom_id]
                 cache_data = pickle.loads(encrypted_data)
 
@@ -265,6 +369,7 @@ class SecureAtomicDKGCache:
                 atom = KnowledgeAtom(**atom_dict)
 
                 if self._verify_access_authorization(atom, agent_id, security_clearance):
+                    self._put_decrypted(atom_id, security_clearance, atom)
                     self.cache_stats["l3_hits"] += 1
                     retrieval_time = (time.time() - start_time) * 1000
                     atom.last_accessed = datetime.utcnow()
@@ -282,6 +387,76 @@ class SecureAtomicDKGCache:
             await self._log_access_event(atom_id, agent_id, "retrieval_error", (time.time() - start_time) * 1000)
             return None
 
+    def _estimate_atom_size(self, atom: KnowledgeAtom) -> int:
+        """Approximate in-memory footprint of an unencrypted atom in bytes"""
+        return len(atom.content.encode()) + len(str(atom.metadata)) + len(atom.atom_id) + 256
+
+    def _store_in_tier(self, tier: str, atom_id: str, value: Any, size_bytes: int):
+        """Insert an entry into a cache tier and evict LRU entries beyond its budgets"""
+        tier_cache = self.tier_caches[tier]
+        entry_sizes = self.tier_entry_sizes[tier]
+
+        if atom_id in tier_cache:
+            self.tier_bytes[tier] -= entry_sizes.get(atom_id, 0)
+        self._invalidate_decrypted(atom_id)
+
+        tier_cache[atom_id] = value
+        tier_cache.move_to_end(atom_id)
+        entry_sizes[atom_id] = size_bytes
+        self.tier_bytes[tier] += size_bytes
+
+        max_entries = self.max_hot_size if tier == "l1" else None
+        while len(tier_cache) > 1 and (
+            self.tier_bytes[tier] > self.tier_byte_budgets[tier]
+            or (max_entries is not None and len(tier_cache) > max_entries)
+        ):
+            evicted_id, _ = tier_cache.popitem(last=False)  # LRU eviction
+            self.tier_bytes[tier] -= entry_sizes.pop(evicted_id, 0)
+            self._invalidate_decrypted(evicted_id)
+            self.cache_stats["evictions"] += 1
+
+    def _get_decrypted(self, atom_id: str, security_clearance: str) -> Optional[KnowledgeAtom]:
+        """Return a recently decrypted atom for this clearance level if it has not expired"""
+        key = (security_clearance, atom_id)
+        entry = self.decrypted_cache.get(key)
+        if entry is None:
+            return None
+
+        atom, expires_at = entry
+        if time.monotonic() >= expires_at:
+            self._drop_decrypted(key)
+            return None
+
+        self.decrypted_cache.move_to_end(key)
+        return atom
+
+    def _put_decrypted(self, atom_id: str, security_clearance: str, atom: KnowledgeAtom):
+        """Remember an authorized decrypted atom for a short TTL"""
+        if self.decrypted_ttl_seconds <= 0 or self.max_decrypted_entries <= 0:
+            return
+
+        key = (security_clearance, atom_id)
+        self.decrypted_clearances.setdefault(atom_id, set()).add(security_clearance)
+        self.decrypted_cache[key] = (atom, time.monotonic() + self.decrypted_ttl_seconds)
+        self.decrypted_cache.move_to_end(key)
+        while len(self.decrypted_cache) > self.max_decrypted_entries:
+            self._drop_decrypted(next(iter(self.decrypted_cache)))
+
+    def _drop_decrypted(self, key: Tuple[str, str]):
+        """Remove one decrypted entry and its clearance index entry"""
+        security_clearance, atom_id = key
+        self.decrypted_cache.pop(key, None)
+        clearances = self.decrypted_clearances.get(atom_id)
+        if clearances is not None:
+            clearances.discard(security_clearance)
+            if not clearances:
+                del self.decrypted_clearances[atom_id]
+
+    def _invalidate_decrypted(self, atom_id: str):
+        """Drop decrypted copies of an atom across the clearance levels that cached it"""
+        for security_clearance in self.decrypted_clearances.pop(atom_id, ()):
+            self.decrypted_cache.pop((security_clearance, atom_id), None)
+
     def _verify_access_authorization(self, atom: KnowledgeAtom, agent_id: str, security_clearance: str) -> bool:
         """Verify agent has authorization to access atom"""
         security_hierarchy = {
@@ -323,8 +498,10 @@ class SecureAtomicDKGOrchestrator:
     Implements enterprise security with quantum-resistant encryption
     """
 
-    def __init__(self, dkg_path: str = "/Users/wXy/dev/Projects/aia/atom-DKG"):
+    def __init__(self, dkg_path: str = "/Users/wXy/dev/Projects/aia/atom-DKG",
+                 ingestion_workers: Optional[int] = None):
         self.dkg_path = Path(dkg_path)
+        self.ingestion_workers = ingestion_workers or os.cpu_count() or 1
         self.crypto = QuantumResistantCrypto()
         self.cache = SecureAtomicDKGCache(self.crypto)
         self.zero_trust_network = ZeroTrustAgentNetwork(self.crypto)
@@ -335,7 +512,8 @@ class SecureAtomicDKGOrchestrator:
 
         # Knowledge atom storage
         self.knowledge_atoms: Dict[str, KnowledgeAtom] = {}
-        self.search_index = {}  # Optimized search index
+        self.search_index = {}  # Optimized search index: level -> token -> set of atom ids
+        self.atom_tokens: Dict[str, frozenset] = {}  # Distinct tokens per atom, computed at index time
         self.checkpoint_files = []
 
         # Performance metrics
@@ -418,67 +596,57 @@ class SecureAtomicDKGOrchestrator:
         """Load and secure existing checkpoint files"""
         logger.info("Loading checkpoint files for security classification...")
 
-        checkpoint_pattern = self.dkg_path / "checkpoint_*_atoms.json"
-        self.checkpoint_files = list(self.dkg_path.glob("checkpoint_*_atoms.json"))
+        self.checkpoint_files = sorted(self.dkg_path.glob("checkpoint_*_atoms.json"))
 
         logger.info(f"Found {len(self.checkpoint_files)} checkpoint files")
 
-        # Process checkpoints in parallel
-        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
-            futures = []
-            for checkpoint_file in self.checkpoint_files[:10]:  # Process first 10 for demo
-                future = executor.submit(self._process_checkpoint_file, checkpoint_file)
-                futures.append(future)
+        if not self.checkpoint_files:
+            return
 
-            for future in concurrent.futures.as_completed(futures):
+        # Parse checkpoints in worker processes; shards are merged on the event loop thread
+        loop = asyncio.get_running_loop()
+        max_workers = min(self.ingestion_workers, len(self.checkpoint_files))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                loop.run_in_executor(executor, parse_checkpoint_shard, str(checkpoint_file))
+                for checkpoint_file in self.checkpoint_files
+            ]
+
+            for future in asyncio.as_completed(futures):
                 try:
-                    result = future.result()
+                    result = self._merge_checkpoint_shard(await future)
                     if result:
                         logger.info(f"Processed checkpoint: {result['atoms_processed']} atoms")
                 except Exception as e:
                     logger.error(f"Checkpoint processing failed: {e}")
 
-    def _process_checkpoint_file(self, checkpoint_file: Path) -> Dict[str, Any]:
-        """Process individual checkpoint file"""
-        try:
-            with open(checkpoint_file, 'r') as f:
-                checkpoint_data = json.load(f)
-
-            atoms_processed = 0
-            for atom_data in checkpoint_data.get("atoms", [])[:100]:  # Limit for demo
-                # Create secure knowledge atom
-                atom = KnowledgeAtom(
-                    atom_id=atom_data.get("id", f"atom_{atoms_processed}"),
-                    content=atom_data.get("content", ""),
-                    metadata=atom_data.get("metadata", {}),
-                    security_classification=self._classify_security_level(atom_data)
-                )
+    def _merge_checkpoint_shard(self, shard: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Fold a parsed checkpoint shard into the atom store and search index"""
+        if shard["error"]:
+            logger.error(f"Failed to process {shard['file']}: {shard['error']}")
+            return None
 
-                # Store in memory (in production, would be persisted securely)
-                self.knowledge_atoms[atom.atom_id] = atom
-                atoms_processed += 1
+        for atom_id, content, metadata, security_classification, integrity_hash, tokens in shard["atoms"]:
+            # Create secure knowledge atom
+            atom = KnowledgeAtom(
+                atom_id=atom_id,
+                content=content,
+                metadata=metadata,
+                security_classification=security_classification,
+                integrity_hash=integrity_hash
+            )
 
-            self.performance_metrics["total_atoms_loaded"] += atoms_processed
-            return {"atoms_processed": atoms_processed, "file": str(checkpoint_file)}
+            # Store in memory (in production, would be persisted securely)
+            self.knowledge_atoms[atom_id] = atom
+            self.atom_tokens[atom_id] = frozenset(tokens)
 
-        except Exception as e:
-            logger.error(f"Failed to process {checkpoint_file}: {e}")
-            return None
+        atoms_processed = len(shard["atoms"])
+        self.performance_metrics["total_atoms_loaded"] += atoms_processed
+        return {"atoms_processed": atoms_processed, "file": shard["file"]}
 
     def _classify_security_level(self, atom_data: Dict[str, Any]) -> str:
         """Classify security level of knowledge atom"""
-        content = atom_data.get("content", "").lower()
-        metadata = atom_data.get("metadata", {})
-
-        # Security classification logic
-        if any(term in content for term in ["password", "secret", "private_key", "confidential"]):
-            return "secret"
-        elif any(term in content for term in ["api_key", "token", "credential", "enterprise"]):
-            return "confidential"
-        elif metadata.get("priority") == "high" or "thoughts_lately_4" in str(metadata):
-            return "confidential"
-        else:
-            return "public"
+        return classify_security_level(atom_data)
 
     async def _build_secure_search_index(self):
         """Build optimized search index with security controls"""
@@ -491,27 +659,32 @@ class SecureAtomicDKGOrchestrator:
             "secret": {},
             "top_secret": {}
         }
+        # Reuse tokens computed during checkpoint ingestion
+        precomputed_tokens = self.atom_tokens
+        self.atom_tokens = {}
 
         # Build inverted index for fast text search
         for atom_id, atom in self.knowledge_atoms.items():
-            security_level = atom.security_classification
+            self._index_atom(atom, precomputed_tokens.get(atom_id))
 
-            # Tokenize content for search
-            tokens = self._tokenize_content(atom.content)
+        logger.info("Secure search index built successfully")
 
-            for token in tokens:
-                if token not in self.search_index[security_level]:
-                    self.search_index[security_level][token] = []
-                self.search_index[security_level][token].append(atom_id)
+    def _index_atom(self, atom: KnowledgeAtom, tokens: Optional[frozenset] = None):
+        """Add an atom's distinct tokens to the posting sets of its security level"""
+        if tokens is None:
+            tokens = frozenset(self._tokenize_content(atom.content))
 
-        logger.info("Secure search index built successfully")
+        self.atom_tokens[atom.atom_id] = tokens
+        level_index = self.search_index.setdefault(atom.security_classification, {})
+        for token in tokens:
+            postings = level_index.get(token)
+            if postings is None:
+                level_index[token] = postings = set()
+            postings.add(atom.atom_id)
 
     def _tokenize_content(self, content: str) -> List[str]:
         """Tokenize content for search indexing"""
-        # Simple tokenization (can be enhanced with NLP)
-        import re
-        tokens = re.findall(r'\b\w+\b', content.lower())
-        return [token for token in tokens if len(token) > 2]
+        return tokenize_content(content)
 
     async def secure_query(self, query: SecureKnowledgeQuery) -> QueryResult:
         """
@@ -594,29 +767,32 @@ class SecureAtomicDKGOrchestrator:
             )
 
     async def _search_atoms(self, query: SecureKnowledgeQuery) -> List[KnowledgeAtom]:
-        """Search for atoms matching the query"""
-        search_tokens = self._tokenize_content(query.query_text)
+        """Search for atoms matching the query, returning the top max_results by relevance"""
+        query_tokens = frozenset(self._tokenize_content(query.query_text))
 
         # Determine accessible security levels based on agent clearance
         accessible_levels = self._get_accessible_security_levels(query.required_security_level)
 
-        # Find matching atoms across accessible security levels
-        matching_atoms = []
+        # Count query-token overlap per candidate straight from the posting sets
+        overlap_counts: Dict[str, int] = {}
         for security_level in accessible_levels:
             level_index = self.search_index.get(security_level, {})
 
-            for token in search_tokens:
-                if token in level_index:
-                    for atom_id in level_index[token]:
-                        if atom_id in self.knowledge_atoms:
-                            atom = self.knowledge_atoms[atom_id]
-                            if atom not in matching_atoms:
-                                matching_atoms.append(atom)
-
-        # Sort by relevance (simplified scoring)
-        matching_atoms.sort(key=lambda atom: self._calculate_relevance_score(atom, query), reverse=True)
+            for token in query_tokens:
+                for atom_id in level_index.get(token, ()):
+                    overlap_counts[atom_id] = overlap_counts.get(atom_id, 0) + 1
+
+        # Score candidates from stored token counts and keep only the top-k
+        now = datetime.utcnow()
+        scored_candidates = (
+            (self._score_candidate(self.knowledge_atoms[atom_id], overlap, len(query_tokens),
+                                   len(self.atom_tokens[atom_id]), now), atom_id)
+            for atom_id, overlap in overlap_counts.items()
+            if atom_id in self.knowledge_atoms
+        )
+        top_candidates = heapq.nlargest(query.max_results, scored_candidates)
 
-        return matching_atoms
+        return [self.knowledge_atoms[atom_id] for _, atom_id in top_candidates]
 
     def _get_accessible_security_levels(self, clearance_level: str) -> List[str]:
         """Get security levels accessible to agent"""
@@ -629,16 +805,13 @@ class SecureAtomicDKGOrchestrator:
 
         return level_hierarchy.get(clearance_level, ["public"])
 
-    def _calculate_relevance_score(self, atom: KnowledgeAtom, query: SecureKnowledgeQuery) -> float:
-        """Calculate relevance score for atom"""
-        query_tokens = set(self._tokenize_content(query.query_text))
-        atom_tokens = set(self._tokenize_content(atom.content))
-
+    def _score_candidate(self, atom: KnowledgeAtom, intersection: int, query_token_count: int,
+                         atom_token_count: int, now: datetime) -> float:
+        """Score an atom from its precomputed query-token overlap and token count"""
         # Simple Jaccard similarity
-        intersection = len(query_tokens & atom_tokens)
-        union = len(query_tokens | atom_tokens)
+        union = query_token_count + atom_token_count - intersection
 
-        if union == 0:
+        if union <= 0:
             return 0.0
 
         base_score = intersection / union
@@ -649,7 +822,7 @@ class SecureAtomicDKGOrchestrator:
 
         # Boost for recent access
         if atom.last_accessed:
-            hours_since_access = (datetime.utcnow() - atom.last_accessed).total_seconds() / 3600
+            hours_since_access = (now - atom.last_accessed).total_seconds() / 3600
             recency_boost = max(0, 1.0 - (hours_since_access / 168))  # Decay over 1 week
             base_score += recency_boost * 0.2
 
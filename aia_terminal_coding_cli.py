@@ -15,7 +15,6 @@ Comprehensive terminal-accessible AI coding assistant with:
 """
 
 import asyncio
-import aiohttp
 import subprocess
 import os
 import sys
@@ -26,46 +25,52 @@ import glob
 import re
 import ast
 import argparse
+import hashlib
 import logging
+import pickle
+import stat
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple, Union
+from typing import Dict, Any, List, Optional, Tuple, Union, Set, Iterator
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor
 import threading
 import tempfile
 
-# Rich terminal interface
+# Rich terminal interface. numpy, aiohttp, prompt_toolkit and the heavier rich
+# renderables are imported where they're used so one-shot commands start fast.
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from rich.tree import Tree
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-from rich.syntax import Syntax
-from rich.markdown import Markdown
 from rich.prompt import Prompt, Confirm
 
-# Interactive terminal support
-try:
-    from prompt_toolkit import PromptSession
-    from prompt_toolkit.completion import WordCompleter
-    from prompt_toolkit.history import InMemoryHistory
-    INTERACTIVE_AVAILABLE = True
-except ImportError:
-    INTERACTIVE_AVAILABLE = False
-
 console = Console(force_terminal=True)
 
 class AIATerminalInterface:
     """Advanced terminal read/write operations"""
 
     def __init__(self):
-        self.session = PromptSession(history=InMemoryHistory()) if INTERACTIVE_AVAILABLE else None
+        self.session = None
+        self.interactive_available: Optional[bool] = None
         self.executor = ThreadPoolExecutor(max_workers=5)
 
+    def _prompt_session(self):
+        """Create the prompt_toolkit session on first interactive read"""
+        if self.interactive_available is None:
+            try:
+                from prompt_toolkit import PromptSession
+                from prompt_toolkit.history import InMemoryHistory
+                self.session = PromptSession(history=InMemoryHistory())
+                self.interactive_available = True
+            except ImportError:
+                self.interactive_available = False
+        return self.session
+
     async def read_terminal_input(self, prompt_text: str = "aia> ",
                                 auto_complete: List[str] = None) -> str:
         """Read input from terminal with auto-completion"""
-        if self.session and auto_complete:
+        if self._prompt_session() and auto_complete:
+            from prompt_toolkit.completion import WordCompleter
             completer = WordCompleter(auto_complete)
             try:
                 return await asyncio.get_event_loop().run_in_executor(
@@ -132,11 +137,317 @@ class AIATerminalInterface:
             console.print(f"❌ Command failed: {e}", style="red")
             return {"error": str(e), "command": command}
 
+@dataclass
+class IndexedFile:
+    """File table entry of the project index"""
+    file_id: int
+    size: int
+    mtime_ns: int
+    extension: str
+    content_indexed: bool
+
+class AIAProjectIndex:
+    """
+    Persistent file and trigram content index for one project root.
+
+    A single directory walk prunes excluded directories by name before
+    descending and only re-reads files whose size or mtime changed. Code files
+    are indexed as lowercase byte trigrams in a sorted posting array; a literal
+    content search intersects the postings of the query's trigrams and reads
+    only the candidate files. Files re-indexed since the last compaction live
+    in a small overlay that is merged (and the index saved) once it grows.
+    Files the CLI writes itself are re-indexed immediately via update_path,
+    so they are visible before the next (throttled) refresh.
+    """
+
+    # Never indexed; build output (dist, build, .next) is indexed and filtered per search
+    DEFAULT_EXCLUDES = frozenset({"node_modules", "__pycache__", ".git"})
+    CONTENT_EXTENSIONS = frozenset({
+        ".py", ".js", ".mjs", ".ts", ".jsx", ".tsx", ".json", ".md", ".yaml", ".yml",
+        ".rs", ".go", ".java", ".cpp", ".cc", ".cxx", ".c", ".h", ".hpp", ".css", ".html"
+    })
+    INDEX_VERSION = 1
+
+    def __init__(self, root: Union[str, Path], index_dir: Optional[Union[str, Path]] = None,
+                 refresh_interval: float = 5.0, max_content_bytes: int = 1_000_000,
+                 compact_threshold: int = 256):
+        self.root = Path(root).expanduser().resolve()
+        index_dir = Path(index_dir or os.environ.get("AIA_INDEX_DIR", Path.home() / ".aia" / "project_index"))
+        self.index_path = index_dir / f"{hashlib.sha1(str(self.root).encode()).hexdigest()[:16]}.pkl"
+        self.excludes = self.DEFAULT_EXCLUDES
+        self.refresh_interval = refresh_interval
+        self.max_content_bytes = max_content_bytes
+        self.compact_threshold = compact_threshold
+
+        import numpy as np
+
+        self.files: Dict[str, IndexedFile] = {}
+        self.paths: Dict[int, str] = {}
+        self.next_id = 0
+
+        # Trigram postings: keys[i] occurs in postings[offsets[i]:offsets[i + 1]]
+        self.trigram_keys = np.empty(0, dtype=np.uint32)
+        self.trigram_offsets = np.zeros(1, dtype=np.int64)
+        self.trigram_postings = np.empty(0, dtype=np.uint32)
+        self.overlay: Dict[int, np.ndarray] = {}
+        self.stale_ids: Set[int] = set()
+
+        self.last_refresh = 0.0
+        self.lock = threading.RLock()
+        self._load()
+
+    @staticmethod
+    def _trigrams(data: bytes) -> 'np.ndarray':
+        """Sorted unique lowercase byte trigrams packed into uint32"""
+        import numpy as np
+
+        buffer = np.frombuffer(data.lower(), dtype=np.uint8)
+        if len(buffer) < 3:
+            return np.empty(0, dtype=np.uint32)
+        packed = (buffer[:-2].astype(np.uint32) << 16) | (buffer[1:-1].astype(np.uint32) << 8) | buffer[2:]
+        return np.unique(packed)
+
+    def refresh(self, force: bool = False) -> Dict[str, int]:
+        """Bring the file table and content index up to date with the tree"""
+        with self.lock:
+            if not force and time.monotonic() - self.last_refresh < self.refresh_interval:
+                return {"changed": 0, "removed": 0}
+
+            seen = set()
+            changed = 0
+            stack = [str(self.root)]
+
+            while stack:
+                try:
+                    entries = os.scandir(stack.pop())
+                except OSError:
+                    continue
+
+                with entries:
+                    for entry in entries:
+                        if entry.name in self.excludes:
+                            continue
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                                continue
+                            if not entry.is_file(follow_symlinks=False):
+                                continue
+                            stat_info = entry.stat(follow_symlinks=False)
+                        except OSError:
+                            continue
+
+                        seen.add(entry.path)
+                        record = self.files.get(entry.path)
+                        if record and record.size == stat_info.st_size and record.mtime_ns == stat_info.st_mtime_ns:
+                            continue
+                        self._index_file(entry.path, stat_info.st_size, stat_info.st_mtime_ns, record)
+                        changed += 1
+
+            removed = self.files.keys() - seen
+            for path in removed:
+                self._remove_file(path)
+
+            self.last_refresh = time.monotonic()
+
+            if (changed or removed) and (len(self.overlay) >= self.compact_threshold or not self.index_path.exists()):
+                self.save()
+
+            return {"changed": changed, "removed": len(removed)}
+
+    def update_path(self, path: Union[str, Path]):
+        """Re-index (or drop) one file now, e.g. right after the CLI wrote it"""
+        path = os.path.abspath(path)
+        try:
+            relative_parts = Path(path).relative_to(self.root).parts
+        except ValueError:
+            return  # Outside this project
+        if self.excludes.intersection(relative_parts):
+            return
+
+        with self.lock:
+            try:
+                stat_info = os.stat(path, follow_symlinks=False)
+            except OSError:
+                stat_info = None
+            if stat_info is None or not stat.S_ISREG(stat_info.st_mode):
+                if path in self.files:
+                    self._remove_file(path)
+                return
+            self._index_file(path, stat_info.st_size, stat_info.st_mtime_ns, self.files.get(path))
+
+    def _remove_file(self, path: str):
+        record = self.files.pop(path)
+        self.paths.pop(record.file_id, None)
+        self.overlay.pop(record.file_id, None)
+        self.stale_ids.add(record.file_id)
+
+    def _index_file(self, path: str, size: int, mtime_ns: int, record: Optional[IndexedFile]):
+        if record:
+            file_id = record.file_id
+            self.stale_ids.add(file_id)  # Base postings describe the old content
+        else:
+            file_id = self.next_id
+            self.next_id += 1
+
+        extension = os.path.splitext(path)[1].lower()
+        content_indexed = False
+        if extension in self.CONTENT_EXTENSIONS and size <= self.max_content_bytes:
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+                if b"\0" not in data[:8192]:
+                    self.overlay[file_id] = self._trigrams(data)
+                    content_indexed = True
+            except OSError:
+                pass
+        if not content_indexed:
+            self.overlay.pop(file_id, None)
+
+        self.files[path] = IndexedFile(file_id, size, mtime_ns, extension, content_indexed)
+        self.paths[file_id] = path
+
+    def iter_files(self, extensions: Optional[Set[str]] = None,
+                   under: Optional[Path] = None) -> Iterator[Tuple[str, IndexedFile]]:
+        """Indexed files, optionally limited to extensions ('.py') and a subdirectory"""
+        prefix = None
+        if under is not None and Path(under) != self.root:
+            prefix = str(under).rstrip(os.sep) + os.sep
+        for path, record in self.files.items():
+            if extensions is not None and record.extension not in extensions:
+                continue
+            if prefix is not None and not path.startswith(prefix):
+                continue
+            yield path, record
+
+    def candidate_ids(self, literal: str) -> Optional[Set[int]]:
+        """
+        Ids of content-indexed files that may contain literal (case-insensitive).
+
+        None when the index can't narrow the search (fewer than three ASCII
+        characters); callers then read every file.
+        """
+        try:
+            needle = literal.encode("ascii")
+        except UnicodeEncodeError:
+            return None
+        if len(needle) < 3:
+            return None
+
+        import numpy as np
+
+        with self.lock:
+            query = self._trigrams(needle)
+            postings = []
+            for trigram in query:
+                position = np.searchsorted(self.trigram_keys, trigram)
+                if position == len(self.trigram_keys) or self.trigram_keys[position] != trigram:
+                    postings = [np.empty(0, dtype=np.uint32)]
+                    break
+                postings.append(self.trigram_postings[self.trigram_offsets[position]:self.trigram_offsets[position + 1]])
+
+            postings.sort(key=len)
+            matches = postings[0]
+            for ids in postings[1:]:
+                if not matches.size:
+                    break
+                matches = np.intersect1d(matches, ids, assume_unique=True)
+
+            candidates = set(matches.tolist()) - self.stale_ids
+            for file_id, trigrams in self.overlay.items():
+                if np.isin(query, trigrams, assume_unique=True).all():
+                    candidates.add(file_id)
+            return candidates
+
+    def compact(self):
+        """Merge the overlay into the posting arrays and drop postings of stale files"""
+        import numpy as np
+
+        with self.lock:
+            if not self.overlay and not self.stale_ids:
+                return
+
+            trigrams = np.repeat(self.trigram_keys, np.diff(self.trigram_offsets))
+            file_ids = self.trigram_postings
+            if self.stale_ids:
+                keep = ~np.isin(file_ids, np.fromiter(self.stale_ids, dtype=np.uint32))
+                trigrams, file_ids = trigrams[keep], file_ids[keep]
+
+            trigrams = np.concatenate([trigrams, *self.overlay.values()])
+            file_ids = np.concatenate([file_ids, *(
+                np.full(len(values), file_id, dtype=np.uint32) for file_id, values in self.overlay.items()
+            )])
+
+            order = np.lexsort((file_ids, trigrams))
+            trigrams, file_ids = trigrams[order], file_ids[order]
+            self.trigram_keys, starts = np.unique(trigrams, return_index=True)
+            self.trigram_offsets = np.append(starts, len(trigrams)).astype(np.int64)
+            self.trigram_postings = file_ids.astype(np.uint32)
+
+            self.overlay.clear()
+            self.stale_ids.clear()
+
+    def save(self):
+        """Compact and write the index atomically"""
+        with self.lock:
+            self.compact()
+            snapshot = {
+                "version": self.INDEX_VERSION,
+                "root": str(self.root),
+                "next_id": self.next_id,
+                "files": {path: tuple(vars(record).values()) for path, record in self.files.items()},
+                "trigram_keys": self.trigram_keys,
+                "trigram_offsets": self.trigram_offsets,
+                "trigram_postings": self.trigram_postings
+            }
+            try:
+                self.index_path.parent.mkdir(parents=True, exist_ok=True)
+                temp_path = self.index_path.with_suffix(f".{os.getpid()}.tmp")
+                with open(temp_path, "wb") as f:
+                    pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, self.index_path)
+            except OSError as e:
+                logging.getLogger(__name__).warning(f"Could not save project index: {e}")
+
+    def _load(self):
+        try:
+            with open(self.index_path, "rb") as f:
+                snapshot = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return
+        if snapshot.get("version") != self.INDEX_VERSION or snapshot.get("root") != str(self.root):
+            return
+
+        self.next_id = snapshot["next_id"]
+        self.files = {path: IndexedFile(*values) for path, values in snapshot["files"].items()}
+        self.paths = {record.file_id: path for path, record in self.files.items()}
+        self.trigram_keys = snapshot["trigram_keys"]
+        self.trigram_offsets = snapshot["trigram_offsets"]
+        self.trigram_postings = snapshot["trigram_postings"]
+
 class AIAFilesystemInterface:
     """Comprehensive filesystem operations"""
 
+    # Build output skipped by filename search unless the caller passes its own exclude_patterns
+    FILE_SEARCH_EXCLUDES = ("node_modules", "__pycache__", ".git", "dist", "build", ".next")
+
     def __init__(self):
-        pass
+        self.project_indexes: Dict[str, AIAProjectIndex] = {}
+
+    def get_project_index(self, directory: Union[str, Path]) -> AIAProjectIndex:
+        """Index covering directory, reusing one built for an enclosing root"""
+        path = Path(directory).expanduser().resolve()
+        for index in self.project_indexes.values():
+            if path == index.root or index.root in path.parents:
+                return index
+        index = self.project_indexes[str(path)] = AIAProjectIndex(path)
+        return index
+
+    def _update_indexes(self, *paths: Path):
+        """Reflect files written by the CLI in every loaded index that covers them"""
+        for index in self.project_indexes.values():
+            for path in paths:
+                index.update_path(path)
 
     async def read_file_with_metadata(self, file_path: str) -> Dict[str, Any]:
         """Read file with comprehensive metadata"""
@@ -206,6 +517,7 @@ class AIAFilesystemInterface:
             path = Path(file_path).expanduser().resolve()
 
             # Create backup if file exists
+            backup_path = None
             if create_backup and path.exists():
                 backup_path = path.with_suffix(f"{path.suffix}.aia-backup-{int(time.time())}")
                 shutil.copy2(path, backup_path)
@@ -215,6 +527,7 @@ class AIAFilesystemInterface:
 
             # Write content
             path.write_text(content, encoding='utf-8')
+            self._update_indexes(*([backup_path] if backup_path else []), path)
 
             # Verify write
             verification = await self.read_file_with_metadata(str(path))
@@ -233,10 +546,22 @@ class AIAFilesystemInterface:
     async def search_files_advanced(self, pattern: str, directory: str = ".",
                                    file_extensions: List[str] = None,
                                    exclude_patterns: List[str] = None) -> Dict[str, Any]:
-        """Advanced file search with pattern matching"""
+        """
+        Advanced file search with pattern matching
+
+        Served from the project index; directories in AIAProjectIndex.DEFAULT_EXCLUDES
+        are never indexed, exclude_patterns (default FILE_SEARCH_EXCLUDES) are
+        matched against path components.
+        """
         try:
+            start_time = time.perf_counter()
             search_path = Path(directory).expanduser().resolve()
-            exclude_patterns = exclude_patterns or ["node_modules", "__pycache__", ".git", "dist", "build", ".next"]
+            index = self.get_project_index(search_path)
+            index.refresh()
+
+            if exclude_patterns is None:
+                exclude_patterns = self.FILE_SEARCH_EXCLUDES
+            extra_excludes = set(exclude_patterns) - index.excludes
 
             results = []
             total_files_scanned = 0
@@ -244,27 +569,28 @@ class AIAFilesystemInterface:
             # Default file extensions for code
             if file_extensions is None:
                 file_extensions = ["py", "js", "ts", "jsx", "tsx", "json", "md", "yaml", "yml", "rs", "go", "java", "cpp", "c", "h"]
+            extensions = {f".{ext.lstrip('.').lower()}" for ext in file_extensions}
 
-            for ext in file_extensions:
-                for file_path in search_path.rglob(f"*.{ext}"):
-                    total_files_scanned += 1
-
-                    # Skip excluded directories
-                    if any(excluded in str(file_path) for excluded in exclude_patterns):
-                        continue
-
-                    # Check pattern match in filename
-                    if pattern.lower() in file_path.name.lower():
-                        stat_info = file_path.stat()
-                        results.append({
-                            "file_path": str(file_path),
-                            "name": file_path.name,
-                            "directory": str(file_path.parent),
-                            "extension": file_path.suffix,
-                            "size_bytes": stat_info.st_size,
-                            "modified": datetime.fromtimestamp(stat_info.st_mtime).isoformat(),
-                            "match_type": "filename"
-                        })
+            pattern_lower = pattern.lower()
+            for file_path, record in index.iter_files(extensions, under=search_path):
+                total_files_scanned += 1
+
+                # Skip excluded directories
+                if extra_excludes and extra_excludes.intersection(Path(file_path).relative_to(index.root).parts):
+                    continue
+
+                # Check pattern match in filename
+                name = os.path.basename(file_path)
+                if pattern_lower in name.lower():
+                    results.append({
+                        "file_path": file_path,
+                        "name": name,
+                        "directory": os.path.dirname(file_path),
+                        "extension": os.path.splitext(name)[1],
+                        "size_bytes": record.size,
+                        "modified": datetime.fromtimestamp(record.mtime_ns / 1e9).isoformat(),
+                        "match_type": "filename"
+                    })
 
             return {
                 "pattern": pattern,
@@ -272,7 +598,7 @@ class AIAFilesystemInterface:
                 "results": results,
                 "total_matches": len(results),
                 "files_scanned": total_files_scanned,
-                "search_time_ms": 0,  # Would measure actual time
+                "search_time_ms": round((time.perf_counter() - start_time) * 1000, 2),
                 "success": True
             }
 
@@ -282,53 +608,68 @@ class AIAFilesystemInterface:
     async def search_file_contents(self, search_term: str, directory: str = ".",
                                   file_extensions: List[str] = None,
                                   case_sensitive: bool = False,
-                                  regex_mode: bool = False) -> Dict[str, Any]:
-        """Search within file contents (ripgrep-like functionality)"""
+                                  regex_mode: bool = False,
+                                  exclude_patterns: List[str] = None) -> Dict[str, Any]:
+        """
+        Search within file contents (ripgrep-like functionality)
+
+        Only AIAProjectIndex.DEFAULT_EXCLUDES are skipped by default, so matches
+        under build/ or dist/ are found; exclude_patterns adds directory names
+        to skip.
+        """
         try:
+            start_time = time.perf_counter()
             search_path = Path(directory).expanduser().resolve()
             file_extensions = file_extensions or ["py", "js", "ts", "jsx", "tsx", "json", "md", "yaml"]
+            extensions = {f".{ext.lstrip('.').lower()}" for ext in file_extensions}
+
+            index = self.get_project_index(search_path)
+            index.refresh()
+            extra_excludes = set(exclude_patterns or []) - index.excludes
 
             results = []
             total_matches = 0
+            files_read = 0
 
             # Compile regex if needed
             if regex_mode:
                 flags = 0 if case_sensitive else re.IGNORECASE
                 pattern = re.compile(search_term, flags)
 
-            for ext in file_extensions:
-                for file_path in search_path.rglob(f"*.{ext}"):
-                    if any(excluded in str(file_path) for excluded in ["node_modules", "__pycache__", ".git"]):
-                        continue
-
-                    try:
-                        content = file_path.read_text(encoding='utf-8', errors='ignore')
-                        lines = content.splitlines()
-
-                        for line_num, line in enumerate(lines, 1):
-                            match_found = False
-
-                            if regex_mode:
-                                if pattern.search(line):
-                                    match_found = True
-                            else:
-                                search_line = line if case_sensitive else line.lower()
-                                search_target = search_term if case_sensitive else search_term.lower()
-                                if search_target in search_line:
-                                    match_found = True
-
-                            if match_found:
-                                results.append({
-                                    "file_path": str(file_path),
-                                    "line_number": line_num,
-                                    "line_content": line.strip(),
-                                    "context_before": lines[max(0, line_num-2):line_num-1],
-                                    "context_after": lines[line_num:min(len(lines), line_num+2)]
-                                })
-                                total_matches += 1
-
-                    except Exception:
-                        continue
+            # Trigram candidates narrow literal searches (and regexes without metacharacters)
+            literal = search_term if not regex_mode or re.escape(search_term) == search_term else None
+            candidates = index.candidate_ids(literal) if literal else None
+            search_target = search_term if case_sensitive else search_term.lower()
+
+            for file_path, record in index.iter_files(extensions, under=search_path):
+                if candidates is not None and record.content_indexed and record.file_id not in candidates:
+                    continue
+                if extra_excludes and extra_excludes.intersection(Path(file_path).relative_to(index.root).parts):
+                    continue
+
+                try:
+                    content = Path(file_path).read_text(encoding='utf-8', errors='ignore')
+                    files_read += 1
+                    lines = content.splitlines()
+
+                    for line_num, line in enumerate(lines, 1):
+                        if regex_mode:
+                            match_found = pattern.search(line) is not None
+                        else:
+                            match_found = search_target in (line if case_sensitive else line.lower())
+
+                        if match_found:
+                            results.append({
+                                "file_path": file_path,
+                                "line_number": line_num,
+                                "line_content": line.strip(),
+                                "context_before": lines[max(0, line_num-2):line_num-1],
+                                "context_after": lines[line_num:min(len(lines), line_num+2)]
+                            })
+                            total_matches += 1
+
+                except Exception:
+                    continue
 
             return {
                 "search_term": search_term,
@@ -338,18 +679,165 @@ class AIAFilesystemInterface:
                 "results": results,
                 "total_matches": total_matches,
                 "files_with_matches": len(set(r["file_path"] for r in results)),
+                "files_read": files_read,
+                "search_time_ms": round((time.perf_counter() - start_time) * 1000, 2),
                 "success": True
             }
 
         except Exception as e:
             return {"error": f"Content search failed: {str(e)}", "search_term": search_term}
 
+class AIACodebaseAnalyzer:
+    """
+    Single-pass codebase statistics over the project index.
+
+    Files come from the index walk and are classified by extension. Lines
+    are counted by streaming bytes (no decoding) on a thread pool, and
+    counts are cached per path by (size, mtime) so unchanged files are not
+    re-read on the next run.
+    """
+
+    LANGUAGE_EXTENSIONS = {
+        "Python": [".py"],
+        "JavaScript": [".js", ".mjs"],
+        "TypeScript": [".ts"],
+        "React": [".jsx", ".tsx"],
+        "JSON": [".json"],
+        "Markdown": [".md"],
+        "YAML": [".yaml", ".yml"],
+        "CSS": [".css"],
+        "HTML": [".html"],
+        "Rust": [".rs"],
+        "Go": [".go"],
+        "Java": [".java"],
+        "C++": [".cpp", ".cc", ".cxx"],
+        "C": [".c"],
+        "Header": [".h", ".hpp"]
+    }
+    LARGE_FILE_BYTES = 100000
+
+    def __init__(self, index: AIAProjectIndex, max_workers: Optional[int] = None, chunk_size: int = 1 << 20):
+        self.index = index
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 4) * 4)
+        self.chunk_size = chunk_size
+        self.extension_languages = {
+            extension: language
+            for language, extensions in self.LANGUAGE_EXTENSIONS.items()
+            for extension in extensions
+        }
+        self.cache_path = index.index_path.with_suffix(".lines.pkl")
+        self.line_cache: Dict[str, Tuple[int, int, int]] = self._load_cache()
+
+    def count_lines(self, path: str) -> int:
+        """Newline count, plus one for a final unterminated line (as str.splitlines counts newline-terminated text)"""
+        lines = 0
+        last = b""
+        with open(path, "rb") as f:
+            while True:
+                chunk = f.read(self.chunk_size)
+                if not chunk:
+                    break
+                lines += chunk.count(b"\n")
+                last = chunk[-1:]
+        return lines + (1 if last and last != b"\n" else 0)
+
+    def _count_or_none(self, path: str) -> Optional[int]:
+        try:
+            return self.count_lines(path)
+        except OSError:
+            return None
+
+    def analyze(self, directory: Union[str, Path]) -> Dict[str, Any]:
+        start_time = time.perf_counter()
+        directory = Path(directory).expanduser().resolve()
+
+        self.index.refresh(force=True)
+        walk_seconds = time.perf_counter() - start_time
+
+        files = [
+            (path, record, self.extension_languages[record.extension])
+            for path, record in self.index.iter_files(set(self.extension_languages), under=directory)
+        ]
+
+        counts: Dict[str, Optional[int]] = {}
+        to_count = []
+        for path, record, _ in files:
+            cached = self.line_cache.get(path)
+            if cached and cached[0] == record.size and cached[1] == record.mtime_ns:
+                counts[path] = cached[2]
+            else:
+                to_count.append(path)
+        cache_hits = len(counts)
+
+        count_start = time.perf_counter()
+        if to_count:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                counts.update(zip(to_count, pool.map(self._count_or_none, to_count)))
+        count_seconds = time.perf_counter() - count_start
+
+        languages: Dict[str, Dict[str, Any]] = {}
+        large_files = []
+        for path, record, language in files:
+            lines = counts.get(path)
+            if lines is None:
+                continue
+            self.line_cache[path] = (record.size, record.mtime_ns, lines)
+
+            stats = languages.setdefault(language, {"file_count": 0, "total_lines": 0})
+            stats["file_count"] += 1
+            stats["total_lines"] += lines
+
+            if record.size > self.LARGE_FILE_BYTES:
+                large_files.append({
+                    "file": path,
+                    "size_kb": round(record.size / 1024, 2),
+                    "lines": lines
+                })
+
+        for stats in languages.values():
+            stats["avg_lines_per_file"] = round(stats["total_lines"] / stats["file_count"], 1)
+
+        if to_count:
+            self._save_cache()
+
+        return {
+            "languages": languages,
+            "large_files": large_files,
+            "timing": {
+                "walk_ms": round(walk_seconds * 1000, 1),
+                "line_count_ms": round(count_seconds * 1000, 1),
+                "total_ms": round((time.perf_counter() - start_time) * 1000, 1),
+                "files_counted": len(to_count),
+                "cache_hits": cache_hits
+            }
+        }
+
+    def _load_cache(self) -> Dict[str, Tuple[int, int, int]]:
+        try:
+            with open(self.cache_path, "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return {}
+
+    def _save_cache(self):
+        # Drop entries for files that are no longer in the tree
+        self.line_cache = {path: value for path, value in self.line_cache.items() if path in self.index.files}
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(temp_path, "wb") as f:
+                pickle.dump(self.line_cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            logging.getLogger(__name__).warning(f"Could not save line count cache: {e}")
+
 class AIACodeTools:
     """Comprehensive code analysis and manipulation tools"""
 
     def __init__(self, filesystem: AIAFilesystemInterface, terminal: AIATerminalInterface):
         self.filesystem = filesystem
         self.terminal = terminal
+        self.analyzers: Dict[str, AIACodebaseAnalyzer] = {}
 
     async def analyze_codebase(self, directory: str = ".") -> Dict[str, Any]:
         """Comprehensive codebase analysis"""
@@ -365,59 +853,16 @@ class AIACodeTools:
             "potential_issues": []
         }
 
-        # Language file patterns
-        language_patterns = {
-            "Python": ["*.py"],
-            "JavaScript": ["*.js", "*.mjs"],
-            "TypeScript": ["*.ts"],
-            "React": ["*.jsx", "*.tsx"],
-            "JSON": ["*.json"],
-            "Markdown": ["*.md"],
-            "YAML": ["*.yaml", "*.yml"],
-            "CSS": ["*.css"],
-            "HTML": ["*.html"],
-            "Rust": ["*.rs"],
-            "Go": ["*.go"],
-            "Java": ["*.java"],
-            "C++": ["*.cpp", "*.cc", "*.cxx"],
-            "C": ["*.c"],
-            "Header": ["*.h", "*.hpp"]
-        }
+        index = self.filesystem.get_project_index(path)
+        analyzer = self.analyzers.get(str(index.root))
+        if analyzer is None:
+            analyzer = self.analyzers[str(index.root)] = AIACodebaseAnalyzer(index)
 
-        for language, patterns in language_patterns.items():
-            file_count = 0
-            total_lines = 0
-
-            for pattern in patterns:
-                files = list(path.rglob(pattern))
-                file_count += len(files)
-
-                for file_path in files:
-                    if any(excluded in str(file_path) for excluded in ["node_modules", "__pycache__", ".git"]):
-                        continue
-
-                    try:
-                        content = file_path.read_text(encoding='utf-8', errors='ignore')
-                        lines = len(content.splitlines())
-                        total_lines += lines
-
-                        # Check for large files
-                        if file_path.stat().st_size > 100000:  # > 100KB
-                            analysis["large_files"].append({
-                                "file": str(file_path),
-                                "size_kb": round(file_path.stat().st_size / 1024, 2),
-                                "lines": lines
-                            })
-
-                    except Exception:
-                        continue
-
-            if file_count > 0:
-                analysis["languages"][language] = {
-                    "file_count": file_count,
-                    "total_lines": total_lines,
-                    "avg_lines_per_file": round(total_lines / file_count, 1) if file_count > 0 else 0
-                }
+        # Walking and line counting are blocking; keep the event loop responsive
+        stats = await asyncio.get_running_loop().run_in_executor(self.terminal.executor, analyzer.analyze, path)
+        analysis["languages"] = stats["languages"]
+        analysis["large_files"] = stats["large_files"]
+        analysis["timing"] = stats["timing"]
 
         # Framework detection
         if (path / "package.json").exists():
@@ -476,6 +921,8 @@ class AIACodeTools:
         }
 
         try:
+            import aiohttp
+
             async with aiohttp.ClientSession() as session:
                 async with session.post("http://localhost:8020/aia/process", json=request_data) as response:
                     result = await response.json()
@@ -663,6 +1110,8 @@ class AIACompleteCLI:
 
         # Test backend connection
         try:
+            import aiohttp
+
             async with aiohttp.ClientSession() as session:
                 async with session.get(f"{self.backend_url}/health") as response:
                     if response.status == 200:
@@ -672,6 +1121,8 @@ class AIACompleteCLI:
             console.print("⚠️ Backend unavailable - tools-only mode", style="yellow")
 
         # Display tool capabilities
+        from rich.tree import Tree
+
         tools_tree = Tree("🛠️ Available Tools")
 
         terminal_branch = tools_tree.add("💻 Terminal Operations")
@@ -751,6 +1202,8 @@ class AIACompleteCLI:
                 ))
 
                 # Show syntax highlighted preview
+                from rich.syntax import Syntax
+
                 syntax = Syntax(result["content"][:1000], result['metadata']['language'], line_numbers=True)
                 console.print(syntax)
             else:
@@ -812,6 +1265,9 @@ class AIACompleteCLI:
                 )
 
             console.print(analysis_table)
+            timing = result["timing"]
+            console.print(f"⏱️ {timing['total_ms']:.0f} ms ({timing['files_counted']} files counted, "
+                          f"{timing['cache_hits']} from cache)", style="dim")
 
         elif command == "test":
             await self.testing.run_comprehensive_tests()
@@ -852,6 +1308,8 @@ class AIACompleteCLI:
 - Multi-agent coordination for complex tasks
 - Enterprise integration capabilities
         """
+        from rich.markdown import Markdown
+
         console.print(Markdown(help_content))
 
 async def main():
@@ -868,9 +1326,11 @@ async def main():
     args = parser.parse_args()
 
     cli = AIACompleteCLI()
-    await cli.initialize()
 
+    # Only interactive sessions pay for the backend probe and tool overview;
+    # one-shot commands go straight to the subsystem they need
     if args.interactive or not args.command:
+        await cli.initialize()
         await cli.run_interactive_mode()
     else:
         await cli.process_command([args.command] + args.args)
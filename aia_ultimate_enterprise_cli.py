@@ -11,7 +11,6 @@ Complete CLI enhancement with optimal cross-connecting architecture:
 """
 
 import asyncio
-import aiohttp
 import json
 import time
 import logging
@@ -21,16 +20,11 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
+# aiohttp and the progress/layout/tree renderables are imported where they're
+# used; `aia help` and `aia status` shouldn't pay for the full stack
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-from rich.live import Live
-from rich.layout import Layout
-from rich.columns import Columns
-from rich.tree import Tree
-from rich.text import Text
-from rich.markdown import Markdown
 
 # Initialize Rich console
 console = Console(force_terminal=True, width=120)
@@ -54,48 +48,56 @@ class AIAServiceDiscovery:
             {"name": "AIA Ultimate Enterprise", "url": "http://localhost:8030", "type": "ultimate"},
         ]
 
+        import aiohttp
+
+        if self.session:
+            await self.session.close()
         self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5))
-        discovered = {}
 
-        for service in services_to_check:
-            try:
-                async with self.session.get(f"{service['url']}/health") as response:
-                    if response.status == 200:
-                        health_data = await response.json()
-                        discovered[service["name"]] = {
-                            "url": service["url"],
-                            "status": "healthy",
-                            "type": service.get("type", "backend"),
-                            "health": health_data,
-                            "primary": service.get("primary", False)
-                        }
-                    else:
-                        discovered[service["name"]] = {
-                            "url": service["url"],
-                            "status": f"unhealthy ({response.status})",
-                            "type": service.get("type", "backend")
-                        }
-            except Exception as e:
-                # Try root endpoint for frontend services
-                if service.get("type") == "frontend":
-                    try:
-                        async with self.session.get(service["url"]) as response:
-                            if response.status == 200:
-                                discovered[service["name"]] = {
-                                    "url": service["url"],
-                                    "status": "healthy (frontend)",
-                                    "type": "frontend"
-                                }
-                            else:
-                                discovered[service["name"]] = {"url": service["url"], "status": "unreachable"}
-                    except:
-                        discovered[service["name"]] = {"url": service["url"], "status": "unreachable"}
-                else:
-                    discovered[service["name"]] = {"url": service["url"], "status": "unreachable"}
+        # Probe every service concurrently so discovery costs one timeout, not six
+        results = await asyncio.gather(*(self._check_service(service) for service in services_to_check))
+        discovered = {service["name"]: result for service, result in zip(services_to_check, results)}
 
         self.discovered_services = discovered
         return discovered
 
+    async def _check_service(self, service: Dict[str, Any]) -> Dict[str, Any]:
+        """Health-check one service"""
+        try:
+            async with self.session.get(f"{service['url']}/health") as response:
+                if response.status == 200:
+                    health_data = await response.json()
+                    return {
+                        "url": service["url"],
+                        "status": "healthy",
+                        "type": service.get("type", "backend"),
+                        "health": health_data,
+                        "primary": service.get("primary", False)
+                    }
+                else:
+                    return {
+                        "url": service["url"],
+                        "status": f"unhealthy ({response.status})",
+                        "type": service.get("type", "backend")
+                    }
+        except Exception as e:
+            # Try root endpoint for frontend services
+            if service.get("type") == "frontend":
+                try:
+                    async with self.session.get(service["url"]) as response:
+                        if response.status == 200:
+                            return {
+                                "url": service["url"],
+                                "status": "healthy (frontend)",
+                                "type": "frontend"
+                            }
+                        else:
+                            return {"url": service["url"], "status": "unreachable"}
+                except:
+                    return {"url": service["url"], "status": "unreachable"}
+            else:
+                return {"url": service["url"], "status": "unreachable"}
+
     async def close(self):
         if self.session:
             await self.session.close()
@@ -130,6 +132,8 @@ class AIAEnterpriseCommands:
             "atomic_dkg_context": True
         }
 
+        import aiohttp
+
         async with aiohttp.ClientSession() as session:
             try:
                 async with session.post(f"{self.primary_backend}/aia/process", json=deployment_request) as response:
@@ -161,6 +165,8 @@ class AIAEnterpriseCommands:
             "atomic_dkg_context": True
         }
 
+        import aiohttp
+
         async with aiohttp.ClientSession() as session:
             try:
                 async with session.post(f"{self.primary_backend}/aia/process", json=coordination_request) as response:
@@ -194,6 +200,9 @@ class AIAEnterpriseCommands:
             "max_atoms": max_atoms
         }
 
+        import aiohttp
+        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -245,6 +254,8 @@ class AIAEnterpriseCommands:
             "atomic_dkg_context": True
         }
 
+        import aiohttp
+
         async with aiohttp.ClientSession() as session:
             try:
                 async with session.post(f"{self.primary_backend}/aia/process", json=partnerships_request) as response:
@@ -277,6 +288,8 @@ class AIAEnterpriseCommands:
             "atomic_dkg_context": True
         }
 
+        import aiohttp
+
         async with aiohttp.ClientSession() as session:
             try:
                 async with session.post(f"{self.primary_backend}/aia/process", json=security_request) as response:
@@ -297,6 +310,10 @@ class AIAEnterpriseCommands:
 class AIAUltimateCLI:
     """Ultimate AIA CLI with full complexity integration"""
 
+    # Commands that go through the primary backend and need service discovery
+    # first; status runs its own discovery and help is purely local
+    BACKEND_COMMANDS = {"enterprise", "agents", "dkg", "partnerships", "quantum"}
+
     def __init__(self):
         self.discovery = AIAServiceDiscovery()
         self.commands = None
@@ -307,6 +324,8 @@ class AIAUltimateCLI:
         console.print("🎯 [bold]AIA Ultimate Enterprise CLI - Initializing[/bold]", style="blue")
 
         # Discover all services
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -351,7 +370,7 @@ class AIAUltimateCLI:
 
     async def run_command(self, command: str, args: List[str] = None) -> None:
         """Execute enterprise CLI commands"""
-        if not self.initialized:
+        if command in self.BACKEND_COMMANDS and not self.initialized:
             console.print("❌ CLI not initialized", style="red")
             return
 
@@ -410,6 +429,8 @@ class AIAUltimateCLI:
         await self.discovery.discover_all_services()
 
         # Create comprehensive status layout
+        from rich.layout import Layout
+
         layout = Layout()
         layout.split_column(
             Layout(self.create_services_panel(), name="services"),
@@ -457,6 +478,8 @@ class AIAUltimateCLI:
 
     async def show_help(self) -> None:
         """Display comprehensive CLI help"""
+        from rich.tree import Tree
+
         help_tree = Tree("🎯 AIA Ultimate Enterprise CLI Commands")
 
         enterprise_branch = help_tree.add("🏢 Enterprise Operations")
@@ -506,7 +529,8 @@ Examples:
     cli = AIAUltimateCLI()
 
     try:
-        await cli.initialize()
+        if args.command in cli.BACKEND_COMMANDS:
+            await cli.initialize()
         await cli.run_command(args.command, args.args)
     except KeyboardInterrupt:
         console.print("\n👋 AIA Ultimate CLI session ended", style="blue")